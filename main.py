@@ -183,6 +183,11 @@ async def main():
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
         return 1
+    finally:
+        # Shut down the pooled browser if any submission started one (module is imported lazily)
+        computer_use = sys.modules.get("src.browser.computer_use")
+        if computer_use:
+            await computer_use.BROWSER_POOL.close_all()
 
 
 if __name__ == "__main__":
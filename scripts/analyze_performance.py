@@ -19,7 +19,8 @@ def parse_timestamp(ts_str):
             return None
 
 def analyze_logs(log_dir):
-    files = glob.glob(os.path.join(log_dir, "*.json"))
+    # Run logs are JSON Lines (*.jsonl); older runs wrote a single JSON document (*.json)
+    files = glob.glob(os.path.join(log_dir, "*.jsonl")) + glob.glob(os.path.join(log_dir, "*.json"))
     
     # Sort files by modification time (newest first)
     files.sort(key=os.path.getmtime, reverse=True)
@@ -63,7 +64,10 @@ def analyze_logs(log_dir):
                 if not content.strip():
                     stats[platform]["errors"]["Empty Log File"] += 1
                     continue
-                data = json.loads(content)
+                if file_path.endswith(".jsonl"):
+                    data = [json.loads(line) for line in content.splitlines() if line.strip()]
+                else:
+                    data = json.loads(content)
             
             actions = []
             if isinstance(data, list):
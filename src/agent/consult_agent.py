@@ -8,7 +8,8 @@ import asyncio
 import json
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 from dotenv import load_dotenv
 
 from loguru import logger
@@ -1016,6 +1017,11 @@ def _get_platform_auth_type(platform_name: str) -> str:
     return "google_oauth" if platform_name.lower() in google_oauth_platforms else "credentials"
 
 
+def _save_action_log(log_file: Path, actions: List[Dict[str, Any]]) -> None:
+    """Write an action log as JSON Lines: one compact entry per line, in a single write."""
+    log_file.write_text("".join(json.dumps(entry, default=str) + "\n" for entry in actions))
+
+
 @handle_tool_errors
 @tool(
     "submit_platform_application",
@@ -1085,7 +1091,17 @@ async def submit_platform_application(args: Dict[str, Any]) -> Dict[str, Any]:
                 except json.JSONDecodeError:
                     profile_context = {"summary": profile_context}
             
-            browser = BrowserAutomation(platform_name, ctx.correlation_id)
+            platform_config = None
+            platform = ctx.platform_registry.get_platform(platform_name) if ctx.platform_registry else None
+            if platform and hasattr(platform, 'get_platform_config'):
+                platform_config = platform.get_platform_config()
+
+            browser = BrowserAutomation(
+                correlation_id=ctx.correlation_id,
+                platform=platform_name,
+                project_url=project_url,
+                platform_config=platform_config
+            )
             processed_count, actions = await browser.process_dashboard_invitations(
                 dashboard_url=project_url,
                 login_username=login_username or "",
@@ -1098,10 +1114,8 @@ async def submit_platform_application(args: Dict[str, Any]) -> Dict[str, Any]:
             logs_dir.mkdir(parents=True, exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             status = "success" if processed_count > 0 else "failure"
-            log_file = logs_dir / f"{platform_name}_{timestamp}_batch_{status}.json"
-            
-            with open(log_file, "w") as f:
-                json.dump(actions, f, indent=2, default=str)
+            log_file = logs_dir / f"{platform_name}_{timestamp}_batch_{status}.jsonl"
+            _save_action_log(log_file, actions)
             logger.info(f"[Correlation ID: {ctx.correlation_id}] Saved batch action log to {log_file}")
             
             return {
@@ -1168,9 +1182,8 @@ async def submit_platform_application(args: Dict[str, Any]) -> Dict[str, Any]:
         logs_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         status = "success" if result["success"] else "failure"
-        log_file = logs_dir / f"{platform_name}_{timestamp}_{status}.json"
-        with open(log_file, "w") as f:
-            json.dump(result["actions"], f, indent=2)
+        log_file = logs_dir / f"{platform_name}_{timestamp}_{status}.jsonl"
+        _save_action_log(log_file, result["actions"])
         
         logger.info(f"[Correlation ID: {ctx.correlation_id}] Saved action log to {log_file}")
 
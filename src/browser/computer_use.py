@@ -16,15 +16,24 @@ code, imports, or references should be added here.
 
 import os
 import re
+import json
+import sys
 import base64
+import random
 import asyncio
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple, Callable, cast
-from io import BytesIO
-from urllib.parse import urlparse, parse_qs
+import itertools
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from pathlib import Path
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, Any, Awaitable, Deque, List, Optional, Tuple, Union, Callable, cast
+from urllib.parse import urlparse, urljoin, unquote_plus
 from loguru import logger
+from tenacity import AsyncRetrying, retry_if_result, stop_after_attempt, wait_exponential_jitter
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from anthropic.types.beta import (
     BetaCacheControlEphemeralParam,
     BetaContentBlockParam,
@@ -39,11 +48,12 @@ from anthropic.types.beta import (
 
 # Gemini Computer Use API
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 from google.genai.types import Content, Part
 
 # Browser automation
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, CDPSession
 
 # Browser utilities
 from src.browser.cookie_detection import auto_accept_cookies, detect_cookie_banner
@@ -87,7 +97,7 @@ def validate_browser_credentials(
 # =============================================================================
 
 # Generic success indicators for form submission
-SUCCESS_INDICATORS = [
+SUCCESS_INDICATORS = (
     # Completion messages
     "application submitted",
     "successfully submitted",
@@ -104,10 +114,10 @@ SUCCESS_INDICATORS = [
     # Confirmation messages
     "we have received your",
     "your application is complete",
-]
+)
 
 # Generic failure indicators
-FAILURE_INDICATORS = [
+FAILURE_INDICATORS = (
     "unable to submit",
     "submission failed",
     "error occurred",
@@ -117,10 +127,10 @@ FAILURE_INDICATORS = [
     "validation error",
     "required field",
     "invalid input",
-]
+)
 
 # Generic blocked state indicators
-BLOCKED_INDICATORS = [
+BLOCKED_INDICATORS = (
     "already declined",
     "no longer available",
     "opportunity expired",
@@ -131,21 +141,482 @@ BLOCKED_INDICATORS = [
     "deadline passed",
     "position filled",
     "opportunity unavailable",
-]
-
-# Workflow stage patterns for multi-step forms
-WORKFLOW_STAGES = {
-    "application_form": ["application", "apply", "express interest", "fill out"],
-    "scheduling": ["availability", "schedule", "calendar", "select time", "book a time"],
-    "confirmation": ["confirm", "review", "summary", "final step"],
-    "completion": ["complete", "done", "finished", "all set", "thank you"],
+)
+
+# Workflow stage patterns for multi-step forms (read-only; checked in this order)
+WORKFLOW_STAGES = MappingProxyType({
+    "application_form": ("application", "apply", "express interest", "fill out"),
+    "scheduling": ("availability", "schedule", "calendar", "select time", "book a time"),
+    "confirmation": ("confirm", "review", "summary", "final step"),
+    "completion": ("complete", "done", "finished", "all set", "thank you"),
+})
+
+# (original, lowercased) pairs for the generic lists above, built once at import
+# so the check_* helpers only lowercase the page text per call. Substring checks
+# on the lowered text beat a combined regex here (C-level str.__contains__ vs.
+# re.IGNORECASE alternation, ~0.5ms vs ~17ms on 100KB of page text).
+_SUCCESS_INDICATORS_LOWER = tuple((i, i.lower()) for i in SUCCESS_INDICATORS)
+_FAILURE_INDICATORS_LOWER = tuple((i, i.lower()) for i in FAILURE_INDICATORS)
+_BLOCKED_INDICATORS_LOWER = tuple((i, i.lower()) for i in BLOCKED_INDICATORS)
+_WORKFLOW_STAGES_LOWER = tuple(
+    (stage, tuple(k.lower() for k in keywords)) for stage, keywords in WORKFLOW_STAGES.items()
+)
+
+# Query parameters holding a project ID, in priority order, and a pattern that
+# picks out just those from a query string (non-empty values, like parse_qs)
+PROJECT_ID_QUERY_PARAMS = ('cpid', 'project_id', 'projectId', 'id', 'pid')
+PROJECT_ID_QUERY_RE = re.compile(r'(?:^|&)(' + '|'.join(PROJECT_ID_QUERY_PARAMS) + r')=([^&]+)')
+
+# URL path patterns for extract_project_id_from_url, in priority order (kept
+# separate rather than one alternation so e.g. /projects/ beats an earlier /p/)
+PROJECT_ID_PATH_PATTERNS = (
+    re.compile(r'/projects?/(\d+)'),    # /project/123 or /projects/123
+    re.compile(r'/p/(\d+)'),            # /p/123
+    re.compile(r'/accept/(\d+)'),       # /accept/123
+    re.compile(r'/opportunity/(\d+)'),  # /opportunity/123
+)
+
+# Distinct page texts whose detection results each BrowserAutomation keeps
+DETECTION_CACHE_SIZE = 64
+
+# Body text for the detection checks, re-read only when the DOM has changed.
+# A MutationObserver installed on first use bumps a per-document version; the
+# random token changes on navigation. Called with the caller's last
+# fingerprint and returns {fingerprint, text} (text is null when unchanged).
+PAGE_TEXT_JS = """
+(lastFingerprint) => {
+    if (!window.__consult_dom_watch) {
+        const watch = {token: Math.random().toString(36).slice(2), version: 0};
+        new MutationObserver(() => { watch.version++; }).observe(document, {
+            subtree: true, childList: true, characterData: true, attributes: true
+        });
+        window.__consult_dom_watch = watch;
+    }
+    const fingerprint = window.__consult_dom_watch.token + ':' + window.__consult_dom_watch.version;
+    if (fingerprint === lastFingerprint) return {fingerprint, text: null};
+    return {fingerprint, text: document.body ? document.body.innerText : ''};
 }
+"""
+
+# Dashboard invitation count patterns, e.g. "Invitations (13)" (first match wins)
+INVITATION_COUNT_PATTERNS = (
+    r'Invitations?\s*\((\d+)\)',
+    r'(\d+)\s*Invitations?',
+    r'Projects?\s*\((\d+)\)',
+    r'(\d+)\s*pending',
+    r'Requests?\s*\((\d+)\)',
+    r'(\d+)\s*Requests?',
+    r'Open\s*\((\d+)\)',
+)
+
+# Button text that marks an actionable dashboard item (lowercase)
+ACTIONABLE_BUTTON_KEYWORDS = ("complete", "vetting", "start", "respond", "apply")
+
+# Matches the count patterns (case-insensitive, in order) against the rendered
+# text in the page, falling back to counting actionable buttons; only the
+# numbers cross CDP. Called with {patterns, keywords}.
+INVITATION_COUNT_JS = """
+({patterns, keywords}) => {
+    const text = document.body ? document.body.innerText : '';
+    for (let i = 0; i < patterns.length; i++) {
+        const match = text.match(new RegExp(patterns[i], 'i'));
+        if (match) return {pattern: i, count: parseInt(match[1], 10), actionable: 0};
+    }
+    let actionable = 0;
+    for (const el of document.querySelectorAll('button, a.btn, [role="button"]')) {
+        const label = (el.innerText || '').toLowerCase();
+        if (keywords.some(kw => label.includes(kw))) actionable++;
+    }
+    return {pattern: null, count: null, actionable};
+}
+"""
+
+# Gemini key names (lowercased) -> Playwright key names for key_combination
+GEMINI_KEY_NAMES = {
+    "control": "Control",
+    "ctrl": "Control",
+    "shift": "Shift",
+    "alt": "Alt",
+    "meta": "Meta",
+    "command": "Meta",
+    "cmd": "Meta",
+    "enter": "Enter",
+    "return": "Enter",
+    "escape": "Escape",
+    "esc": "Escape",
+    "backspace": "Backspace",
+    "delete": "Delete",
+    "del": "Delete",
+    "tab": "Tab",
+    "space": "Space",
+    "insert": "Insert",
+    "home": "Home",
+    "end": "End",
+    "pageup": "PageUp",
+    "pagedown": "PageDown",
+    "arrowup": "ArrowUp",
+    "arrowdown": "ArrowDown",
+    "arrowleft": "ArrowLeft",
+    "arrowright": "ArrowRight",
+    "up": "ArrowUp",
+    "down": "ArrowDown",
+    "left": "ArrowLeft",
+    "right": "ArrowRight",
+    "f1": "F1", "f2": "F2", "f3": "F3", "f4": "F4", "f5": "F5",
+    "f6": "F6", "f7": "F7", "f8": "F8", "f9": "F9", "f10": "F10",
+    "f11": "F11", "f12": "F12"
+}
+
+# Claude actions that cannot change page content (completion checks are skipped after them)
+CLAUDE_READ_ONLY_ACTIONS = frozenset({"screenshot", "mouse_move", "zoom", "cursor_position"})
+
+# JPEG quality for screenshots sent to Claude and Gemini (several times smaller than PNG)
+SCREENSHOT_JPEG_QUALITY = 70
+
+# Settle wait after an input action: resolves once the page has painted two
+# frames (handlers for the input have run and layout caught up), or after the
+# timeout in ms if frames are not being produced. Replaces fixed sleeps.
+SETTLE_JS = """
+(timeout) => new Promise(resolve => {
+    const timer = setTimeout(resolve, timeout);
+    requestAnimationFrame(() => requestAnimationFrame(() => {
+        clearTimeout(timer);
+        resolve();
+    }));
+})
+"""
+
+# Upper bound (ms) for SETTLE_JS - the fixed pause it replaces
+SETTLE_TIMEOUT_MS = 500
+
+# Model ID for Computer Use - per https://ai.google.dev/gemini-api/docs/computer-use
+GEMINI_COMPUTER_USE_MODEL = "gemini-2.5-computer-use-preview-10-2025"
+
+# Request config shared by every Gemini Computer Use call (browser environment, thoughts on)
+GEMINI_COMPUTER_USE_CONFIG = types.GenerateContentConfig(
+    tools=[types.Tool(
+        computer_use=types.ComputerUse(
+            environment=types.Environment.ENVIRONMENT_BROWSER,
+        )
+    )],
+    thinking_config=types.ThinkingConfig(include_thoughts=True),
+)
+
+# Task prompt prefix with verification and UI guidance for gemini_computer_use
+GEMINI_TASK_PREFIX = """IMPORTANT INSTRUCTIONS FOR FORM FILLING:
+
+1.  After each action, verify the outcome from the new screenshot.
+2.  If an action failed, try an alternative approach.
+3.  For dropdowns (<select> elements), first `click_at` to open it, then `type_text_at` with the exact option text you want to select.
+4.  For checkboxes and radio buttons, `click_at` the center of the element.
+5.  Use keyboard shortcuts (`key_combination`) for reliability, like 'Enter' to submit forms.
+
+**CRITICAL - Yes/No Questions:**
+- Before clicking Yes or No, READ THE BUTTON TEXT carefully from the screenshot
+- Yes buttons are typically on the LEFT side, No/Decline buttons on the RIGHT
+- VERIFY the button coordinates hit the CORRECT button - clicking wrong can decline the project irreversibly
+- If unsure which button is which, take a screenshot first and examine button positions
+- For compliance questions asking if you can participate, you almost always want "Yes"
+
+TASK:
+"""
+
+# Gemini retries (fallback attempts and empty responses within a run): exponential
+# backoff (seconds) with jitter so parallel submissions do not retry in lockstep
+GEMINI_RETRY_BASE_DELAY = 0.5
+GEMINI_RETRY_MAX_DELAY = 8.0
+GEMINI_RETRY_JITTER = 0.25
+
+# Gemini API status codes that no retry can fix (bad request, credentials, model access)
+GEMINI_FATAL_STATUS_CODES = frozenset({400, 401, 403, 404})
+
+# In-flight Claude/Gemini requests across every automation in the process, so
+# parallel submissions and batch workers queue here instead of drawing 429s
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+LLM_SEMAPHORE = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+# Agent loops re-check for a blocked project at iteration start every this many
+# iterations, or sooner when the page URL changed since the last check
+BLOCKED_CHECK_INTERVAL = 3
+
+# Shared batch conversations are reset beyond this many messages (context-window pressure)
+CLAUDE_CONVERSATION_MAX_MESSAGES = 60
+
+# URL fragments that identify login pages
+LOGIN_PAGE_URL_MARKERS = ("/login", "/signin", "/auth", "login.php", "signin.php")
+
+# Saved batch sessions older than this are not restored
+AUTH_STATE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Persistent Chrome profile for platforms with uses_browser_profile (created by
+# scripts/setup_browser_profile.py, which resolves it against the same cwd)
+BROWSER_PROFILE_DIR = os.path.join(os.getcwd(), "profiles", "default")
+
+# Dashboard JSON responses: list container keys and per-item detail link fields
+INVITATION_FEED_LIST_KEYS = ("invitations", "items", "results", "data")
+INVITATION_FEED_URL_FIELDS = ("detail_url", "url", "href", "link")
+
+# Dashboard invitation card selectors, in priority order
+INVITATION_CARD_SELECTORS = (
+    '.invitation-card',
+    '.project-card',
+    '[class*="invitation"]',
+    '[class*="project-item"]',
+    'tr[class*="request"]',
+    'div[class*="request-card"]',
+)
+
+# Match counts for a list of CSS selectors, evaluated in a single call
+COUNT_SELECTORS_JS = """
+(selectors) => selectors.map(s => {
+    try { return document.querySelectorAll(s).length; } catch (e) { return 0; }
+})
+"""
+
+# Keywords that indicate good/poor fit for dashboard invitations (lowercase)
+FIT_GOOD_KEYWORDS = (
+    "ai", "artificial intelligence", "machine learning", "ml",
+    "llm", "large language model", "generative", "gpt", "claude",
+    "cloud", "gcp", "aws", "azure", "kubernetes", "docker",
+    "enterprise", "software", "architecture", "microservices",
+    "application modernization", "digital transformation",
+    "python", "java", "api", "saas", "platform",
+    "data center", "infrastructure", "devops",
+    "google", "amazon", "microsoft", "anthropic", "openai",
+    "tpu", "asic", "chip", "semiconductor", "security", "broadcom",
+)
+
+FIT_POOR_KEYWORDS = (
+    "medical device", "pharmaceutical manufacturing", "clinical trial",
+    "supply chain logistics", "retail operations",
+    "financial trading", "derivatives", "hedge fund",
+    "real estate appraisal", "property management",
+    "oil and gas drilling", "mining operations",
+    "food processing", "agriculture",
+)
+
+# Invitation details for _extract_invitation_details: title plus the main
+# content text, truncated in the page so long listings never cross CDP whole.
+# Called with the character limit.
+INVITATION_DETAILS_JS = """
+(limit) => {
+    const main = document.querySelector('main, .content, .project-details, article');
+    return {title: document.title, content: main ? (main.innerText || '').slice(0, limit) : ''};
+}
+"""
+
+# Characters of invitation content kept for fit evaluation
+INVITATION_CONTENT_LIMIT = 2000
+
+# Resource types the dashboard batch flow never needs. Images, stylesheets and
+# fonts stay: screenshots must show buttons, and icon fonts render controls.
+BATCH_BLOCKED_RESOURCE_TYPES = frozenset({"media", "ping", "cspviolationreport"})
+
+# Text longer than this (or multi-line) is free-form input, never an option label,
+# so _smart_select_option skips the <select> probe for it
+SMART_SELECT_MAX_TEXT = 80
+
+# Smart dropdown selection for _smart_select_option, called with {x, y, text}.
+# Walks up from the element at (x, y) to a <select>; returns null if there is
+# none, else {selected} with the chosen option text (null when nothing matched).
+# Prioritized matching on option text or value: exact > startsWith > contains.
+SELECT_OPTION_JS = """
+({x, y, text}) => {
+    let elem = document.elementFromPoint(x, y);
+    while (elem && elem.tagName !== 'SELECT') {
+        elem = elem.parentElement;
+    }
+    if (!elem) return null;
+
+    const searchText = text.toLowerCase();
+    let bestMatch = null;
+    let matchQuality = 0; // 1=contains, 2=startsWith, 3=exact
+    for (const option of elem.options) {
+        const optionText = option.text.toLowerCase();
+        const optionValue = option.value.toLowerCase();
+        if (optionText === searchText || optionValue === searchText) {
+            bestMatch = option;
+            matchQuality = 3;
+            break;
+        }
+        if (matchQuality < 2 && (optionText.startsWith(searchText) || optionValue.startsWith(searchText))) {
+            bestMatch = option;
+            matchQuality = 2;
+        }
+        if (matchQuality < 1 && (optionText.includes(searchText) || optionValue.includes(searchText))) {
+            bestMatch = option;
+            matchQuality = 1;
+        }
+    }
+
+    if (!bestMatch) return {selected: null};
+    bestMatch.selected = true;
+    elem.dispatchEvent(new Event('change', {bubbles: true}));
+    return {selected: bestMatch.text};
+}
+"""
+
+# Element-at-point scripts, called with {x, y} so each source string is
+# constant and the page can reuse its compiled form across calls.
+
+# JS click fallback for _js_click_fallback: native click() plus a bubbling
+# MouseEvent for React/Vue apps; returns {success, tagName, text}
+JS_CLICK_AT_JS = """
+({x, y}) => {
+    const elem = document.elementFromPoint(x, y);
+    if (!elem) return {success: false};
+    elem.click();
+    elem.dispatchEvent(new MouseEvent('click', {bubbles: true, cancelable: true, view: window}));
+    return {
+        success: true,
+        tagName: elem.tagName,
+        text: elem.textContent?.trim()?.substring(0, 50) || ''
+    };
+}
+"""
+
+# Element summary for _validate_element_at; null when nothing is at (x, y)
+ELEMENT_INFO_JS = """
+({x, y}) => {
+    const elem = document.elementFromPoint(x, y);
+    if (!elem) return null;
+    const rect = elem.getBoundingClientRect();
+    return {
+        tagName: elem.tagName,
+        text: elem.textContent?.trim()?.substring(0, 100) || '',
+        id: elem.id || null,
+        className: elem.className || '',
+        type: elem.type || null,
+        isButton: elem.tagName === 'BUTTON' || elem.type === 'button' || elem.type === 'submit',
+        isClickable: elem.onclick !== null || elem.tagName === 'BUTTON' || elem.tagName === 'A' || elem.role === 'button',
+        boundingBox: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+    };
+}
+"""
+
+# Candidate selectors for precision_click, most reliable first: id,
+# data-testid, button/link text, then role + aria-label
+ELEMENT_SELECTORS_JS = """
+({x, y}) => {
+    const elem = document.elementFromPoint(x, y);
+    if (!elem) return null;
+    const rect = elem.getBoundingClientRect();
+    const selectors = [];
+    if (elem.id) {
+        selectors.push('#' + elem.id);
+    }
+    if (elem.dataset && elem.dataset.testid) {
+        selectors.push('[data-testid="' + elem.dataset.testid + '"]');
+    }
+    if ((elem.tagName === 'BUTTON' || elem.tagName === 'A') && elem.textContent) {
+        const text = elem.textContent.trim();
+        if (text.length > 0 && text.length < 50) {
+            selectors.push(`${elem.tagName.toLowerCase()}:has-text("${text}")`);
+        }
+    }
+    if (elem.getAttribute('role')) {
+        const role = elem.getAttribute('role');
+        const ariaLabel = elem.getAttribute('aria-label') || elem.textContent?.trim();
+        if (ariaLabel && ariaLabel.length < 50) {
+            selectors.push(`[role="${role}"][aria-label*="${ariaLabel}"]`);
+        }
+    }
+    return {
+        tagName: elem.tagName,
+        text: elem.textContent?.trim()?.substring(0, 100) || '',
+        selectors: selectors,
+        boundingBox: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+        isClickable: elem.tagName === 'BUTTON' || elem.tagName === 'A' ||
+                     elem.type === 'button' || elem.type === 'submit' ||
+                     elem.onclick !== null || elem.getAttribute('role') === 'button'
+    };
+}
+"""
+
+# Post-click state for verify_click_success; {elementGone: true} when the
+# element at (x, y) has disappeared
+CLICK_TARGET_STATE_JS = """
+({x, y}) => {
+    const elem = document.elementFromPoint(x, y);
+    if (!elem) return {elementGone: true};
+    const rect = elem.getBoundingClientRect();
+    return {
+        tagName: elem.tagName,
+        text: elem.textContent?.trim()?.substring(0, 100) || '',
+        boundingBox: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+        visible: rect.width > 0 && rect.height > 0
+    };
+}
+"""
+
+# Final page state for _capture_page_state in one round-trip: localStorage
+# (empty if the origin denies access) and the #success-message visibility/text
+PAGE_STATE_JS = """
+() => {
+    const localStorageItems = {};
+    try {
+        for (let i = 0; i < localStorage.length; i++) {
+            const key = localStorage.key(i);
+            localStorageItems[key] = localStorage.getItem(key);
+        }
+    } catch (e) {}
+    const successMsg = document.getElementById('success-message');
+    let visible = false;
+    if (successMsg) {
+        const style = window.getComputedStyle(successMsg);
+        visible = style.display !== 'none' && style.visibility !== 'hidden';
+    }
+    return {
+        localStorage: localStorageItems,
+        successMessageVisible: visible,
+        successMessageText: successMsg ? (successMsg.textContent || '').trim() : null,
+    };
+}
+"""
+
+# Focus helpers installed into every page by start_browser() so action
+# handlers call a predefined function instead of shipping the source each time
+FOCUS_HELPERS_JS = """
+window.__consult_focus_pos = () => {
+    const elem = document.activeElement;
+    if (elem) {
+        const rect = elem.getBoundingClientRect();
+        return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
+    }
+    return null;
+};
+window.__consult_focus_info = () => {
+    const el = document.activeElement;
+    if (!el || el === document.body) return "No specific element focused";
+
+    const tag = el.tagName;
+    const type = el.type || '';
+    const text = (el.innerText || el.value || el.placeholder || '').substring(0, 50).replace(/\\n/g, ' ');
+    const label = el.labels && el.labels[0] ? el.labels[0].innerText : '';
+    const ariaLabel = el.getAttribute('aria-label') || '';
+
+    return `Focused: <${tag} type="${type}"> Text: "${text}" Label: "${label}" Aria: "${ariaLabel}"`;
+};
+"""
+
+# Fallback patterns for the per-iteration completion scan in the agent loops
+# (checked after any platform_config indicators; stored lowercase)
+COMPLETION_SUCCESS_PATTERNS = (
+    "thanks, you're all set", "application received", "successfully submitted",
+    "submission confirmed", "you're all set", "thank you for applying",
+)
+
+COMPLETION_BLOCKED_PATTERNS = (
+    "already declined", "already applied", "project expired",
+    "no longer available", "invitation has expired",
+)
 
 
 # =============================================================================
 # CORE HELPER FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=1024)
 def extract_project_id_from_url(url: str) -> Optional[str]:
     """
     Extract project ID from a URL using common patterns.
@@ -171,24 +642,20 @@ def extract_project_id_from_url(url: str) -> Optional[str]:
     
     try:
         parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
-        
-        # Check common query parameter names
-        param_names = ['cpid', 'project_id', 'projectId', 'id', 'pid']
-        for param in param_names:
-            if param in query_params:
-                return query_params[param][0]
+
+        # Check common query parameter names (most project URLs have no query string)
+        if parsed.query:
+            # First value of each known parameter, without parsing unrelated ones
+            query_params = {}
+            for name, value in PROJECT_ID_QUERY_RE.findall(parsed.query):
+                query_params.setdefault(name, value)
+            for param in PROJECT_ID_QUERY_PARAMS:
+                if param in query_params:
+                    return unquote_plus(query_params[param])
         
         # Check URL path patterns
-        path_patterns = [
-            r'/projects?/(\d+)',  # /project/123 or /projects/123
-            r'/p/(\d+)',          # /p/123
-            r'/accept/(\d+)',     # /accept/123
-            r'/opportunity/(\d+)', # /opportunity/123
-        ]
-        
-        for pattern in path_patterns:
-            match = re.search(pattern, parsed.path)
+        for pattern in PROJECT_ID_PATH_PATTERNS:
+            match = pattern.search(parsed.path)
             if match:
                 return match.group(1)
                 
@@ -198,6 +665,43 @@ def extract_project_id_from_url(url: str) -> Optional[str]:
     return None
 
 
+def _indicator_pairs(
+    additional_indicators: Optional[List[str]],
+    generic_indicators: Tuple[Tuple[str, str], ...]
+) -> Tuple[Tuple[str, str], ...]:
+    """(original, lowered) indicators to check in order: platform ones first, then the generic ones"""
+    return tuple((i, i.lower()) for i in additional_indicators or ()) + generic_indicators
+
+
+def _stage_keywords(
+    additional_stages: Optional[Dict[str, List[str]]]
+) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """(stage, lowered keywords) to check in order: platform stages first, then the generic ones"""
+    platform_stages = tuple(
+        (stage, tuple(k.lower() for k in keywords)) for stage, keywords in (additional_stages or {}).items()
+    )
+    return platform_stages + _WORKFLOW_STAGES_LOWER
+
+
+def _first_indicator(page_text_lower: str, indicators: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+    """First (original, lowered) indicator whose lowered form is in the lowered page text"""
+    for indicator, indicator_lower in indicators:
+        if indicator_lower in page_text_lower:
+            return indicator
+
+    return None
+
+
+def _first_workflow_stage(page_text_lower: str, stages: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Optional[str]:
+    """First stage with a (lowered) keyword in the lowered page text"""
+    for stage_name, keywords in stages:
+        for keyword in keywords:
+            if keyword in page_text_lower:
+                return stage_name
+
+    return None
+
+
 def detect_workflow_stage(
     page_text: str,
     additional_stages: Optional[Dict[str, List[str]]] = None
@@ -212,22 +716,7 @@ def detect_workflow_stage(
     Returns:
         Workflow stage name if detected, None otherwise
     """
-    page_text_lower = page_text.lower()
-    
-    # Check platform-specific stages first
-    if additional_stages:
-        for stage_name, keywords in additional_stages.items():
-            for keyword in keywords:
-                if keyword.lower() in page_text_lower:
-                    return stage_name
-    
-    # Check generic stages
-    for stage_name, keywords in WORKFLOW_STAGES.items():
-        for keyword in keywords:
-            if keyword.lower() in page_text_lower:
-                return stage_name
-    
-    return None
+    return _first_workflow_stage(page_text.lower(), _stage_keywords(additional_stages))
 
 
 def check_success_indicators(
@@ -244,20 +733,7 @@ def check_success_indicators(
     Returns:
         The matched success indicator if found, None otherwise
     """
-    page_text_lower = page_text.lower()
-    
-    # Check platform-specific indicators first
-    if additional_indicators:
-        for indicator in additional_indicators:
-            if indicator.lower() in page_text_lower:
-                return indicator
-    
-    # Check generic indicators
-    for indicator in SUCCESS_INDICATORS:
-        if indicator.lower() in page_text_lower:
-            return indicator
-    
-    return None
+    return _first_indicator(page_text.lower(), _indicator_pairs(additional_indicators, _SUCCESS_INDICATORS_LOWER))
 
 
 def check_failure_indicators(
@@ -274,20 +750,7 @@ def check_failure_indicators(
     Returns:
         The matched failure indicator if found, None otherwise
     """
-    page_text_lower = page_text.lower()
-    
-    # Check platform-specific indicators first
-    if additional_indicators:
-        for indicator in additional_indicators:
-            if indicator.lower() in page_text_lower:
-                return indicator
-    
-    # Check generic indicators
-    for indicator in FAILURE_INDICATORS:
-        if indicator.lower() in page_text_lower:
-            return indicator
-    
-    return None
+    return _first_indicator(page_text.lower(), _indicator_pairs(additional_indicators, _FAILURE_INDICATORS_LOWER))
 
 
 def check_blocked_indicators(
@@ -304,20 +767,21 @@ def check_blocked_indicators(
     Returns:
         The matched blocked indicator if found, None otherwise
     """
-    page_text_lower = page_text.lower()
-    
-    # Check platform-specific indicators first
-    if additional_indicators:
-        for indicator in additional_indicators:
-            if indicator.lower() in page_text_lower:
-                return indicator
-    
-    # Check generic indicators
-    for indicator in BLOCKED_INDICATORS:
-        if indicator.lower() in page_text_lower:
-            return indicator
-    
-    return None
+    return _first_indicator(page_text.lower(), _indicator_pairs(additional_indicators, _BLOCKED_INDICATORS_LOWER))
+
+
+# Action types whose "text" _sanitize_action_log checks for passwords
+_SANITIZE_TEXT_ACTIONS = frozenset({"type", "type_text_at", "select_option"})
+
+# _sanitize_action_log heuristics: password-like typed text (6-50 chars, no spaces,
+# letters plus digits/symbols) is redacted unless it is a URL or email address.
+# One match classifies the text; alternatives are tried in order, so the
+# exclusions win over the password branch.
+_SANITIZE_TEXT_RE = re.compile(
+    r'(?P<url>^https?://)'
+    r'|(?P<email>^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$)'
+    r'|(?P<password>^(?=.*[a-zA-Z])(?=.*[\d!@#$%^&*()_+\-=\[\]{}|;:\'",.<>?/`~])[^\s]{6,50}$)'
+)
 
 
 def _sanitize_action_log(action_log: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -332,32 +796,20 @@ def _sanitize_action_log(action_log: List[Dict[str, Any]]) -> List[Dict[str, Any
         action_log: List of action log entries
         
     Returns:
-        Sanitized action log with sensitive text redacted
+        New list of entries; redacted entries are copies, the rest are shared
+        with the live log
     """
-    import re
-    
-    # Pattern for password-like strings: 6-50 chars, no spaces, has letters and numbers/symbols
-    password_pattern = re.compile(r'^(?=.*[a-zA-Z])(?=.*[\d!@#$%^&*()_+\-=\[\]{}|;:\'",.<>?/`~])[^\s]{6,50}$')
-    
-    # Patterns to exclude from redaction (emails, URLs)
-    email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    url_pattern = re.compile(r'^https?://')
-    
     sanitized = []
     for entry in action_log:
-        entry_copy = entry.copy()
-        
-        # Check text fields in type actions
-        if entry.get("action") in ("type", "type_text_at", "select_option"):
+        # Check text fields in type actions; only redacted entries are copied
+        if entry.get("action") in _SANITIZE_TEXT_ACTIONS:
             text = entry.get("text", "")
             if text:
-                # Skip emails and URLs
-                if email_pattern.match(text) or url_pattern.match(text):
-                    pass  # Don't redact
-                elif password_pattern.match(text):
-                    entry_copy["text"] = "***REDACTED***"
+                match = _SANITIZE_TEXT_RE.match(text)
+                if match and match.lastgroup == "password":
+                    entry = {**entry, "text": "***REDACTED***"}
         
-        sanitized.append(entry_copy)
+        sanitized.append(entry)
     
     return sanitized
 
@@ -451,6 +903,76 @@ async def smart_element_click(
     return False
 
 
+class FatalSubmissionError(Exception):
+    """An engine failure that retrying cannot fix (e.g. rejected API key or request)"""
+
+
+class BrowserPool:
+    """
+    Shared Playwright driver and Chromium process (one per headless mode).
+
+    Every BrowserAutomation run opens its own BrowserContext on the pooled
+    browser, so closing a run - or switching from Claude to the Gemini
+    fallback - only closes that context instead of relaunching Chromium.
+    """
+
+    def __init__(self):
+        self._playwright = None
+        self._browsers: Dict[bool, Browser] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire_browser(self, headless: bool) -> Browser:
+        """Return the running browser for this headless mode, launching it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Playwright objects belong to the event loop that created them
+            self._playwright = None
+            self._browsers = {}
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            browser = self._browsers.get(headless)
+            if browser is None or not browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                browser = await self._playwright.chromium.launch(headless=headless)
+                self._browsers[headless] = browser
+                logger.info(f"Launched pooled {'headless' if headless else 'headed'} browser")
+            return browser
+
+    async def close_all(self):
+        """Close pooled browsers and stop the Playwright driver"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        try:
+            for browser in self._browsers.values():
+                await browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception as e:
+            logger.debug(f"Error closing browser pool: {e}")
+        finally:
+            self._browsers = {}
+            self._playwright = None
+
+
+BROWSER_POOL = BrowserPool()
+
+
+@lru_cache(maxsize=None)
+def _anthropic_client(api_key: str) -> AsyncAnthropic:
+    """Process-wide Claude client per API key, so every automation shares one connection pool"""
+    return AsyncAnthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def _gemini_client(api_key: str) -> genai.Client:
+    """Process-wide Gemini client per API key, so every automation shares one connection pool"""
+    return genai.Client(api_key=api_key)
+
+
 class BrowserAutomation:
     """Browser automation using AI computer-use capabilities.
     
@@ -464,7 +986,8 @@ class BrowserAutomation:
         correlation_id: str = "N/A",
         platform: str = "unknown",
         project_url: str = "N/A",
-        platform_config: Optional[Dict[str, Any]] = None
+        platform_config: Optional[Dict[str, Any]] = None,
+        user_data_dir: Optional[str] = None
     ):
         """Initialize browser automation with Gemini and Claude.
         
@@ -478,7 +1001,9 @@ class BrowserAutomation:
                 - blocked_indicators: List[str] - platform-specific blocked patterns
                 - workflow_stages: Dict[str, List[str]] - platform-specific workflow stages
                 - dialog_handler: Callable[[Page], Awaitable[Dict]] - async function to dismiss platform dialogs
+                - form_handler: Callable[[Page, Dict], Awaitable[bool]] - deterministic invitation form filler tried before Claude
                 - cookie_selectors: List[str] - platform-specific cookie button selectors
+            user_data_dir: Chrome profile directory the agent runs launch with (None = fresh context)
         """
         self.correlation_id = correlation_id
         self.platform = platform
@@ -488,7 +1013,7 @@ class BrowserAutomation:
         # Configure Gemini with new genai client
         gemini_api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
         if gemini_api_key:
-            self.gemini_client = genai.Client(api_key=gemini_api_key)
+            self.gemini_client = _gemini_client(gemini_api_key)
             logger.info(f"[{self.correlation_id}] Gemini AI configured")
         else:
             self.gemini_client = None
@@ -497,7 +1022,7 @@ class BrowserAutomation:
         # Configure Claude
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         if self.anthropic_api_key:
-            self.anthropic = Anthropic(api_key=self.anthropic_api_key)
+            self.anthropic = _anthropic_client(self.anthropic_api_key)
             logger.info(f"[{self.correlation_id}] Claude AI configured")
         else:
             self.anthropic = None
@@ -506,14 +1031,37 @@ class BrowserAutomation:
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.action_log: List[Dict[str, Any]] = []
+        self._action_log_flushed = 0  # Entries already handed out by flush_new_actions()
+        # (platform_config, success_patterns, blocked_patterns) - lowercased once per config
+        self._completion_patterns_cache: Optional[Tuple[Any, Tuple[str, ...], Tuple[str, ...]]] = None
         self.last_page_state: Dict[str, Any] = {}
         self._playwright = None
+        self._cdp: Optional[CDPSession] = None  # Cached CDP session for self.page (raw input events)
+        self._keep_browser_open = False  # Set by batch flows that share one browser across agent runs
+        self._run_finished = False  # Set once an agent run has captured final state and closed
+        # Shared with the other engine in _race_engines; set once either run reaches a finished page
+        self._race_finished: Optional[asyncio.Event] = None
+        self._last_debug_screenshot: Optional[Tuple[int, str]] = None  # (hash, path) of the last DEBUG capture
+        # (platform_config, tables) - see _indicator_tables
+        self._indicator_tables_cache: Optional[Tuple[Dict[str, Any], Dict[str, Tuple]]] = None
+        # Page-text hash -> indicator results (see _page_indicators), oldest first
+        self._detection_cache: "OrderedDict[int, Dict[str, Optional[str]]]" = OrderedDict()
+        # Last body text read by _page_text() and the DOM fingerprint it was read at
+        self._page_text_fingerprint: Optional[str] = None
+        self._page_text_cache = ""
+        # URL at the last iteration-start blocked check (see _blocked_check_due)
+        self._last_blocked_check_url: Optional[str] = None
+        # Invitation list captured from dashboard JSON responses (see _capture_invitation_feed)
+        self._invitation_feed: List[Dict[str, Any]] = []
+        self._visited_feed_urls: set = set()
         # Track repeated clicks at same location for fallback triggering
-        self._click_history: List[Tuple[int, int]] = []
+        self._click_history: Deque[Tuple[int, int]] = deque(maxlen=10)
         self._click_fallback_threshold = 2  # Use JS fallback after N clicks at same spot
+        self._click_repeat_tolerance = 20  # Pixels within which clicks count as "same spot"
+        self._click_repeat_window = 5  # Only the N most recent clicks are considered
         
         # Profile support
-        self.user_data_dir: Optional[str] = None
+        self.user_data_dir = user_data_dir
 
         # Phase 2: Session State Management
         self.session_state = {
@@ -537,8 +1085,6 @@ class BrowserAutomation:
         
     def _log_action(self, action_data: Dict[str, Any]):
         """Add contextual information to an action and log it."""
-        from datetime import datetime
-        
         full_action_data = {
             "timestamp": datetime.now().isoformat(),
             "correlation_id": self.correlation_id,
@@ -549,27 +1095,39 @@ class BrowserAutomation:
         self.action_log.append(full_action_data)
         logger.info(f"[{self.correlation_id}] Logged action: {action_data['action']}")
 
-    async def start_browser(self, headless: bool = None, user_data_dir: str = None):
+    def flush_new_actions(self) -> List[Dict[str, Any]]:
+        """
+        Return action log entries appended since the previous flush.
+
+        Lets callers persist or stream the log incrementally without
+        re-serializing the whole history on every call.
+        """
+        new_entries = self.action_log[self._action_log_flushed:]
+        self._action_log_flushed = len(self.action_log)
+        return new_entries
+
+    async def start_browser(self, headless: bool = None, user_data_dir: str = None, storage_state: str = None):
         """
         Start Playwright browser.
 
         Args:
             headless: Override headless mode. If None, reads from HEADLESS env var (default: False)
             user_data_dir: Path to Chrome user data directory for persistent sessions
+            storage_state: Path to a saved storage state (cookies/localStorage) to restore
+                into the ephemeral context; ignored with user_data_dir
         """
         # Environment detection
         if headless is None:
             headless = os.getenv('HEADLESS', 'false').lower() in ('true', '1', 'yes')
 
-        self._playwright = await async_playwright().start()
-        
         if user_data_dir:
             # Create directory if it doesn't exist
             os.makedirs(user_data_dir, exist_ok=True)
             logger.info(f"[{self.correlation_id}] Launching persistent browser with profile: {user_data_dir}")
             
-            # Launch persistent context
+            # Launch persistent context (profile directories cannot be shared, so not pooled)
             # Note: persistent_context is both a Browser and a Context
+            self._playwright = await async_playwright().start()
             self.context = await self._playwright.chromium.launch_persistent_context(
                 user_data_dir=user_data_dir,
                 headless=headless,
@@ -580,12 +1138,20 @@ class BrowserAutomation:
             self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
             
         else:
-            # Standard ephemeral launch
-            self.browser = await self._playwright.chromium.launch(headless=headless)
-            self.context = await self.browser.new_context()
+            # Fresh context on the shared, already-running browser
+            self.browser = await BROWSER_POOL.acquire_browser(headless)
+            self.context = await self.browser.new_context(storage_state=storage_state)
             self.page = await self.context.new_page()
 
+        # Install focus helpers for future documents and the already-open one
+        await self.context.add_init_script(FOCUS_HELPERS_JS)
+        await self.page.evaluate(FOCUS_HELPERS_JS)
+
+        # One CDP session per page, reused for high-frequency mouse input
+        self._cdp = await self.context.new_cdp_session(self.page)
+
         self.action_log = []
+        self._action_log_flushed = 0
         self.last_page_state = {}
 
         mode = "headless" if headless else "headed"
@@ -593,14 +1159,16 @@ class BrowserAutomation:
         logger.info(f"[{self.correlation_id}] Browser started in {mode} mode{profile_msg}")
 
     async def close_browser(self):
-        """Close browser"""
+        """Close browser (no-op while a batch flow holds it open)"""
+        if self._keep_browser_open:
+            logger.debug(f"[{self.correlation_id}] Keeping browser open for batch processing")
+            return
+
         try:
+            # The browser itself belongs to BROWSER_POOL and stays up for the next run
             if self.context:
                 await self.context.close()
-            
-            if self.browser:
-                await self.browser.close()
-                
+
             if self._playwright:
                 await self._playwright.stop()
                 
@@ -609,20 +1177,40 @@ class BrowserAutomation:
             logger.debug(f"[{self.correlation_id}] Error closing browser: {e}")
         finally:
             self.page = None
+            self._cdp = None
             self.context = None
             self.browser = None
             self._playwright = None
 
-    async def take_screenshot(self) -> bytes:
-        """Take screenshot of current page"""
+    async def _finish_run(self, completed: bool = False):
+        """
+        Capture final page state and close the browser, once per agent run.
+
+        completed marks a run that reached a finished page (submitted, declined
+        or blocked); a racing engine sharing _race_finished stops acting on it.
+        """
+        if completed and self._race_finished is not None:
+            self._race_finished.set()
+        if self._run_finished:
+            return
+        self._run_finished = True
+        await self._capture_page_state()
+        await self.close_browser()
+
+    async def take_screenshot(self, image_type: str = "png", quality: Optional[int] = None) -> bytes:
+        """Take viewport screenshot of current page (quality applies to JPEG only)"""
         if not self.page:
             raise ValueError("Browser not started")
-        screenshot = await self.page.screenshot(full_page=False)
+        screenshot = await self.page.screenshot(full_page=False, type=image_type, quality=quality)
         return screenshot
 
+    def _race_lost(self) -> bool:
+        """Whether the other engine of a race already finished, so this run must not act again"""
+        return self._race_finished is not None and self._race_finished.is_set()
+
     def screenshot_to_base64(self, screenshot: bytes) -> str:
         """Convert screenshot to base64"""
-        return base64.b64encode(screenshot).decode('utf-8')
+        return base64.b64encode(screenshot).decode('ascii')
 
     def _denormalize_coord(self, normalized_value: int, screen_dimension: int) -> int:
         """
@@ -633,9 +1221,7 @@ class BrowserAutomation:
 
     async def _get_element_at_position(self, x: int, y: int):
         """Get element at pixel coordinates using JavaScript"""
-        element = await self.page.evaluate(f"""
-            document.elementFromPoint({x}, {y})
-        """)
+        element = await self.page.evaluate("({x, y}) => document.elementFromPoint(x, y)", {"x": x, "y": y})
         return element
 
     async def _smart_select_option(self, x: int, y: int, text: str) -> bool:
@@ -643,81 +1229,38 @@ class BrowserAutomation:
         Intelligently select dropdown option by text value.
         Detects select elements and uses Playwright's select_option for reliability.
         """
+        if len(text) > SMART_SELECT_MAX_TEXT or "\n" in text:
+            return False
+
         try:
-            # Find the select element at coordinates
-            select_elem = await self.page.evaluate(f"""
-                (function() {{
-                    let elem = document.elementFromPoint({x}, {y});
-                    // Walk up DOM tree to find select element
-                    while (elem && elem.tagName !== 'SELECT') {{
-                        elem = elem.parentElement;
-                    }}
-                    if (elem && elem.tagName === 'SELECT') {{
-                        return elem.id || elem.name || 'found';
-                    }}
-                    return null;
-                }})()
-            """)
-
-            if select_elem:
-                logger.info(f"[{self.correlation_id}] Detected <select> element, using smart selection for: {text}")
-                # Use JavaScript with prioritized matching logic
-                selected = await self.page.evaluate(f"""
-                    (function() {{
-                        let elem = document.elementFromPoint({x}, {y});
-                        while (elem && elem.tagName !== 'SELECT') {{
-                            elem = elem.parentElement;
-                        }}
-                        if (elem) {{
-                            const searchText = '{text}'.toLowerCase();
-                            let bestMatch = null;
-                            let matchQuality = 0; // 1=contains, 2=startsWith, 3=exact
-
-                            // Prioritized matching: exact > startsWith > contains
-                            for (let option of elem.options) {{
-                                const optionText = option.text.toLowerCase();
-                                const optionValue = option.value.toLowerCase();
-
-                                // Exact match (highest priority)
-                                if (optionText === searchText || optionValue === searchText) {{
-                                    bestMatch = option;
-                                    matchQuality = 3;
-                                    break;
-                                }}
-
-                                // Starts with (medium priority)
-                                if (matchQuality < 2 && (optionText.startsWith(searchText) || optionValue.startsWith(searchText))) {{
-                                    bestMatch = option;
-                                    matchQuality = 2;
-                                }}
-
-                                // Contains (lowest priority)
-                                if (matchQuality < 1 && (optionText.includes(searchText) || optionValue.includes(searchText))) {{
-                                    bestMatch = option;
-                                    matchQuality = 1;
-                                }}
-                            }}
-
-                            if (bestMatch) {{
-                                bestMatch.selected = true;
-                                elem.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                                return bestMatch.text;
-                            }}
-                        }}
-                        return null;
-                    }})()
-                """)
-                if selected:
-                    logger.success(f"[{self.correlation_id}] Selected dropdown option: {selected}")
-                    return True
-                else:
-                    logger.warning(f"[{self.correlation_id}] Could not find option matching: {text}")
-                    return False
+            # One round-trip: find the <select> under (x, y) and pick the best option
+            result = await self.page.evaluate(SELECT_OPTION_JS, {"x": x, "y": y, "text": text})
+            if not result:
+                return False
+
+            logger.info(f"[{self.correlation_id}] Detected <select> element, using smart selection for: {text}")
+            if result["selected"]:
+                logger.success(f"[{self.correlation_id}] Selected dropdown option: {result['selected']}")
+                return True
+            logger.warning(f"[{self.correlation_id}] Could not find option matching: {text}")
             return False
         except Exception as e:
             logger.debug(f"[{self.correlation_id}] Smart select failed: {e}")
             return False
 
+    def _count_recent_clicks_near(self, x: int, y: int) -> int:
+        """
+        Count recent clicks that landed within the repeat tolerance of (x, y).
+
+        Only the last `_click_repeat_window` clicks are scanned, newest first.
+        """
+        tolerance = self._click_repeat_tolerance
+        count = 0
+        for px, py in itertools.islice(reversed(self._click_history), self._click_repeat_window):
+            if -tolerance < px - x < tolerance and -tolerance < py - y < tolerance:
+                count += 1
+        return count
+
     async def _js_click_fallback(self, x: int, y: int) -> bool:
         """
         Click element at coordinates using JavaScript (more reliable for stubborn buttons).
@@ -726,29 +1269,7 @@ class BrowserAutomation:
         which can happen with JavaScript-heavy UIs or overlays.
         """
         try:
-            result = await self.page.evaluate(f"""
-                (function() {{
-                    const elem = document.elementFromPoint({x}, {y});
-                    if (elem) {{
-                        // Try multiple click methods for maximum compatibility
-                        elem.click();
-                        
-                        // Also dispatch click event for React/Vue apps
-                        elem.dispatchEvent(new MouseEvent('click', {{
-                            bubbles: true,
-                            cancelable: true,
-                            view: window
-                        }}));
-                        
-                        return {{
-                            success: true,
-                            tagName: elem.tagName,
-                            text: elem.textContent?.trim()?.substring(0, 50) || ''
-                        }};
-                    }}
-                    return {{ success: false }};
-                }})()
-            """)
+            result = await self.page.evaluate(JS_CLICK_AT_JS, {"x": x, "y": y})
             if result and result.get("success"):
                 logger.info(f"[{self.correlation_id}] JS click fallback succeeded at ({x}, {y}) on <{result.get('tagName', 'unknown')}>: {result.get('text', '')[:30]}")
                 return True
@@ -765,24 +1286,7 @@ class BrowserAutomation:
         Critical for Yes/No buttons to prevent accidental declines.
         """
         try:
-            element_info = await self.page.evaluate(f"""
-                (function() {{
-                    const elem = document.elementFromPoint({x}, {y});
-                    if (!elem) return null;
-                    
-                    const rect = elem.getBoundingClientRect();
-                    return {{
-                        tagName: elem.tagName,
-                        text: elem.textContent?.trim()?.substring(0, 100) || '',
-                        id: elem.id || null,
-                        className: elem.className || '',
-                        type: elem.type || null,
-                        isButton: elem.tagName === 'BUTTON' || elem.type === 'button' || elem.type === 'submit',
-                        isClickable: elem.onclick !== null || elem.tagName === 'BUTTON' || elem.tagName === 'A' || elem.role === 'button',
-                        boundingBox: {{ x: rect.x, y: rect.y, width: rect.width, height: rect.height }}
-                    }};
-                }})()
-            """)
+            element_info = await self.page.evaluate(ELEMENT_INFO_JS, {"x": x, "y": y})
             
             if element_info and expected_text:
                 element_info["matches_expected"] = expected_text.lower() in element_info.get("text", "").lower()
@@ -792,6 +1296,89 @@ class BrowserAutomation:
             logger.debug(f"Element validation failed: {e}")
             return {}
 
+    def _blocked_check_due(self, iteration: int) -> bool:
+        """
+        Whether the agent loop should run its iteration-start blocked check.
+
+        Between checks, each loop's per-turn completion checks already look for
+        the page's blocked indicators (_page_indicators), so the probe only runs
+        every BLOCKED_CHECK_INTERVAL iterations or after the URL changes.
+        """
+        url = self.page.url
+        if iteration % BLOCKED_CHECK_INTERVAL == 0 or url != self._last_blocked_check_url:
+            self._last_blocked_check_url = url
+            return True
+        return False
+
+    async def _page_text(self) -> str:
+        """Body text of the current page, fetched only if the DOM changed since the last read"""
+        result = await self.page.evaluate(PAGE_TEXT_JS, self._page_text_fingerprint)
+        if result["text"] is not None:
+            self._page_text_fingerprint = result["fingerprint"]
+            self._page_text_cache = result["text"]
+        return self._page_text_cache
+
+    def _indicator_tables(self) -> Dict[str, Tuple[Tuple[Any, Any], ...]]:
+        """
+        Lowercased platform + generic indicator and stage tables for _page_indicators.
+
+        Cached for the current platform_config, so platform indicators are
+        lowercased once per config rather than on every page scan.
+        """
+        cached = self._indicator_tables_cache
+        if cached is not None and cached[0] is self.platform_config:
+            return cached[1]
+
+        config = self.platform_config
+        tables = {
+            "success": _indicator_pairs(config.get("success_indicators"), _SUCCESS_INDICATORS_LOWER),
+            "failure": _indicator_pairs(config.get("failure_indicators"), _FAILURE_INDICATORS_LOWER),
+            "blocked": _indicator_pairs(config.get("blocked_indicators"), _BLOCKED_INDICATORS_LOWER),
+            "stage": _stage_keywords(config.get("workflow_stages")),
+        }
+        self._indicator_tables_cache = (config, tables)
+        return tables
+
+    def _page_indicators(self, page_text: str) -> Dict[str, Optional[str]]:
+        """
+        Success/failure/blocked indicators and workflow stage for the given page text.
+
+        The text is lowercased once for all four scans, and results are cached by
+        text hash, so polling an unchanged page does not rescan it.
+        """
+        key = hash(page_text)
+        cached = self._detection_cache.get(key)
+        if cached is not None:
+            self._detection_cache.move_to_end(key)
+            return cached
+
+        page_text_lower = page_text.lower()
+        tables = self._indicator_tables()
+        result = {
+            "success": _first_indicator(page_text_lower, tables["success"]),
+            "failure": _first_indicator(page_text_lower, tables["failure"]),
+            "blocked": _first_indicator(page_text_lower, tables["blocked"]),
+            "stage": _first_workflow_stage(page_text_lower, tables["stage"]),
+        }
+        self._detection_cache[key] = result
+        if len(self._detection_cache) > DETECTION_CACHE_SIZE:
+            self._detection_cache.popitem(last=False)
+        return result
+
+    async def _evaluate_page(self) -> Dict[str, Optional[str]]:
+        """
+        Read the page text once and run every indicator check against it.
+
+        Returns the _page_indicators dict (success/failure/blocked/stage) plus the
+        page text under "text"; all None if the page cannot be read.
+        """
+        try:
+            page_text = await self._page_text()
+        except Exception as e:
+            logger.debug(f"Page evaluation failed: {e}")
+            return {"success": None, "failure": None, "blocked": None, "stage": None, "text": None}
+        return {**self._page_indicators(page_text), "text": page_text}
+
     async def _check_blocked_state(self) -> Optional[str]:
         """
         Check if page shows blocked/unavailable state before attempting actions.
@@ -801,10 +1388,8 @@ class BrowserAutomation:
         Returns the blocking indicator found, or None if page is actionable.
         """
         try:
-            page_text = await self.page.inner_text("body")
-            # Pass platform-specific indicators from config
-            additional = self.platform_config.get("blocked_indicators")
-            return check_blocked_indicators(page_text, additional)
+            page_text = await self._page_text()
+            return self._page_indicators(page_text)["blocked"]
         except Exception as e:
             logger.debug(f"Blocked state check failed: {e}")
             return None
@@ -818,9 +1403,8 @@ class BrowserAutomation:
         Returns the success indicator found, or None if not successful.
         """
         try:
-            page_text = await self.page.inner_text("body")
-            additional = self.platform_config.get("success_indicators")
-            return check_success_indicators(page_text, additional)
+            page_text = await self._page_text()
+            return self._page_indicators(page_text)["success"]
         except Exception as e:
             logger.debug(f"Success state check failed: {e}")
             return None
@@ -834,9 +1418,8 @@ class BrowserAutomation:
         Returns the failure indicator found, or None.
         """
         try:
-            page_text = await self.page.inner_text("body")
-            additional = self.platform_config.get("failure_indicators")
-            return check_failure_indicators(page_text, additional)
+            page_text = await self._page_text()
+            return self._page_indicators(page_text)["failure"]
         except Exception as e:
             logger.debug(f"Failure state check failed: {e}")
             return None
@@ -850,9 +1433,8 @@ class BrowserAutomation:
         Returns the workflow stage name, or None if unknown.
         """
         try:
-            page_text = await self.page.inner_text("body")
-            additional = self.platform_config.get("workflow_stages")
-            return detect_workflow_stage(page_text, additional)
+            page_text = await self._page_text()
+            return self._page_indicators(page_text)["stage"]
         except Exception as e:
             logger.debug(f"Workflow stage detection failed: {e}")
             return None
@@ -940,70 +1522,59 @@ class BrowserAutomation:
 
         state["url"] = self.page.url
 
-        # Save screenshot in DEBUG mode
+        # Debug screenshot and page state are independent round-trips - run them together
         debug_mode = os.getenv('DEBUG', 'false').lower() in ('true', '1', 'yes')
         if debug_mode:
-            try:
-                from datetime import datetime
-                from pathlib import Path
-
-                # Create screenshots directory if it doesn't exist
-                screenshots_dir = Path("screenshots")
-                screenshots_dir.mkdir(exist_ok=True)
+            debug_screenshot, page_state = await asyncio.gather(
+                self._save_debug_screenshot(), self._read_page_state()
+            )
+            if debug_screenshot:
+                state["debug_screenshot"] = debug_screenshot
+        else:
+            page_state = await self._read_page_state()
 
-                # Generate filename with timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                screenshot_path = screenshots_dir / f"debug_{timestamp}.png"
+        state["localStorage"] = page_state.get("localStorage", {})
+        for key in ("successMessageVisible", "successMessageText"):
+            if key in page_state:
+                state[key] = page_state[key]
 
-                # Save screenshot
-                await self.page.screenshot(path=str(screenshot_path))
-                state["debug_screenshot"] = str(screenshot_path)
-                logger.debug(f"Debug screenshot saved: {screenshot_path}")
-            except Exception as e:
-                logger.warning(f"Failed to save debug screenshot: {e}")
+        self.last_page_state = state
+        return state
 
+    async def _save_debug_screenshot(self) -> Optional[str]:
+        """Save a screenshot to screenshots/ for DEBUG runs and return its path"""
         try:
-            local_storage = await self.page.evaluate("""
-                () => {
-                    const result = {};
-                    for (let i = 0; i < localStorage.length; i++) {
-                        const key = localStorage.key(i);
-                        result[key] = localStorage.getItem(key);
-                    }
-                    return result;
-                }
-            """)
+            # Create screenshots directory if it doesn't exist
+            screenshots_dir = Path("screenshots")
+            screenshots_dir.mkdir(exist_ok=True)
+
+            screenshot = await self.page.screenshot()
+            screenshot_hash = hash(screenshot)
+
+            # Unchanged page since the last capture - reuse that file instead of writing again
+            if self._last_debug_screenshot and self._last_debug_screenshot[0] == screenshot_hash:
+                return self._last_debug_screenshot[1]
+
+            # Generate filename with timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            screenshot_path = screenshots_dir / f"debug_{timestamp}.png"
+
+            # Save screenshot
+            screenshot_path.write_bytes(screenshot)
+            self._last_debug_screenshot = (screenshot_hash, str(screenshot_path))
+            logger.debug(f"Debug screenshot saved: {screenshot_path}")
+            return str(screenshot_path)
         except Exception as e:
-            logger.debug(f"LocalStorage capture failed: {e}")
-            local_storage = {}
-        state["localStorage"] = local_storage
-
-        try:
-            success_visible = await self.page.evaluate("""
-                () => {
-                    const successMsg = document.getElementById('success-message');
-                    if (!successMsg) return false;
-                    const style = window.getComputedStyle(successMsg);
-                    return style.display !== 'none' && style.visibility !== 'hidden';
-                }
-            """)
-            state["successMessageVisible"] = success_visible
-        except Exception as e:
-            logger.debug(f"Success message visibility capture failed: {e}")
+            logger.warning(f"Failed to save debug screenshot: {e}")
+            return None
 
+    async def _read_page_state(self) -> Dict[str, Any]:
+        """localStorage and success message state in one evaluate ({} if the page is gone)"""
         try:
-            success_text = await self.page.evaluate("""
-                () => {
-                    const successMsg = document.getElementById('success-message');
-                    return successMsg ? (successMsg.textContent || '').trim() : null;
-                }
-            """)
-            state["successMessageText"] = success_text
+            return await self.page.evaluate(PAGE_STATE_JS)
         except Exception as e:
-            logger.debug(f"Success message text capture failed: {e}")
-
-        self.last_page_state = state
-        return state
+            logger.debug(f"Page state capture failed: {e}")
+            return {}
 
     async def precise_click(self, x: int, y: int, expected_text: str = None) -> bool:
         """
@@ -1019,54 +1590,7 @@ class BrowserAutomation:
         """
         try:
             # Step 1: Try to find a reliable selector for the element at these coordinates
-            element_info = await self.page.evaluate(f"""
-                (function() {{
-                    const elem = document.elementFromPoint({x}, {y});
-                    if (!elem) return null;
-
-                    const rect = elem.getBoundingClientRect();
-
-                    // Build selector hierarchy for robustness
-                    let selectors = [];
-
-                    // Try ID selector (most reliable)
-                    if (elem.id) {{
-                        selectors.push('#' + elem.id);
-                    }}
-
-                    // Try data attributes (common for React apps)
-                    if (elem.dataset && elem.dataset.testid) {{
-                        selectors.push('[data-testid="' + elem.dataset.testid + '"]');
-                    }}
-
-                    // Try class + text combination for buttons/links
-                    if ((elem.tagName === 'BUTTON' || elem.tagName === 'A') && elem.textContent) {{
-                        const text = elem.textContent.trim();
-                        if (text.length > 0 && text.length < 50) {{
-                            selectors.push(`${{elem.tagName.toLowerCase()}}:has-text("${{text}}")`);
-                        }}
-                    }}
-
-                    // Try role + name for accessibility
-                    if (elem.getAttribute('role')) {{
-                        const role = elem.getAttribute('role');
-                        const ariaLabel = elem.getAttribute('aria-label') || elem.textContent?.trim();
-                        if (ariaLabel && ariaLabel.length < 50) {{
-                            selectors.push(`[role="${{role}}"][aria-label*="${{ariaLabel}}"]`);
-                        }}
-                    }}
-
-                    return {{
-                        tagName: elem.tagName,
-                        text: elem.textContent?.trim()?.substring(0, 100) || '',
-                        selectors: selectors,
-                        boundingBox: {{ x: rect.x, y: rect.y, width: rect.width, height: rect.height }},
-                        isClickable: elem.tagName === 'BUTTON' || elem.tagName === 'A' ||
-                                   elem.type === 'button' || elem.type === 'submit' ||
-                                   elem.onclick !== null || elem.getAttribute('role') === 'button'
-                    }};
-                }})()
-            """)
+            element_info = await self.page.evaluate(ELEMENT_SELECTORS_JS, {"x": x, "y": y})
 
             if not element_info:
                 logger.warning(f"[{self.correlation_id}] No element found at ({x}, {y}), falling back to coordinates")
@@ -1112,20 +1636,7 @@ class BrowserAutomation:
             await asyncio.sleep(0.3)
 
             # Check if element state changed (common for dialog dismissal)
-            current_element_info = await self.page.evaluate(f"""
-                (function() {{
-                    const elem = document.elementFromPoint({x}, {y});
-                    if (!elem) return {{ elementGone: true }};
-
-                    const rect = elem.getBoundingClientRect();
-                    return {{
-                        tagName: elem.tagName,
-                        text: elem.textContent?.trim()?.substring(0, 100) || '',
-                        boundingBox: {{ x: rect.x, y: rect.y, width: rect.width, height: rect.height }},
-                        visible: rect.width > 0 && rect.height > 0
-                    }};
-                }})()
-            """)
+            current_element_info = await self.page.evaluate(CLICK_TARGET_STATE_JS, {"x": x, "y": y})
 
             # Success indicators:
             # 1. Element disappeared (dialog closed)
@@ -1166,6 +1677,59 @@ class BrowserAutomation:
             logger.debug(f"[{self.correlation_id}] Click verification error: {e}")
             return False  # Err on the side of caution
 
+    async def _cdp_click(self, x: int, y: int, button: str = "left", click_count: int = 1):
+        """
+        Click at pixel coordinates through the cached CDP session.
+
+        Sends a move to the target (so hover, mouseover and pointerenter fire)
+        followed by press/release pairs to Input.dispatchMouseEvent, one pair per
+        click with a rising clickCount as a real multi-click would. Each event is
+        awaited before the next is sent. Falls back to page.mouse when no session
+        is available.
+        """
+        if self._cdp is None:
+            await self.page.mouse.click(x, y, button=button, click_count=click_count)
+            return
+
+        events = [{"type": "mouseMoved", "x": x, "y": y}]
+        for count in range(1, click_count + 1):
+            event = {"x": x, "y": y, "button": button, "clickCount": count}
+            events.append({"type": "mousePressed", **event})
+            events.append({"type": "mouseReleased", **event})
+        for event in events:
+            await self._cdp.send("Input.dispatchMouseEvent", event)
+
+    async def _cdp_drag(self, from_x: int, from_y: int, to_x: int, to_y: int):
+        """
+        Left-button drag between pixel coordinates through the cached CDP session.
+
+        Move, press, move and release go straight to Input.dispatchMouseEvent,
+        each awaited in turn; falls back to page.mouse when no session is available.
+        """
+        if self._cdp is None:
+            await self.page.mouse.move(from_x, from_y)
+            await self.page.mouse.down()
+            await self.page.mouse.move(to_x, to_y)
+            await self.page.mouse.up()
+            return
+
+        events = (
+            {"type": "mouseMoved", "x": from_x, "y": from_y},
+            {"type": "mousePressed", "x": from_x, "y": from_y, "button": "left", "clickCount": 1},
+            {"type": "mouseMoved", "x": to_x, "y": to_y, "button": "left", "buttons": 1},
+            {"type": "mouseReleased", "x": to_x, "y": to_y, "button": "left", "clickCount": 1},
+        )
+        for event in events:
+            await self._cdp.send("Input.dispatchMouseEvent", event)
+
+    async def _settle(self):
+        """Wait for the page to catch up with the last input action (at most SETTLE_TIMEOUT_MS)"""
+        try:
+            await self.page.evaluate(SETTLE_JS, SETTLE_TIMEOUT_MS)
+        except Exception as e:
+            # Navigation tore down the context mid-wait - the page is past the action anyway
+            logger.debug(f"[{self.correlation_id}] Settle wait interrupted: {e}")
+
     async def _coordinate_click_fallback(self, x: int, y: int) -> bool:
         """
         Fallback to coordinate-based clicking when selectors fail.
@@ -1173,7 +1737,7 @@ class BrowserAutomation:
         """
         try:
             # Try normal mouse click first
-            await self.page.mouse.click(x, y)
+            await self._cdp_click(x, y)
             await asyncio.sleep(0.3)
 
             # Simple verification - did something change?
@@ -1218,6 +1782,10 @@ class BrowserAutomation:
         - drag_and_drop(from_x, from_y, to_x, to_y) - coordinates are normalized 0-1000
         - wait_5_seconds()
         """
+        # Model-supplied names are fresh strings; intern them so the handler
+        # lookup and repeated action-log entries share the literal's object
+        action_name = sys.intern(action_name)
+
         try:
             # Phase 4: Form operation protection - check before executing action
             protection_result = await self.protect_form_operation(action_name, args)
@@ -1237,222 +1805,211 @@ class BrowserAutomation:
             viewport = self.page.viewport_size
             screen_width = viewport.get('width', 1440)
             screen_height = viewport.get('height', 900)
-            if action_name == "click_at":
-                x_norm, y_norm = args.get("x"), args.get("y")
-                x = self._denormalize_coord(x_norm, screen_width)
-                y = self._denormalize_coord(y_norm, screen_height)
-
-                # Track click location for debugging
-                self._click_history.append((x, y))
-                if len(self._click_history) > 10:
-                    self._click_history = self._click_history[-10:]
-
-                # Use the new precision click system to fix iteration 30 dialog failure
-                expected_text = args.get("expected_text")  # Optional hint about what we expect to click
-                success = await self.precise_click(x, y, expected_text)
-
-                # Log the action with method used
-                method = "precision_click" if success else "failed"
-                logger.info(f"[{self.correlation_id}] Click at ({x}, {y}) [normalized: ({x_norm}, {y_norm})] - {method}")
-                self._log_action({"action": "click_at", "x": x, "y": y, "method": method, "success": success})
-                return success
-
-            elif action_name == "type_text_at":
-                x_norm, y_norm = args.get("x"), args.get("y")
-                x = self._denormalize_coord(x_norm, screen_width)
-                y = self._denormalize_coord(y_norm, screen_height)
-                text = args.get("text", "")
-
-                # Try smart select for dropdowns first
-                if text and await self._smart_select_option(x, y, text):
-                    logger.info(f"[{self.correlation_id}] Smart selected dropdown at ({x}, {y}): {text[:50]}... [normalized: ({x_norm}, {y_norm})]")
-                    self._log_action({"action": "select_option", "x": x, "y": y, "text": text})
-                    return True
-
-                # Normal text input handling
-                # Triple-click to select existing text/placeholder before typing
-                await self.page.mouse.click(x, y, click_count=3)
-                await asyncio.sleep(0.2)
-
-                # Handle clear_before_typing flag if present
-                if args.get("clear_before_typing", False):
-                    # Select all and delete
-                    await self.page.keyboard.press("Meta+a")  # Cmd+A on Mac
-                    await self.page.keyboard.press("Backspace")
-                    await asyncio.sleep(0.1)
-
-                # Type text
-                if text:
-                    await self.page.keyboard.type(text)
 
-                logger.info(f"[{self.correlation_id}] Typed at ({x}, {y}): {text[:50]}... [normalized: ({x_norm}, {y_norm})]")
-                self._log_action({"action": "type_text_at", "x": x, "y": y, "text": text})
-                return True
-
-            elif action_name == "hover_at":
-                x_norm, y_norm = args.get("x"), args.get("y")
-                x = self._denormalize_coord(x_norm, screen_width)
-                y = self._denormalize_coord(y_norm, screen_height)
-                await self.page.mouse.move(x, y)
-                logger.info(f"[{self.correlation_id}] Hovered at: ({x}, {y}) [normalized: ({x_norm}, {y_norm})]")
-                self._log_action({"action": "hover_at", "x": x, "y": y})
-                return True
-
-            elif action_name == "scroll_document":
-                direction = args.get("direction", "down")
-                amount = args.get("amount", 500)
-                if direction == "down":
-                    await self.page.mouse.wheel(0, amount)
-                else:
-                    await self.page.mouse.wheel(0, -amount)
-                logger.info(f"[{self.correlation_id}] Scrolled {direction} by {amount}px")
-                self._log_action({"action": "scroll_document", "direction": direction, "amount": amount})
-                return True
-
-            elif action_name == "scroll_at":
-                x_norm, y_norm = args.get("x"), args.get("y")
-                x = self._denormalize_coord(x_norm, screen_width)
-                y = self._denormalize_coord(y_norm, screen_height)
-                direction = args.get("direction", "down")
-                amount = args.get("amount", 500)
-                # Move mouse to position, then scroll
-                await self.page.mouse.move(x, y)
-                if direction == "down":
-                    await self.page.mouse.wheel(0, amount)
-                else:
-                    await self.page.mouse.wheel(0, -amount)
-                logger.info(f"[{self.correlation_id}] Scrolled at ({x}, {y}) {direction} by {amount}px [normalized: ({x_norm}, {y_norm})]")
-                self._log_action({"action": "scroll_at", "x": x, "y": y, "direction": direction, "amount": amount})
-                return True
-
-            elif action_name == "navigate":
-                url = args.get("url")
-                await self.page.goto(url)
-                logger.info(f"[{self.correlation_id}] Navigated to: {url}")
-                self._log_action({"action": "navigate", "url": url})
-                return True
-
-            elif action_name == "key_combination":
-                keys = args.get("keys", [])
-                # Keys can be a list ["Control", "c"] or already a string "Control+c"
-                if isinstance(keys, list):
-                    key_string = "+".join(keys)
-                else:
-                    key_string = str(keys)
-                
-                # Normalize key names for Playwright
-                # Map common lowercase/variant keys to Playwright's expected format
-                key_map = {
-                    "control": "Control",
-                    "ctrl": "Control",
-                    "shift": "Shift",
-                    "alt": "Alt",
-                    "meta": "Meta",
-                    "command": "Meta",
-                    "cmd": "Meta",
-                    "enter": "Enter",
-                    "return": "Enter",
-                    "escape": "Escape",
-                    "esc": "Escape",
-                    "backspace": "Backspace",
-                    "delete": "Delete",
-                    "del": "Delete",
-                    "tab": "Tab",
-                    "space": "Space",
-                    "insert": "Insert",
-                    "home": "Home",
-                    "end": "End",
-                    "pageup": "PageUp",
-                    "pagedown": "PageDown",
-                    "arrowup": "ArrowUp",
-                    "arrowdown": "ArrowDown",
-                    "arrowleft": "ArrowLeft",
-                    "arrowright": "ArrowRight",
-                    "up": "ArrowUp",
-                    "down": "ArrowDown",
-                    "left": "ArrowLeft",
-                    "right": "ArrowRight",
-                    "f1": "F1", "f2": "F2", "f3": "F3", "f4": "F4", "f5": "F5",
-                    "f6": "F6", "f7": "F7", "f8": "F8", "f9": "F9", "f10": "F10",
-                    "f11": "F11", "f12": "F12"
-                }
-                
-                # Handle combinations like "control+a"
-                normalized_keys = []
-                for part in key_string.split('+'):
-                    part = part.strip()
-                    # Check case-insensitive map
-                    normalized_part = key_map.get(part.lower(), part)
-                    normalized_keys.append(normalized_part)
-                
-                final_key_string = "+".join(normalized_keys)
-                
-                if final_key_string != key_string:
-                    logger.debug(f"Normalized keys: '{key_string}' -> '{final_key_string}'")
-                
-                await self.page.keyboard.press(final_key_string)
-                logger.info(f"[{self.correlation_id}] Pressed keys: {final_key_string}")
-                self._log_action({"action": "key_combination", "keys": final_key_string})
-                return True
-
-            elif action_name == "go_back":
-                await self.page.go_back()
-                logger.info(f"[{self.correlation_id}] Navigated back")
-                self._log_action({"action": "go_back"})
-                return True
-
-            elif action_name == "go_forward":
-                await self.page.go_forward()
-                logger.info(f"[{self.correlation_id}] Navigated forward")
-                self._log_action({"action": "go_forward"})
-                return True
+            handler = self._GEMINI_ACTIONS.get(action_name)
+            if handler is None:
+                logger.warning(f"[{self.correlation_id}] Unknown Computer Use action: {action_name}")
+                return False
+            return await handler(self, args, screen_width, screen_height)
 
-            elif action_name == "drag_and_drop":
-                from_x_norm, from_y_norm = args.get("from_x"), args.get("from_y")
-                to_x_norm, to_y_norm = args.get("to_x"), args.get("to_y")
-                from_x = self._denormalize_coord(from_x_norm, screen_width)
-                from_y = self._denormalize_coord(from_y_norm, screen_height)
-                to_x = self._denormalize_coord(to_x_norm, screen_width)
-                to_y = self._denormalize_coord(to_y_norm, screen_height)
-                await self.page.mouse.move(from_x, from_y)
-                await self.page.mouse.down()
-                await self.page.mouse.move(to_x, to_y)
-                await self.page.mouse.up()
-                logger.info(f"[{self.correlation_id}] Dragged from ({from_x}, {from_y}) to ({to_x}, {to_y}) [normalized: ({from_x_norm}, {from_y_norm}) to ({to_x_norm}, {to_y_norm})]")
-                self._log_action({"action": "drag_and_drop", "from": (from_x, from_y), "to": (to_x, to_y)})
-                return True
+        except Exception as e:
+            logger.exception(f"[{self.correlation_id}] Error executing {action_name}: {e}")
+            return False
 
-            elif action_name == "wait_5_seconds":
-                await asyncio.sleep(5)
-                logger.info(f"[{self.correlation_id}] Waited 5 seconds")
-                self._log_action({"action": "wait_5_seconds"})
-                return True
+    async def _gemini_click_at(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Precision-click at normalized coordinates."""
+        x_norm, y_norm = args.get("x"), args.get("y")
+        x = self._denormalize_coord(x_norm, screen_width)
+        y = self._denormalize_coord(y_norm, screen_height)
+
+        # Track click location for debugging
+        self._click_history.append((x, y))
+
+        # Use the new precision click system to fix iteration 30 dialog failure
+        expected_text = args.get("expected_text")  # Optional hint about what we expect to click
+        success = await self.precise_click(x, y, expected_text)
+
+        # Log the action with method used
+        method = "precision_click" if success else "failed"
+        logger.info(f"[{self.correlation_id}] Click at ({x}, {y}) [normalized: ({x_norm}, {y_norm})] - {method}")
+        self._log_action({"action": "click_at", "x": x, "y": y, "method": method, "success": success})
+        return success
+
+    async def _gemini_type_text_at(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Type at normalized coordinates, using smart select for dropdowns."""
+        x_norm, y_norm = args.get("x"), args.get("y")
+        x = self._denormalize_coord(x_norm, screen_width)
+        y = self._denormalize_coord(y_norm, screen_height)
+        text = args.get("text", "")
+
+        # Try smart select for dropdowns first
+        if text and await self._smart_select_option(x, y, text):
+            logger.info(f"[{self.correlation_id}] Smart selected dropdown at ({x}, {y}): {text[:50]}... [normalized: ({x_norm}, {y_norm})]")
+            self._log_action({"action": "select_option", "x": x, "y": y, "text": text})
+            return True
 
-            elif action_name == "open_web_browser":
-                # Browser is already open, just acknowledge
-                logger.info(f"[{self.correlation_id}] Browser already open, acknowledging action")
-                self._log_action({"action": "open_web_browser"})
-                return True
+        # Normal text input handling
+        # Triple-click to select existing text/placeholder before typing
+        await self._cdp_click(x, y, click_count=3)
+        await self._settle()
 
-            elif action_name == "search":
-                # Handle search action (type in search box)
-                query = args.get("query", "")
-                logger.info(f"[{self.correlation_id}] Search query: {query}")
-                # Note: This assumes focus is already on search box
-                await self.page.keyboard.type(query)
-                await self.page.keyboard.press("Enter")
-                self._log_action({"action": "search", "query": query})
-                return True
+        # Handle clear_before_typing flag if present
+        if args.get("clear_before_typing", False):
+            # Select all and delete
+            await self.page.keyboard.press("Meta+a")  # Cmd+A on Mac
+            await self.page.keyboard.press("Backspace")
+            await asyncio.sleep(0.1)
 
-            else:
-                logger.warning(f"[{self.correlation_id}] Unknown Computer Use action: {action_name}")
-                return False
+        # Type text
+        if text:
+            await self.page.keyboard.type(text)
 
-        except Exception as e:
-            logger.error(f"[{self.correlation_id}] Error executing {action_name}: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+        logger.info(f"[{self.correlation_id}] Typed at ({x}, {y}): {text[:50]}... [normalized: ({x_norm}, {y_norm})]")
+        self._log_action({"action": "type_text_at", "x": x, "y": y, "text": text})
+        return True
+
+    async def _gemini_hover_at(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Move the mouse to normalized coordinates."""
+        x_norm, y_norm = args.get("x"), args.get("y")
+        x = self._denormalize_coord(x_norm, screen_width)
+        y = self._denormalize_coord(y_norm, screen_height)
+        await self.page.mouse.move(x, y)
+        logger.info(f"[{self.correlation_id}] Hovered at: ({x}, {y}) [normalized: ({x_norm}, {y_norm})]")
+        self._log_action({"action": "hover_at", "x": x, "y": y})
+        return True
+
+    async def _gemini_scroll_document(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Scroll the whole page up or down."""
+        direction = args.get("direction", "down")
+        amount = args.get("amount", 500)
+        if direction == "down":
+            await self.page.mouse.wheel(0, amount)
+        else:
+            await self.page.mouse.wheel(0, -amount)
+        logger.info(f"[{self.correlation_id}] Scrolled {direction} by {amount}px")
+        self._log_action({"action": "scroll_document", "direction": direction, "amount": amount})
+        return True
+
+    async def _gemini_scroll_at(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Scroll at normalized coordinates."""
+        x_norm, y_norm = args.get("x"), args.get("y")
+        x = self._denormalize_coord(x_norm, screen_width)
+        y = self._denormalize_coord(y_norm, screen_height)
+        direction = args.get("direction", "down")
+        amount = args.get("amount", 500)
+        # Move mouse to position, then scroll
+        await self.page.mouse.move(x, y)
+        if direction == "down":
+            await self.page.mouse.wheel(0, amount)
+        else:
+            await self.page.mouse.wheel(0, -amount)
+        logger.info(f"[{self.correlation_id}] Scrolled at ({x}, {y}) {direction} by {amount}px [normalized: ({x_norm}, {y_norm})]")
+        self._log_action({"action": "scroll_at", "x": x, "y": y, "direction": direction, "amount": amount})
+        return True
+
+    async def _gemini_navigate(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Navigate to a URL."""
+        url = args.get("url")
+        await self.page.goto(url)
+        logger.info(f"[{self.correlation_id}] Navigated to: {url}")
+        self._log_action({"action": "navigate", "url": url})
+        return True
+
+    async def _gemini_key_combination(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Press a key combination such as Control+a."""
+        keys = args.get("keys", [])
+        # Keys can be a list ["Control", "c"] or already a string "Control+c"
+        if isinstance(keys, list):
+            key_string = "+".join(keys)
+        else:
+            key_string = str(keys)
+
+        # Handle combinations like "control+a"
+        normalized_keys = []
+        for part in key_string.split('+'):
+            part = part.strip()
+            # Check case-insensitive map
+            normalized_part = GEMINI_KEY_NAMES.get(part.lower(), part)
+            normalized_keys.append(normalized_part)
+
+        final_key_string = "+".join(normalized_keys)
+
+        if final_key_string != key_string:
+            logger.debug(f"Normalized keys: '{key_string}' -> '{final_key_string}'")
+
+        await self.page.keyboard.press(final_key_string)
+        logger.info(f"[{self.correlation_id}] Pressed keys: {final_key_string}")
+        self._log_action({"action": "key_combination", "keys": final_key_string})
+        return True
+
+    async def _gemini_go_back(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Navigate back."""
+        await self.page.go_back()
+        logger.info(f"[{self.correlation_id}] Navigated back")
+        self._log_action({"action": "go_back"})
+        return True
+
+    async def _gemini_go_forward(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Navigate forward."""
+        await self.page.go_forward()
+        logger.info(f"[{self.correlation_id}] Navigated forward")
+        self._log_action({"action": "go_forward"})
+        return True
+
+    async def _gemini_drag_and_drop(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Drag between normalized coordinates."""
+        from_x_norm, from_y_norm = args.get("from_x"), args.get("from_y")
+        to_x_norm, to_y_norm = args.get("to_x"), args.get("to_y")
+        from_x = self._denormalize_coord(from_x_norm, screen_width)
+        from_y = self._denormalize_coord(from_y_norm, screen_height)
+        to_x = self._denormalize_coord(to_x_norm, screen_width)
+        to_y = self._denormalize_coord(to_y_norm, screen_height)
+        await self._cdp_drag(from_x, from_y, to_x, to_y)
+        logger.info(f"[{self.correlation_id}] Dragged from ({from_x}, {from_y}) to ({to_x}, {to_y}) [normalized: ({from_x_norm}, {from_y_norm}) to ({to_x_norm}, {to_y_norm})]")
+        self._log_action({"action": "drag_and_drop", "from": (from_x, from_y), "to": (to_x, to_y)})
+        return True
+
+    async def _gemini_wait_5_seconds(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Wait five seconds."""
+        await asyncio.sleep(5)
+        logger.info(f"[{self.correlation_id}] Waited 5 seconds")
+        self._log_action({"action": "wait_5_seconds"})
+        return True
+
+    async def _gemini_open_web_browser(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Acknowledge the browser is open."""
+        # Browser is already open, just acknowledge
+        logger.info(f"[{self.correlation_id}] Browser already open, acknowledging action")
+        self._log_action({"action": "open_web_browser"})
+        return True
+
+    async def _gemini_search(self, args: Dict[str, Any], screen_width: int, screen_height: int) -> bool:
+        """Type a search query into the focused box and submit."""
+        # Handle search action (type in search box)
+        query = args.get("query", "")
+        logger.info(f"[{self.correlation_id}] Search query: {query}")
+        # Note: This assumes focus is already on search box
+        await self.page.keyboard.type(query)
+        await self.page.keyboard.press("Enter")
+        self._log_action({"action": "search", "query": query})
+        return True
+
+    # Gemini action name -> handler; consulted by execute_computer_use_action
+    _GEMINI_ACTIONS: Dict[str, Callable[..., Awaitable[bool]]] = {
+        "click_at": _gemini_click_at,
+        "type_text_at": _gemini_type_text_at,
+        "hover_at": _gemini_hover_at,
+        "scroll_document": _gemini_scroll_document,
+        "scroll_at": _gemini_scroll_at,
+        "navigate": _gemini_navigate,
+        "key_combination": _gemini_key_combination,
+        "go_back": _gemini_go_back,
+        "go_forward": _gemini_go_forward,
+        "drag_and_drop": _gemini_drag_and_drop,
+        "wait_5_seconds": _gemini_wait_5_seconds,
+        "open_web_browser": _gemini_open_web_browser,
+        "search": _gemini_search,
+    }
 
     async def execute_gemini_action(self, action: Dict[str, Any]) -> bool:
         """Legacy method for old JSON-based actions (kept for backwards compatibility)"""
@@ -1476,6 +2033,57 @@ class BrowserAutomation:
             logger.error(f"Unknown legacy action: {action_type}")
             return False
 
+    def _completion_patterns(
+        self,
+        platform_config: Optional[Dict[str, Any]]
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Get the lowercased (success, blocked) patterns for the completion scan.
+
+        Platform indicators come first, followed by the generic fallbacks.
+        The result is cached for the most recent platform_config, so patterns
+        are lowercased once per config rather than on every iteration.
+        """
+        cached = self._completion_patterns_cache
+        if cached is not None and cached[0] is platform_config:
+            return cached[1], cached[2]
+
+        config = platform_config or {}
+        success = tuple(
+            p.lower() for p in config.get("success_indicators", [])
+        ) + COMPLETION_SUCCESS_PATTERNS
+        blocked = tuple(
+            p.lower()
+            for p in (*config.get("blocked_indicators", []), *config.get("failure_indicators", []))
+        ) + COMPLETION_BLOCKED_PATTERNS
+
+        self._completion_patterns_cache = (platform_config, success, blocked)
+        return success, blocked
+
+    def _scan_completion_patterns(
+        self,
+        page_text: str,
+        platform_config: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Scan page text for completion patterns.
+
+        One lowercase copy of the page, then plain substring checks: for a few
+        dozen literal patterns these beat regex alternations (case-insensitive
+        ones especially) by an order of magnitude in CPython.
+
+        Returns:
+            (success_pattern, blocked_pattern) - the first match of each, or None
+        """
+        success_patterns, blocked_patterns = self._completion_patterns(platform_config)
+        page_text_lower = page_text.lower()
+
+        success = next((p for p in success_patterns if p in page_text_lower), None)
+        if success:
+            return success, None
+        blocked = next((p for p in blocked_patterns if p in page_text_lower), None)
+        return None, blocked
+
     async def _check_task_completion(self, platform_config: Optional[Dict[str, Any]] = None) -> Tuple[bool, bool, List[Dict[str, Any]]]:
         """
         Consolidated check for task completion (success, failure, or blocked).
@@ -1483,77 +2091,50 @@ class BrowserAutomation:
         Returns:
             (is_complete, is_success, action_log)
         """
+        # One page read shared by every check below
+        indicators = await self._evaluate_page()
+
         # Check for failure/blocked indicators
-        failure_indicator = await self._check_failure_state()
+        failure_indicator = indicators["failure"]
         if failure_indicator:
             logger.error(f"Submission failed - detected: '{failure_indicator}'")
-            await self._capture_page_state()
-            await self.close_browser()
+            await self._finish_run()
             return True, False, self.action_log
 
-        blocked_indicator = await self._check_blocked_state()
+        blocked_indicator = indicators["blocked"]
         if blocked_indicator:
             logger.error(f"Project blocked - detected: '{blocked_indicator}'")
-            await self._capture_page_state()
-            await self.close_browser()
+            await self._finish_run()
             return True, False, self.action_log
 
         # Check for success indicators
-        success_indicator = await self._check_success_state()
+        success_indicator = indicators["success"]
         if success_indicator:
             logger.success(f"Submission success detected: '{success_indicator}'")
-            await self._capture_page_state()
-            await self.close_browser()
+            await self._finish_run(completed=True)
             return True, True, self.action_log
         
         # Check workflow stage
-        stage = await self._detect_workflow_stage()
-        if stage == "completion":
+        if indicators["stage"] == "completion":
             logger.success("Workflow completion stage detected")
-            await self._capture_page_state()
-            await self.close_browser()
+            await self._finish_run(completed=True)
             return True, True, self.action_log
 
         # Enhanced platform-aware checks
         try:
-            # Platform-specific success detection
-            success_patterns = []
-            if platform_config:
-                success_patterns.extend(platform_config.get("success_indicators", []))
-
-            # Fallback to generic success patterns
-            success_patterns.extend([
-                "thanks, you're all set", "application received", "successfully submitted",
-                "submission confirmed", "you're all set", "thank you for applying"
-            ])
-
-            page_text = await self.page.text_content('body') or ""
-            page_text_lower = page_text.lower()
-
-            for pattern in success_patterns:
-                if pattern.lower() in page_text_lower:
-                    logger.success(f"SUCCESS detected via pattern: '{pattern}' - task completed!")
-                    await self._capture_page_state()
-                    await self.close_browser()
-                    return True, True, self.action_log
+            page_text = indicators["text"] or ""
+            success_pattern, blocked_pattern = self._scan_completion_patterns(page_text, platform_config)
+
+            if success_pattern:
+                logger.success(f"SUCCESS detected via pattern: '{success_pattern}' - task completed!")
+                await self._finish_run(completed=True)
+                return True, True, self.action_log
 
             # Check for blocked/failure states
-            blocked_patterns = []
-            if platform_config:
-                blocked_patterns.extend(platform_config.get("blocked_indicators", []))
-                blocked_patterns.extend(platform_config.get("failure_indicators", []))
-
-            blocked_patterns.extend([
-                "already declined", "already applied", "project expired",
-                "no longer available", "invitation has expired"
-            ])
-
-            for pattern in blocked_patterns:
-                if pattern.lower() in page_text_lower:
-                    logger.info(f"BLOCKED state detected via pattern: '{pattern}' - stopping appropriately")
-                    await self._capture_page_state()
-                    await self.close_browser()
-                    return True, True, self.action_log  # Graceful exit
+            if blocked_pattern:
+                logger.info(f"BLOCKED state detected via pattern: '{blocked_pattern}' - stopping appropriately")
+                await self._finish_run(completed=True)
+                return True, True, self.action_log  # Graceful exit
 
         except Exception as e:
             logger.debug(f"Enhanced success check error (non-fatal): {e}")
@@ -1583,8 +2164,6 @@ class BrowserAutomation:
         Returns:
             (success, action_log)
         """
-        success = False  # Initialize success status
-
         # Enhanced intelligent termination for agentic loop
         if platform_config and platform_config.get("enable_intelligent_termination"):
             logger.info("Using enhanced success detection patterns for intelligent termination")
@@ -1592,36 +2171,18 @@ class BrowserAutomation:
             logger.error("Gemini client not configured. Set GOOGLE_API_KEY or GEMINI_API_KEY.")
             return False, []
 
-        # Task prompt prefix with verification and UI guidance
-        task_prefix = """IMPORTANT INSTRUCTIONS FOR FORM FILLING:
-
-1.  After each action, verify the outcome from the new screenshot.
-2.  If an action failed, try an alternative approach.
-3.  For dropdowns (<select> elements), first `click_at` to open it, then `type_text_at` with the exact option text you want to select.
-4.  For checkboxes and radio buttons, `click_at` the center of the element.
-5.  Use keyboard shortcuts (`key_combination`) for reliability, like 'Enter' to submit forms.
-
-**CRITICAL - Yes/No Questions:**
-- Before clicking Yes or No, READ THE BUTTON TEXT carefully from the screenshot
-- Yes buttons are typically on the LEFT side, No/Decline buttons on the RIGHT
-- VERIFY the button coordinates hit the CORRECT button - clicking wrong can decline the project irreversibly
-- If unsure which button is which, take a screenshot first and examine button positions
-- For compliance questions asking if you can participate, you almost always want "Yes"
-
-TASK:
-"""
-        enhanced_task = task_prefix + task + "\n\n" + verification_prompt
+        enhanced_task = GEMINI_TASK_PREFIX + task + "\n\n" + verification_prompt
 
+        self._run_finished = False
         try:
             await self.start_browser(headless=False, user_data_dir=self.user_data_dir)
             await self.page.goto(url)
             
-            # Initial navigation verification
-            page_content = await self.page.content()
-            if "Something didn't go right" in page_content:
+            # Initial navigation verification (rendered text, not serialized HTML)
+            page_text = await self._page_text()
+            if "Something didn't go right" in page_text:
                 logger.error("Initial navigation failed: landed on an error page.")
-                await self._capture_page_state()
-                await self.close_browser()
+                await self._finish_run()
                 return False, [{"error": "Initial navigation failed: landed on an error page."}]
             
             # Extract and log project ID from URL
@@ -1643,28 +2204,14 @@ TASK:
             
             logger.info(f"Started Gemini Computer Use task: {task}")
 
-            # Model ID for Computer Use - per https://ai.google.dev/gemini-api/docs/computer-use
-            MODEL = "gemini-2.5-computer-use-preview-10-2025"
-
-            # Configure Computer Use tool
-            config = types.GenerateContentConfig(
-                tools=[types.Tool(
-                    computer_use=types.ComputerUse(
-                        environment=types.Environment.ENVIRONMENT_BROWSER,
-                    )
-                )],
-                thinking_config=types.ThinkingConfig(include_thoughts=True),
-            )
-
             # Initial screenshot
-            initial_screenshot = await self.take_screenshot()
+            initial_screenshot = await self.take_screenshot("jpeg", SCREENSHOT_JPEG_QUALITY)
 
             # Pre-submission validation - check if consultation is available
             blocked_indicator = await self._check_blocked_state()
             if blocked_indicator:
                 logger.error(f"Consultation not available - detected: '{blocked_indicator}'")
-                await self._capture_page_state()
-                await self.close_browser()
+                await self._finish_run()
                 return False, [f"Consultation blocked: {blocked_indicator}"]
 
 
@@ -1674,24 +2221,25 @@ TASK:
                     role="user",
                     parts=[
                         Part(text=enhanced_task),
-                        Part.from_bytes(data=initial_screenshot, mime_type="image/png")
+                        Part.from_bytes(data=initial_screenshot, mime_type="image/jpeg")
                     ]
                 )
             ]
 
             # How many times to retry a completely empty Gemini response per iteration
             max_empty_retries = int(os.getenv("GEMINI_MAX_EMPTY_RETRIES", "2"))
+            # Function-response turns that keep their screenshot (older ones are re-sent without it)
+            screenshot_turns_to_keep = int(os.getenv("GEMINI_SCREENSHOT_TURNS_TO_KEEP", "3"))
 
             # Agent loop: send request → get function_call → execute → return screenshot
             for iteration in range(max_iterations):
                 logger.info(f"Gemini iteration {iteration + 1}/{max_iterations}")
 
-                # Check for blocked state at start of each iteration
-                blocked_indicator = await self._check_blocked_state()
+                # Check for blocked state at iteration start (periodically or on URL change)
+                blocked_indicator = await self._check_blocked_state() if self._blocked_check_due(iteration) else None
                 if blocked_indicator:
                     logger.error(f"Project blocked detected at iteration start: '{blocked_indicator}'")
-                    await self._capture_page_state()
-                    await self.close_browser()
+                    await self._finish_run()
                     return False, [f"Project blocked: {blocked_indicator}"]
 
                 response = None
@@ -1709,11 +2257,13 @@ TASK:
                 # Enhanced retry loop with exponential backoff
                 for attempt in range(max_empty_retries + 1):
                     try:
-                        response = self.gemini_client.models.generate_content(
-                            model=MODEL,
-                            contents=contents,
-                            config=config,
-                        )
+                        async with LLM_SEMAPHORE:
+                            # Async client: the event loop keeps serving CDP events during the request
+                            response = await self.gemini_client.aio.models.generate_content(
+                                model=GEMINI_COMPUTER_USE_MODEL,
+                                contents=contents,
+                                config=GEMINI_COMPUTER_USE_CONFIG,
+                            )
 
                         # Phase 3: Enhanced response validation
                         if await self.validate_gemini_response(response, iteration + 1):
@@ -1723,6 +2273,8 @@ TASK:
                             self.track_computer_use_operation(success=False, method="gemini")
 
                     except Exception as api_error:
+                        if isinstance(api_error, genai_errors.ClientError) and api_error.code in GEMINI_FATAL_STATUS_CODES:
+                            raise FatalSubmissionError(f"Gemini API rejected the request: {api_error}") from api_error
                         logger.error(f"[{self.correlation_id}] Gemini API error at iteration {iteration + 1}, attempt {attempt + 1}: {api_error}")
                         self.track_computer_use_operation(success=False, method="gemini")
 
@@ -1732,6 +2284,11 @@ TASK:
                         f"attempt {attempt + 1}/{max_empty_retries + 1})"
                     )
 
+                    # Empty responses usually mean upstream overload - back off before asking again
+                    if attempt < max_empty_retries:
+                        delay = min(GEMINI_RETRY_BASE_DELAY * 2 ** attempt, GEMINI_RETRY_MAX_DELAY)
+                        await asyncio.sleep(delay + random.uniform(0, GEMINI_RETRY_JITTER))
+
                 # After retries, check if we can recover or should use Claude fallback
                 if not response or not await self.validate_gemini_response(response, iteration + 1):
                     error_details = f"No usable response from Gemini after {max_empty_retries + 1} attempts at iteration {iteration + 1}"
@@ -1759,11 +2316,12 @@ TASK:
 
                 # Process each part of the response
                 has_function_call = False
-                function_responses = []
+                # (name, response, executed) per call, in call order
+                call_results: List[Tuple[str, Dict[str, Any], bool]] = []
 
-                logger.debug(f"Response parts count: {len(candidate.content.parts)}")
+                logger.debug("Response parts count: {}", len(candidate.content.parts))
                 for i, part in enumerate(candidate.content.parts):
-                    logger.debug(f"Part {i}: {type(part)}")
+                    logger.debug("Part {}: {}", i, type(part))
 
                     # Check if this is a function call (action to execute)
                     if hasattr(part, 'function_call') and part.function_call:
@@ -1771,7 +2329,7 @@ TASK:
                         func_call = part.function_call
 
                         logger.info(f"Function call {i}: {func_call.name}")
-                        logger.debug(f"Args: {func_call.args}")
+                        logger.debug("Args: {}", func_call.args)
 
                         # Check for safety decision in function call
                         args_dict = dict(func_call.args) if func_call.args else {}
@@ -1785,16 +2343,11 @@ TASK:
                             if decision_type == 'block':
                                 logger.error(f"Action blocked by safety system: {func_call.name} - {explanation}")
                                 # Skip this action, add error response
-                                function_responses.append(
-                                    types.FunctionResponse(
-                                        name=func_call.name,
-                                        response={
-                                            "success": False,
-                                            "error": f"Blocked by safety system: {explanation}",
-                                            "url": self.page.url
-                                        }
-                                    )
-                                )
+                                call_results.append((func_call.name, {
+                                    "success": False,
+                                    "error": f"Blocked by safety system: {explanation}",
+                                    "url": self.page.url
+                                }, False))
                                 continue  # Skip execution
                             elif decision_type == 'require_confirmation':
                                 logger.warning(f"Auto-allowing risky action (non-interactive): {func_call.name} - {explanation}")
@@ -1802,15 +2355,21 @@ TASK:
                                 logger.info(f"Safety decision: {decision_type}")
                                 logger.debug(f"Explanation: {explanation}")
 
+                        if self._race_lost():
+                            logger.info(f"[{self.correlation_id}] Racing engine finished first - stopping before {func_call.name}")
+                            await self._finish_run()
+                            return False, self.action_log
+
+                        # Let the page settle between actions of the same turn
+                        if any(executed for _, _, executed in call_results):
+                            await self._settle()
+
                         # Execute the action via Playwright
                         success = await self.execute_computer_use_action(
                             func_call.name,
                             args_dict
                         )
 
-                        # Take new screenshot after action
-                        new_screenshot = await self.take_screenshot()
-
                         # Build function response
                         response_data = {
                             "success": success,
@@ -1825,65 +2384,66 @@ TASK:
                         if safety_decision:
                             response_data["safety_acknowledgement"] = "true"
 
-                        # Create function response with screenshot
-                        function_responses.append(
-                            types.FunctionResponse(
-                                name=func_call.name,
-                                response=response_data,
-                                parts=[types.FunctionResponsePart(
-                                    inline_data=types.FunctionResponseBlob(
-                                        mime_type="image/png",
-                                        data=new_screenshot
-                                    )
-                                )]
-                            )
-                        )
-
-                        # Brief pause between actions
-                        await asyncio.sleep(0.5)
+                        call_results.append((func_call.name, response_data, True))
 
                     # Check for text response (task completion)
                     elif hasattr(part, 'text') and part.text:
                         logger.info(f"Gemini text response: {part.text[:200]}")
 
+                # One screenshot after the turn's actions, shared by every executed call's response
+                screenshot_parts = None
+                if any(executed for _, _, executed in call_results):
+                    new_screenshot = await self.take_screenshot("jpeg", SCREENSHOT_JPEG_QUALITY)
+                    screenshot_parts = [types.FunctionResponsePart(
+                        inline_data=types.FunctionResponseBlob(
+                            mime_type="image/jpeg",
+                            data=new_screenshot
+                        )
+                    )]
+                function_responses = [
+                    types.FunctionResponse(
+                        name=name,
+                        response=response_data,
+                        parts=screenshot_parts if executed else None
+                    )
+                    for name, response_data, executed in call_results
+                ]
+
                 # If no function calls, model is done
                 if not has_function_call:
                     logger.info("Gemini stopped making actions - validating submission")
 
+                    # One page read shared by the checks below
+                    indicators = await self._evaluate_page()
+
                     # Check for failure/blocked indicators
-                    failure_indicator = await self._check_failure_state()
+                    failure_indicator = indicators["failure"]
                     if failure_indicator:
                         logger.error(f"Submission failed - detected: '{failure_indicator}'")
-                        await self._capture_page_state()
-                        await self.close_browser()
+                        await self._finish_run()
                         return False, self.action_log
 
-                    blocked_indicator = await self._check_blocked_state()
+                    blocked_indicator = indicators["blocked"]
                     if blocked_indicator:
                         logger.error(f"Project blocked - detected: '{blocked_indicator}'")
-                        await self._capture_page_state()
-                        await self.close_browser()
+                        await self._finish_run()
                         return False, self.action_log
 
                     # Check for success indicators
-                    success_indicator = await self._check_success_state()
+                    success_indicator = indicators["success"]
                     if success_indicator:
                         logger.success(f"Submission success detected: '{success_indicator}'")
-                        await self._capture_page_state()
-                        await self.close_browser()
+                        await self._finish_run(completed=True)
                         return True, self.action_log
                     
                     # Check workflow stage - if we're at completion stage, it's success
-                    stage = await self._detect_workflow_stage()
-                    if stage == "completion":
+                    if indicators["stage"] == "completion":
                         logger.success("Workflow completion stage detected")
-                        await self._capture_page_state()
-                        await self.close_browser()
+                        await self._finish_run(completed=True)
                         return True, self.action_log
 
                     logger.warning("Task completed but no success confirmation found - marking as failure")
-                    await self._capture_page_state()
-                    await self.close_browser()
+                    await self._finish_run()
                     return False, self.action_log
 
                 # Add function responses to conversation
@@ -1899,63 +2459,50 @@ TASK:
                             parts=function_response_parts
                         )
                     )
+                    self._strip_old_gemini_screenshots(contents, screenshot_turns_to_keep)
 
                 # Enhanced intelligent success detection (platform-aware, agentic)
                 try:
-                    # Platform-specific success detection
-                    success_patterns = []
-                    if platform_config:
-                        # Use platform-specific success indicators
-                        success_patterns.extend(platform_config.get("success_indicators", []))
-
-                    # Fallback to generic success patterns
-                    success_patterns.extend([
-                        "thanks, you're all set", "application received", "successfully submitted",
-                        "submission confirmed", "you're all set", "thank you for applying"
-                    ])
-
                     # Check for success patterns in page text (intelligent detection)
-                    page_text = await self.page.text_content('body') or ""
-                    page_text_lower = page_text.lower()
+                    page_text = await self._page_text()
+                    success_pattern, blocked_pattern = self._scan_completion_patterns(page_text, platform_config)
 
-                    for pattern in success_patterns:
-                        if pattern.lower() in page_text_lower:
-                            logger.success(f"SUCCESS detected via pattern: '{pattern}' - task completed!")
-                            await self._capture_page_state()
-                            await self.close_browser()
-                            return True, self.action_log
+                    if success_pattern:
+                        logger.success(f"SUCCESS detected via pattern: '{success_pattern}' - task completed!")
+                        await self._finish_run(completed=True)
+                        return True, self.action_log
 
                     # Check for blocked/failure states (intelligent early termination)
-                    blocked_patterns = []
-                    if platform_config:
-                        blocked_patterns.extend(platform_config.get("blocked_indicators", []))
-                        blocked_patterns.extend(platform_config.get("failure_indicators", []))
-
-                    # Default blocked patterns
-                    blocked_patterns.extend([
-                        "already declined", "already applied", "project expired",
-                        "no longer available", "invitation has expired"
-                    ])
-
-                    for pattern in blocked_patterns:
-                        if pattern.lower() in page_text_lower:
-                            logger.info(f"BLOCKED state detected via pattern: '{pattern}' - stopping appropriately")
-                            await self._capture_page_state()
-                            await self.close_browser()
-                            return True, self.action_log  # Return True since we correctly detected blocked state
+                    if blocked_pattern:
+                        logger.info(f"BLOCKED state detected via pattern: '{blocked_pattern}' - stopping appropriately")
+                        await self._finish_run(completed=True)
+                        return True, self.action_log  # Return True since we correctly detected blocked state
+
+                    # Full blocked indicators ("position filled", "deadline passed", ...), as the
+                    # iteration-start check would find them; _blocked_check_due relies on this
+                    blocked_indicator = self._page_indicators(page_text)["blocked"]
+                    if blocked_indicator:
+                        logger.error(f"Project blocked detected after actions: '{blocked_indicator}'")
+                        await self._finish_run()
+                        return False, [f"Project blocked: {blocked_indicator}"]
 
                 except Exception as e:
                     logger.debug(f"Enhanced success check error (non-fatal): {e}")
 
             logger.warning(f"Max iterations ({max_iterations}) reached")
-            await self._capture_page_state()
-            await self.close_browser()
+            await self._finish_run()
+            return False, self.action_log
+
+        except FatalSubmissionError:
+            raise
+
+        except Exception as e:
+            logger.error(f"[{self.correlation_id}] Gemini computer use run failed: {e}")
             return False, self.action_log
 
         finally:
-            await self._capture_page_state()
-            await self.close_browser()
-            return success, self.action_log
+            # No-op when the run already captured state and closed on its way out
+            await self._finish_run()
 
     async def execute_claude_action(self, action: str, params: Dict[str, Any]) -> bool:
         """
@@ -1977,322 +2524,355 @@ TASK:
         - left_click_drag(coordinate: [x, y], to_coordinate: [x2, y2])
         - wait(duration: float)
         """
-        try:
-            if action == "screenshot":
-                # Screenshot handled in main loop
-                logger.info("Screenshot action (handled in loop)")
-                return True
+        if isinstance(action, str):
+            action = sys.intern(action)
 
-            elif action == "left_click":
-                x, y = params["coordinate"]
-
-                # Check if we've clicked this location recently (within 20px tolerance)
-                tolerance = 20
-                recent_clicks_at_location = sum(
-                    1 for px, py in self._click_history[-5:]
-                    if abs(px - x) < tolerance and abs(py - y) < tolerance
-                )
-                
-                # Track this click
-                self._click_history.append((x, y))
-                if len(self._click_history) > 10:
-                    self._click_history = self._click_history[-10:]
-                
-                # Use JS fallback if we've clicked same spot multiple times
-                if recent_clicks_at_location >= self._click_fallback_threshold:
-                    logger.warning(f"Claude: Detected {recent_clicks_at_location} repeated clicks at ({x}, {y}), using JS fallback")
-                    if await self._js_click_fallback(x, y):
-                        self._log_action({"action": "left_click", "x": x, "y": y, "method": "js_fallback"})
-                        return True
-                    logger.warning(f"[{self.correlation_id}] Claude: JS fallback failed, trying normal click anyway")
-
-                # Simply click - let Claude handle dropdowns via keyboard or type action
-                await self.page.mouse.click(x, y)
-                logger.info(f"[{self.correlation_id}] Claude: Clicked at ({x}, {y})")
+        handler = self._CLAUDE_ACTIONS.get(action)
+        if handler is None:
+            logger.warning(f"[{self.correlation_id}] Unknown Claude action: {action}")
+            return False
 
-                self._log_action({"action": "left_click", "x": x, "y": y})
-                return True
+        try:
+            return await handler(self, params)
+        except Exception as e:
+            logger.exception(f"[{self.correlation_id}] Error executing Claude action {action}: {e}")
+            return False
 
-            elif action == "type":
-                text = params["text"]
+    async def _claude_screenshot(self, params: Dict[str, Any]) -> bool:
+        """Screenshot is captured by the agent loop after every action."""
+        # Screenshot handled in main loop
+        logger.info("Screenshot action (handled in loop)")
+        return True
 
-                # Check if we're typing into a focused select element
-                # Get current focused element position and try smart select
-                try:
-                    focused_pos = await self.page.evaluate("""
-                        (function() {
-                            const elem = document.activeElement;
-                            if (elem) {
-                                const rect = elem.getBoundingClientRect();
-                                return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
-                            }
-                            return null;
-                        })()
-                    """)
+    async def _claude_left_click(self, params: Dict[str, Any]) -> bool:
+        """Left-click at pixel coordinates, switching to the JS fallback on repeated clicks."""
+        x, y = params["coordinate"]
 
-                    if focused_pos and await self._smart_select_option(int(focused_pos['x']), int(focused_pos['y']), text):
-                        logger.info(f"[{self.correlation_id}] Claude: Smart selected dropdown: {text[:50]}...")
-                        self._log_action({"action": "select_option", "text": text})
-                        return True
-                except Exception as e:
-                    logger.debug(f"[{self.correlation_id}] Smart select check failed: {e}")
-
-                # If smart select wasn't used, perform a triple click to select existing text/placeholder
-                # This uses the position where the element was detected, or a default if not found
-                if focused_pos:
-                    await self.page.mouse.click(int(focused_pos['x']), int(focused_pos['y']), click_count=3)
-                    await asyncio.sleep(0.2)
-
-                # Normal typing
-                await self.page.keyboard.type(text)
-                logger.info(f"[{self.correlation_id}] Claude: Typed text: {text[:50]}...")
-                self._log_action({"action": "type", "text": text})
-                return True
+        # Check if we've clicked this location recently
+        recent_clicks_at_location = self._count_recent_clicks_near(x, y)
 
-            elif action == "key":
-                # Claude format: "ctrl+s", "Enter", or "Meta+a". Can also be multiple keys like "Tab Tab"
-                keys_string = params["text"]
-
-                # Map common key names to Playwright format
-                key_mapping = {
-                    # Arrow keys
-                    "Down": "ArrowDown",
-                    "Up": "ArrowUp",
-                    "Left": "ArrowLeft",
-                    "Right": "ArrowRight",
-                    # Special keys
-                    "Return": "Enter",
-                    "Esc": "Escape",
-                    "space": " ",  # Space key
-                    # Modifier keys (Claude sends lowercase)
-                    "ctrl": "Control",
-                    "control": "Control",
-                    "alt": "Alt",
-                    "super": "Meta",
-                    "meta": "Meta",
-                    "cmd": "Meta",
-                    "shift": "Shift",
-                    # Common navigation/editing keys
-                    "tab": "Tab",
-                    "Tab": "Tab",
-                    "backspace": "Backspace",
-                    "Backspace": "Backspace",
-                    "delete": "Delete",
-                    "Delete": "Delete",
-                    "escape": "Escape",
-                    "enter": "Enter",
-                    "Enter": "Enter",
-                    "home": "Home",
-                    "end": "End",
-                    "pageup": "PageUp",
-                    "pagedown": "PageDown",
-                }
+        # Track this click (deque evicts the oldest beyond 10)
+        self._click_history.append((x, y))
 
-                # Split string to handle multiple key presses
-                keys_to_press = keys_string.split()
-                
-                # Context info to return for tool output (especially useful for Tab navigation)
-                focused_element_info = None
-
-                for key in keys_to_press:
-                    mapped_key = key_mapping.get(key, key)
-                    await self.page.keyboard.press(mapped_key)
-                    logger.info(f"[{self.correlation_id}] Claude: Pressed key: {mapped_key} (original: {key})")
-                    # Small delay between key presses if multiple are sent
-                    if len(keys_to_press) > 1:
-                        await asyncio.sleep(0.1)
-
-                self._log_action({"action": "key", "text": keys_string})
-                
-                # If the action involved navigation keys (Tab, Arrows), capture focus state
-                if any(k.lower() in ["tab", "arrowdown", "arrowup", "enter"] for k in keys_to_press):
-                    try:
-                        focused_element_info = await self.page.evaluate("""
-                            () => {
-                                const el = document.activeElement;
-                                if (!el || el === document.body) return "No specific element focused";
-                                
-                                const tag = el.tagName;
-                                const type = el.type || '';
-                                const text = (el.innerText || el.value || el.placeholder || '').substring(0, 50).replace(/\\n/g, ' ');
-                                const label = el.labels && el.labels[0] ? el.labels[0].innerText : '';
-                                const ariaLabel = el.getAttribute('aria-label') || '';
-                                
-                                return `Focused: <${tag} type="${type}"> Text: "${text}" Label: "${label}" Aria: "${ariaLabel}"`;
-                            }
-                        """)
-                        logger.info(f"[{self.correlation_id}] Focus state after keys: {focused_element_info}")
-                    except Exception as e:
-                        logger.debug(f"Failed to get focus state: {e}")
-                
-                # Return focus info if available (this will be part of the tool result message)
-                if focused_element_info:
-                    return focused_element_info
-                    
+        # Use JS fallback if we've clicked same spot multiple times
+        if recent_clicks_at_location >= self._click_fallback_threshold:
+            logger.warning(f"Claude: Detected {recent_clicks_at_location} repeated clicks at ({x}, {y}), using JS fallback")
+            if await self._js_click_fallback(x, y):
+                self._log_action({"action": "left_click", "x": x, "y": y, "method": "js_fallback"})
                 return True
+            logger.warning(f"[{self.correlation_id}] Claude: JS fallback failed, trying normal click anyway")
 
-            elif action == "mouse_move":
-                x, y = params["coordinate"]
-                await self.page.mouse.move(x, y)
-                logger.info(f"[{self.correlation_id}] Claude: Moved mouse to ({x}, {y})")
-                self._log_action({"action": "mouse_move", "x": x, "y": y})
-                return True
+        # Simply click - let Claude handle dropdowns via keyboard or type action
+        await self._cdp_click(x, y)
+        logger.info(f"[{self.correlation_id}] Claude: Clicked at ({x}, {y})")
 
-            elif action == "scroll":
-                x, y = params["coordinate"]
-                direction = params.get("scroll_direction", "down")
-                amount = params.get("scroll_amount", 3)
+        self._log_action({"action": "left_click", "x": x, "y": y})
+        return True
 
-                # Move mouse to position first
-                await self.page.mouse.move(x, y)
+    async def _claude_type(self, params: Dict[str, Any]) -> bool:
+        """Type text into the focused element, using smart select for dropdowns."""
+        text = params["text"]
+        focused_pos = None
 
-                # Convert amount to pixels (Claude uses scroll units, ~100px per unit)
-                delta = amount * 100
-                if direction == "down":
-                    await self.page.mouse.wheel(0, delta)
-                else:
-                    await self.page.mouse.wheel(0, -delta)
+        # Check if we're typing into a focused select element
+        # Get current focused element position and try smart select
+        try:
+            focused_pos = await self.page.evaluate("window.__consult_focus_pos()")
 
-                logger.info(f"[{self.correlation_id}] Claude: Scrolled {direction} by {amount} units at ({x}, {y})")
-                self._log_action({"action": "scroll", "x": x, "y": y, "direction": direction, "amount": amount})
+            if focused_pos and await self._smart_select_option(int(focused_pos['x']), int(focused_pos['y']), text):
+                logger.info(f"[{self.correlation_id}] Claude: Smart selected dropdown: {text[:50]}...")
+                self._log_action({"action": "select_option", "text": text})
                 return True
+        except Exception as e:
+            logger.debug(f"[{self.correlation_id}] Smart select check failed: {e}")
+
+        # If smart select wasn't used, perform a triple click to select existing text/placeholder
+        # This uses the position where the element was detected, or a default if not found
+        if focused_pos:
+            await self._cdp_click(int(focused_pos['x']), int(focused_pos['y']), click_count=3)
+            await self._settle()
+
+        # Normal typing
+        await self.page.keyboard.type(text)
+        logger.info(f"[{self.correlation_id}] Claude: Typed text: {text[:50]}...")
+        self._log_action({"action": "type", "text": text})
+        return True
+
+    async def _claude_key(self, params: Dict[str, Any]) -> Union[bool, str]:
+        """Press one or more keys, returning the focused element for navigation keys."""
+        # Claude format: "ctrl+s", "Enter", or "Meta+a". Can also be multiple keys like "Tab Tab"
+        keys_string = params["text"]
+
+        # Map common key names to Playwright format
+        key_mapping = {
+            # Arrow keys
+            "Down": "ArrowDown",
+            "Up": "ArrowUp",
+            "Left": "ArrowLeft",
+            "Right": "ArrowRight",
+            # Special keys
+            "Return": "Enter",
+            "Esc": "Escape",
+            "space": " ",  # Space key
+            # Modifier keys (Claude sends lowercase)
+            "ctrl": "Control",
+            "control": "Control",
+            "alt": "Alt",
+            "super": "Meta",
+            "meta": "Meta",
+            "cmd": "Meta",
+            "shift": "Shift",
+            # Common navigation/editing keys
+            "tab": "Tab",
+            "Tab": "Tab",
+            "backspace": "Backspace",
+            "Backspace": "Backspace",
+            "delete": "Delete",
+            "Delete": "Delete",
+            "escape": "Escape",
+            "enter": "Enter",
+            "Enter": "Enter",
+            "home": "Home",
+            "end": "End",
+            "pageup": "PageUp",
+            "pagedown": "PageDown",
+        }
 
-            elif action == "right_click":
-                x, y = params["coordinate"]
-                await self.page.mouse.click(x, y, button="right")
-                logger.info(f"[{self.correlation_id}] Claude: Right-clicked at ({x}, {y})")
-                self._log_action({"action": "right_click", "x": x, "y": y})
-                return True
+        # Split string to handle multiple key presses
+        keys_to_press = keys_string.split()
 
-            elif action == "middle_click":
-                x, y = params["coordinate"]
-                await self.page.mouse.click(x, y, button="middle")
-                logger.info(f"[{self.correlation_id}] Claude: Middle-clicked at ({x}, {y})")
-                self._log_action({"action": "middle_click", "x": x, "y": y})
-                return True
+        # Context info to return for tool output (especially useful for Tab navigation)
+        focused_element_info = None
 
-            elif action == "double_click":
-                x, y = params["coordinate"]
-                await self.page.mouse.dblclick(x, y)
-                logger.info(f"[{self.correlation_id}] Claude: Double-clicked at ({x}, {y})")
-                self._log_action({"action": "double_click", "x": x, "y": y})
-                return True
+        for key in keys_to_press:
+            mapped_key = key_mapping.get(key, key)
+            await self.page.keyboard.press(mapped_key)
+            logger.info(f"[{self.correlation_id}] Claude: Pressed key: {mapped_key} (original: {key})")
+            # Small delay between key presses if multiple are sent
+            if len(keys_to_press) > 1:
+                await asyncio.sleep(0.1)
 
-            elif action == "triple_click":
-                x, y = params["coordinate"]
-                # Playwright doesn't have triple-click, simulate with 3 clicks
-                await self.page.mouse.click(x, y, click_count=3)
-                logger.info(f"[{self.correlation_id}] Claude: Triple-clicked at ({x}, {y})")
-                self._log_action({"action": "triple_click", "x": x, "y": y})
-                return True
+        self._log_action({"action": "key", "text": keys_string})
 
-            elif action == "left_click_drag":
-                from_x, from_y = params["coordinate"]
-                to_x, to_y = params["to_coordinate"]
-                await self.page.mouse.move(from_x, from_y)
-                await self.page.mouse.down()
-                await self.page.mouse.move(to_x, to_y)
-                await self.page.mouse.up()
-                logger.info(f"[{self.correlation_id}] Claude: Dragged from ({from_x}, {from_y}) to ({to_x}, {to_y})")
-                self._log_action({"action": "left_click_drag", "from": (from_x, from_y), "to": (to_x, to_y)})
-                return True
+        # If the action involved navigation keys (Tab, Arrows), capture focus state
+        if any(k.lower() in ["tab", "arrowdown", "arrowup", "enter"] for k in keys_to_press):
+            try:
+                focused_element_info = await self.page.evaluate("window.__consult_focus_info()")
+                logger.info(f"[{self.correlation_id}] Focus state after keys: {focused_element_info}")
+            except Exception as e:
+                logger.debug(f"Failed to get focus state: {e}")
+
+        # Return focus info if available (this will be part of the tool result message)
+        if focused_element_info:
+            return focused_element_info
+
+        return True
+
+    async def _claude_mouse_move(self, params: Dict[str, Any]) -> bool:
+        """Move the mouse to pixel coordinates."""
+        x, y = params["coordinate"]
+        await self.page.mouse.move(x, y)
+        logger.info(f"[{self.correlation_id}] Claude: Moved mouse to ({x}, {y})")
+        self._log_action({"action": "mouse_move", "x": x, "y": y})
+        return True
+
+    async def _claude_scroll(self, params: Dict[str, Any]) -> bool:
+        """Scroll at pixel coordinates (Claude scroll units are ~100px)."""
+        x, y = params["coordinate"]
+        direction = params.get("scroll_direction", "down")
+        amount = params.get("scroll_amount", 3)
+
+        # Move mouse to position first
+        await self.page.mouse.move(x, y)
+
+        # Convert amount to pixels (Claude uses scroll units, ~100px per unit)
+        delta = amount * 100
+        if direction == "down":
+            await self.page.mouse.wheel(0, delta)
+        else:
+            await self.page.mouse.wheel(0, -delta)
+
+        logger.info(f"[{self.correlation_id}] Claude: Scrolled {direction} by {amount} units at ({x}, {y})")
+        self._log_action({"action": "scroll", "x": x, "y": y, "direction": direction, "amount": amount})
+        return True
+
+    async def _claude_right_click(self, params: Dict[str, Any]) -> bool:
+        """Right-click at pixel coordinates."""
+        x, y = params["coordinate"]
+        await self.page.mouse.click(x, y, button="right")
+        logger.info(f"[{self.correlation_id}] Claude: Right-clicked at ({x}, {y})")
+        self._log_action({"action": "right_click", "x": x, "y": y})
+        return True
+
+    async def _claude_middle_click(self, params: Dict[str, Any]) -> bool:
+        """Middle-click at pixel coordinates."""
+        x, y = params["coordinate"]
+        await self.page.mouse.click(x, y, button="middle")
+        logger.info(f"[{self.correlation_id}] Claude: Middle-clicked at ({x}, {y})")
+        self._log_action({"action": "middle_click", "x": x, "y": y})
+        return True
+
+    async def _claude_double_click(self, params: Dict[str, Any]) -> bool:
+        """Double-click at pixel coordinates."""
+        x, y = params["coordinate"]
+        await self._cdp_click(x, y, click_count=2)
+        logger.info(f"[{self.correlation_id}] Claude: Double-clicked at ({x}, {y})")
+        self._log_action({"action": "double_click", "x": x, "y": y})
+        return True
+
+    async def _claude_triple_click(self, params: Dict[str, Any]) -> bool:
+        """Triple-click at pixel coordinates."""
+        x, y = params["coordinate"]
+        await self._cdp_click(x, y, click_count=3)
+        logger.info(f"[{self.correlation_id}] Claude: Triple-clicked at ({x}, {y})")
+        self._log_action({"action": "triple_click", "x": x, "y": y})
+        return True
+
+    async def _claude_left_click_drag(self, params: Dict[str, Any]) -> bool:
+        """Drag from one pixel coordinate to another."""
+        from_x, from_y = params["coordinate"]
+        to_x, to_y = params["to_coordinate"]
+        await self._cdp_drag(from_x, from_y, to_x, to_y)
+        logger.info(f"[{self.correlation_id}] Claude: Dragged from ({from_x}, {from_y}) to ({to_x}, {to_y})")
+        self._log_action({"action": "left_click_drag", "from": (from_x, from_y), "to": (to_x, to_y)})
+        return True
+
+    async def _claude_wait(self, params: Dict[str, Any]) -> bool:
+        """Sleep for the requested duration."""
+        duration = params.get("duration", 1.0)
+        await asyncio.sleep(duration)
+        logger.info(f"[{self.correlation_id}] Claude: Waited {duration} seconds")
+        self._log_action({"action": "wait", "duration": duration})
+        return True
+
+    async def _claude_zoom(self, params: Dict[str, Any]) -> bool:
+        """View a screen region at full resolution (computer_20251124)."""
+        # View specific screen region at full resolution
+        region = params.get("region", [0, 0, 100, 100])
+        if len(region) == 4:
+            x1, y1, x2, y2 = region
+            # Take screenshot of specific region using Playwright's clip
+            clip_width = max(1, x2 - x1)
+            clip_height = max(1, y2 - y1)
+            zoomed_screenshot = await self.page.screenshot(
+                clip={"x": x1, "y": y1, "width": clip_width, "height": clip_height}
+            )
+            logger.info(f"[{self.correlation_id}] Claude: Zoomed into region ({x1}, {y1}) to ({x2}, {y2})")
+            self._log_action({"action": "zoom", "region": region})
+            # Note: The zoomed screenshot will be returned in the tool result
+            return True
+        else:
+            logger.warning(f"[{self.correlation_id}] Invalid zoom region format: {region}")
+            return False
 
-            elif action == "wait":
-                duration = params.get("duration", 1.0)
-                await asyncio.sleep(duration)
-                logger.info(f"[{self.correlation_id}] Claude: Waited {duration} seconds")
-                self._log_action({"action": "wait", "duration": duration})
-                return True
+    async def _claude_hold_key(self, params: Dict[str, Any]) -> bool:
+        """Hold a key down for use with other actions (computer_20251124)."""
+        # Hold a key down (for use with other actions)
+        key = params.get("key", "")
+        if key:
+            await self.page.keyboard.down(key)
+            logger.info(f"[{self.correlation_id}] Claude: Holding key: {key}")
+            self._log_action({"action": "hold_key", "key": key})
+            return True
+        else:
+            logger.warning(f"[{self.correlation_id}] hold_key action requires 'key' parameter")
+            return False
 
-            # New actions for computer_20251124 (Claude Opus 4.5)
-            elif action == "zoom":
-                # View specific screen region at full resolution
-                region = params.get("region", [0, 0, 100, 100])
-                if len(region) == 4:
-                    x1, y1, x2, y2 = region
-                    # Take screenshot of specific region using Playwright's clip
-                    clip_width = max(1, x2 - x1)
-                    clip_height = max(1, y2 - y1)
-                    zoomed_screenshot = await self.page.screenshot(
-                        clip={"x": x1, "y": y1, "width": clip_width, "height": clip_height}
-                    )
-                    logger.info(f"[{self.correlation_id}] Claude: Zoomed into region ({x1}, {y1}) to ({x2}, {y2})")
-                    self._log_action({"action": "zoom", "region": region})
-                    # Note: The zoomed screenshot will be returned in the tool result
-                    return True
-                else:
-                    logger.warning(f"[{self.correlation_id}] Invalid zoom region format: {region}")
-                    return False
-
-            elif action == "hold_key":
-                # Hold a key down (for use with other actions)
-                key = params.get("key", "")
-                if key:
-                    await self.page.keyboard.down(key)
-                    logger.info(f"[{self.correlation_id}] Claude: Holding key: {key}")
-                    self._log_action({"action": "hold_key", "key": key})
-                    return True
-                else:
-                    logger.warning(f"[{self.correlation_id}] hold_key action requires 'key' parameter")
-                    return False
-
-            elif action == "release_key":
-                # Release a held key
-                key = params.get("key", "")
-                if key:
-                    await self.page.keyboard.up(key)
-                    logger.info(f"[{self.correlation_id}] Claude: Released key: {key}")
-                    self._log_action({"action": "release_key", "key": key})
-                    return True
-                else:
-                    logger.warning(f"[{self.correlation_id}] release_key action requires 'key' parameter")
-                    return False
-
-            elif action == "left_mouse_down":
-                # Fine-grained mouse button down
-                x, y = params.get("coordinate", [0, 0])
-                await self.page.mouse.move(x, y)
-                await self.page.mouse.down()
-                logger.info(f"[{self.correlation_id}] Claude: Mouse down at ({x}, {y})")
-                self._log_action({"action": "left_mouse_down", "x": x, "y": y})
-                return True
+    async def _claude_release_key(self, params: Dict[str, Any]) -> bool:
+        """Release a held key (computer_20251124)."""
+        # Release a held key
+        key = params.get("key", "")
+        if key:
+            await self.page.keyboard.up(key)
+            logger.info(f"[{self.correlation_id}] Claude: Released key: {key}")
+            self._log_action({"action": "release_key", "key": key})
+            return True
+        else:
+            logger.warning(f"[{self.correlation_id}] release_key action requires 'key' parameter")
+            return False
 
-            elif action == "left_mouse_up":
-                # Fine-grained mouse button up
-                x, y = params.get("coordinate", [0, 0])
-                await self.page.mouse.move(x, y)
-                await self.page.mouse.up()
-                logger.info(f"[{self.correlation_id}] Claude: Mouse up at ({x}, {y})")
-                self._log_action({"action": "left_mouse_up", "x": x, "y": y})
-                return True
+    async def _claude_left_mouse_down(self, params: Dict[str, Any]) -> bool:
+        """Press the left mouse button at pixel coordinates (computer_20251124)."""
+        # Fine-grained mouse button down
+        x, y = params.get("coordinate", [0, 0])
+        await self.page.mouse.move(x, y)
+        await self.page.mouse.down()
+        logger.info(f"[{self.correlation_id}] Claude: Mouse down at ({x}, {y})")
+        self._log_action({"action": "left_mouse_down", "x": x, "y": y})
+        return True
+
+    async def _claude_left_mouse_up(self, params: Dict[str, Any]) -> bool:
+        """Release the left mouse button at pixel coordinates (computer_20251124)."""
+        # Fine-grained mouse button up
+        x, y = params.get("coordinate", [0, 0])
+        await self.page.mouse.move(x, y)
+        await self.page.mouse.up()
+        logger.info(f"[{self.correlation_id}] Claude: Mouse up at ({x}, {y})")
+        self._log_action({"action": "left_mouse_up", "x": x, "y": y})
+        return True
+
+    # Claude action name -> handler; consulted by execute_claude_action
+    _CLAUDE_ACTIONS: Dict[str, Callable[..., Awaitable[Union[bool, str]]]] = {
+        "screenshot": _claude_screenshot,
+        "left_click": _claude_left_click,
+        "type": _claude_type,
+        "key": _claude_key,
+        "mouse_move": _claude_mouse_move,
+        "scroll": _claude_scroll,
+        "right_click": _claude_right_click,
+        "middle_click": _claude_middle_click,
+        "double_click": _claude_double_click,
+        "triple_click": _claude_triple_click,
+        "left_click_drag": _claude_left_click_drag,
+        "wait": _claude_wait,
+        "zoom": _claude_zoom,
+        "hold_key": _claude_hold_key,
+        "release_key": _claude_release_key,
+        "left_mouse_down": _claude_left_mouse_down,
+        "left_mouse_up": _claude_left_mouse_up,
+    }
 
-            else:
-                logger.warning(f"[{self.correlation_id}] Unknown Claude action: {action}")
-                return False
+    def _append_user_turn(self, messages: List[Dict[str, Any]], content: List[Dict[str, Any]]):
+        """
+        Start a new task in a shared Claude conversation.
 
-        except Exception as e:
-            logger.error(f"[{self.correlation_id}] Error executing Claude action {action}: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+        The conversation is reset when it has grown past
+        CLAUDE_CONVERSATION_MAX_MESSAGES or ends in a tool_use without a result
+        (a run that stopped mid-action). Content is merged into a trailing user
+        turn so roles keep alternating.
+        """
+        if messages and messages[-1]["role"] == "assistant":
+            last_content = messages[-1]["content"]
+            if any(getattr(block, "type", None) == "tool_use" for block in last_content):
+                messages.clear()
+        if len(messages) > CLAUDE_CONVERSATION_MAX_MESSAGES:
+            logger.info(f"[{self.correlation_id}] Resetting shared Claude conversation ({len(messages)} messages)")
+            messages.clear()
+
+        if messages and messages[-1]["role"] == "user":
+            messages[-1]["content"].extend(content)
+        else:
+            messages.append({"role": "user", "content": content})
 
     def _inject_prompt_caching(self, messages: List[Dict[str, Any]]):
         """
         Set cache breakpoints for the 3 most recent turns.
         One cache breakpoint is left for tools/system prompt, to be shared across sessions.
+
+        Every older marker is cleared first, not just the one on each turn's last
+        block: a task merged into a trailing user turn leaves its previous marker
+        mid-turn, and the API rejects a request with more than 4 breakpoints.
         """
         breakpoints_remaining = 3
         for message in reversed(messages):
             if message["role"] == "user" and isinstance(message["content"], list):
+                for block in message["content"]:
+                    if isinstance(block, dict):
+                        block.pop("cache_control", None)
                 if breakpoints_remaining:
                     breakpoints_remaining -= 1
                     # Add cache control to the last content block
                     message["content"][-1]["cache_control"] = {"type": "ephemeral"}
-                else:
-                    # Remove cache control if it exists on older messages (shifting window)
-                    if isinstance(message["content"][-1], dict) and "cache_control" in message["content"][-1]:
-                        del message["content"][-1]["cache_control"]
-                    break
 
     def _maybe_filter_to_n_most_recent_images(
         self,
@@ -2336,13 +2916,35 @@ TASK:
                     new_content.append(content)
                 tool_result["content"] = new_content
 
+    def _strip_old_gemini_screenshots(self, contents: List[Content], turns_to_keep: int):
+        """
+        Drop screenshots from all but the last `turns_to_keep` function-response turns, in place.
+        The calls and their status responses stay, so the model keeps its action history.
+        """
+        seen = 0
+        for content in reversed(contents):
+            if content.role != "user" or not content.parts:
+                continue
+            responses = [part.function_response for part in content.parts if part.function_response]
+            if not responses:
+                continue
+            seen += 1
+            if seen <= turns_to_keep:
+                continue
+            if all(fr.parts is None for fr in responses):
+                break  # Stripped on an earlier iteration, as is everything before it
+            for fr in responses:
+                fr.parts = None
+
     async def claude_computer_use(
         self,
         task: str,
         url: str,
         max_iterations: int = 25,
         verification_prompt: str = "Verify that the application was successfully submitted.",
-        platform_config: Optional[Dict[str, Any]] = None
+        platform_config: Optional[Dict[str, Any]] = None,
+        system_context: Optional[str] = None,
+        conversation: Optional[List[Dict[str, Any]]] = None
     ) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Use Claude Opus 4.5 computer-use beta API.
@@ -2364,6 +2966,12 @@ TASK:
             task: Description of what to accomplish
             url: Starting URL
             max_iterations: Maximum number of AI iterations
+            system_context: Optional instructions shared across calls (e.g. profile
+                preamble). Appended to the cached system prompt, so it must not
+                contain per-call data such as URLs or timestamps.
+            conversation: Optional message list shared across calls (batch flows).
+                The task is appended as a new user turn and the list is updated
+                in place, so system prompt and tools are not re-sent per call.
 
         Returns:
             (success, action_log)
@@ -2426,24 +3034,30 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
             {
                 "type": "text", 
                 "text": system_prompt_text,
-                "cache_control": {"type": "ephemeral"} # Cache the system prompt
             }
         ]
+        if system_context:
+            system.append({"type": "text", "text": system_context})
+        # Cache the system prompt (one breakpoint on the last block covers the whole prefix)
+        system[-1]["cache_control"] = {"type": "ephemeral"}
 
         # Combine verification prompt with task
         enhanced_task = task + "\n\n" + verification_prompt
 
-        success = False  # Initialize for finally block
+        self._run_finished = False
         try:
-            await self.start_browser(headless=False, user_data_dir=self.user_data_dir)
-            await self.page.goto(url)
+            if self.page is None:
+                await self.start_browser(headless=False, user_data_dir=self.user_data_dir)
+                await self.page.goto(url)
+            elif self.page.url != url:
+                # Batch flows hand over a live, logged-in page
+                await self.page.goto(url)
             
-            # Initial navigation verification
-            page_content = await self.page.content()
-            if "Something didn't go right" in page_content:
+            # Initial navigation verification (rendered text, not serialized HTML)
+            page_text = await self._page_text()
+            if "Something didn't go right" in page_text:
                 logger.error("Initial navigation failed: landed on an error page.")
-                await self._capture_page_state()
-                await self.close_browser()
+                await self._finish_run()
                 return False, [{"error": "Initial navigation failed: landed on an error page."}]
             
             # Extract and log project ID from URL
@@ -2490,26 +3104,26 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
             logger.info(f"Using Claude Opus 4.5 computer use (tool: {tool_type}, beta: {beta_header})")
 
             # Initial screenshot
-            initial_screenshot = await self.take_screenshot()
+            initial_screenshot = await self.take_screenshot("jpeg", SCREENSHOT_JPEG_QUALITY)
             screenshot_b64 = self.screenshot_to_base64(initial_screenshot)
 
             # Initialize messages
-            messages = [
+            task_content = [
+                {"type": "text", "text": enhanced_task},
                 {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": enhanced_task},
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/png",
-                                "data": screenshot_b64
-                            }
-                        }
-                    ]
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/jpeg",
+                        "data": screenshot_b64
+                    }
                 }
             ]
+            if conversation is None:
+                messages = [{"role": "user", "content": task_content}]
+            else:
+                messages = conversation
+                self._append_user_turn(messages, task_content)
 
             # Configurable budgets
             thinking_budget = int(os.getenv("CLAUDE_THINKING_BUDGET", "2048"))
@@ -2519,12 +3133,11 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
             for iteration in range(max_iterations):
                 logger.info(f"Claude iteration {iteration + 1}/{max_iterations}")
 
-                # Check for blocked state at start of each iteration
-                blocked_indicator = await self._check_blocked_state()
+                # Check for blocked state at iteration start (periodically or on URL change)
+                blocked_indicator = await self._check_blocked_state() if self._blocked_check_due(iteration) else None
                 if blocked_indicator:
                     logger.error(f"Project blocked detected at iteration start: '{blocked_indicator}'")
-                    await self._capture_page_state()
-                    await self.close_browser()
+                    await self._finish_run()
                     return False, self.action_log
 
                 # Apply prompt caching optimizations
@@ -2545,7 +3158,35 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
                     }
                 }
 
-                response = self.anthropic.beta.messages.create(**api_params)
+                # Stream so a closing "submitted / all set" message can be confirmed
+                # against the page and the rest of the response cancelled
+                async with LLM_SEMAPHORE, self.anthropic.beta.messages.stream(**api_params) as stream:
+                    # Scan each delta plus enough of the previous text to catch a pattern
+                    # split across deltas, rather than rescanning the whole response
+                    overlap = max(map(len, self._completion_patterns(platform_config)[0])) - 1
+                    streamed_tail = ""
+                    checked_early = False
+                    async for event in stream:
+                        if checked_early or event.type != "content_block_delta" or event.delta.type != "text_delta":
+                            continue
+                        window = streamed_tail + event.delta.text
+                        streamed_tail = window[-overlap:] if overlap else ""
+                        if self._scan_completion_patterns(window, platform_config)[0] is None:
+                            continue
+
+                        # Only the page is authoritative; check it once per response
+                        checked_early = True
+                        is_complete, is_success, _ = await self._check_task_completion(platform_config)
+                        if is_complete:
+                            logger.info("Completion confirmed while streaming - cancelling rest of response")
+                            # No assistant reply follows this turn; drop its breakpoint so a
+                            # shared conversation's next task does not inherit it
+                            for block in messages[-1]["content"]:
+                                if isinstance(block, dict):
+                                    block.pop("cache_control", None)
+                            return is_success, self.action_log
+
+                    response = await stream.get_final_message()
 
                 # Append assistant response to messages
                 messages.append({
@@ -2556,21 +3197,29 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
                 # Process tool use blocks
                 tool_results = []
                 has_tool_use = False
+                page_may_have_changed = False
 
                 for block in response.content:
                     # Handle thinking blocks
                     if block.type == "thinking":
                         thinking_text = getattr(block, 'thinking', '') or ''
                         if thinking_text:
-                            logger.debug(f"Claude thinking: {thinking_text[:500]}...")
+                            logger.opt(lazy=True).debug("Claude thinking: {}...", lambda: thinking_text[:500])
                             # Don't add to action log to keep it clean, but useful for debugging
 
                     elif block.type == "tool_use":
                         has_tool_use = True
                         action = block.input.get("action")
+                        if action not in CLAUDE_READ_ONLY_ACTIONS:
+                            page_may_have_changed = True
 
                         logger.info(f"Claude tool use: {block.name} - {action}")
-                        logger.debug(f"Params: {block.input}")
+                        logger.debug("Params: {}", block.input)
+
+                        if self._race_lost():
+                            logger.info(f"[{self.correlation_id}] Racing engine finished first - stopping before {action}")
+                            await self._finish_run()
+                            return False, self.action_log
 
                         # Execute action via Playwright
                         result = await self.execute_claude_action(action, block.input)
@@ -2590,7 +3239,7 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
                             success_val = True
 
                         # Take new screenshot after action
-                        new_screenshot = await self.take_screenshot()
+                        new_screenshot = await self.take_screenshot("jpeg", SCREENSHOT_JPEG_QUALITY)
                         new_screenshot_b64 = self.screenshot_to_base64(new_screenshot)
 
                         # Build tool result content
@@ -2607,7 +3256,7 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
                             "type": "image",
                             "source": {
                                 "type": "base64",
-                                "media_type": "image/png",
+                                "media_type": "image/jpeg",
                                 "data": new_screenshot_b64
                             }
                         })
@@ -2619,8 +3268,8 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
                             "is_error": is_error
                         })
 
-                        # Brief pause between actions
-                        await asyncio.sleep(0.5)
+                        # Let the page settle before the next action
+                        await self._settle()
 
                     elif block.type == "text":
                         logger.info(f"Claude text response: {block.text[:200]}")
@@ -2633,8 +3282,7 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
                         return is_success, self.action_log
                     
                     logger.success("Task completed (no tool use)")
-                    await self._capture_page_state()
-                    await self.close_browser()
+                    await self._finish_run()
                     return True, self.action_log
 
                 # Add tool results to conversation
@@ -2644,20 +3292,24 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
                         "content": tool_results
                     })
 
-                # Check task completion after each iteration
-                is_complete, is_success, _ = await self._check_task_completion(platform_config)
-                if is_complete:
-                    return is_success, self.action_log
+                # Check task completion after each iteration (skipped when only
+                # read-only actions ran - the page text cannot have changed)
+                if page_may_have_changed:
+                    is_complete, is_success, _ = await self._check_task_completion(platform_config)
+                    if is_complete:
+                        return is_success, self.action_log
 
             logger.warning(f"Max iterations ({max_iterations}) reached")
-            await self._capture_page_state()
-            await self.close_browser()
+            await self._finish_run()
+            return False, self.action_log
+
+        except Exception as e:
+            logger.error(f"[{self.correlation_id}] Claude computer use run failed: {e}")
             return False, self.action_log
 
         finally:
-            await self._capture_page_state()
-            await self.close_browser()
-            return success, self.action_log
+            # No-op when the run already captured state and closed on its way out
+            await self._finish_run()
 
     async def process_dashboard_invitations(
         self,
@@ -2688,15 +3340,27 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
         processed = 0
         all_actions = []
         results = []  # Track each invitation's result
+        conversation: List[Dict[str, Any]] = []  # One Claude conversation for the whole batch
         
         try:
             # Start browser ONCE
             logger.info(f"[{self.correlation_id}] Starting batch dashboard processing at {dashboard_url}")
-            await self.start_browser(headless=False)
+            # Restore a recent saved session so the login form can be skipped
+            auth_state_path = self._auth_state_path()
+            saved_state = None
+            if auth_state_path.exists() and time.time() - auth_state_path.stat().st_mtime < AUTH_STATE_MAX_AGE_SECONDS:
+                saved_state = str(auth_state_path)
+
+            await self.start_browser(headless=False, storage_state=saved_state)
+            # Form runs reuse this browser; only the finally block below closes it
+            self._keep_browser_open = True
+            await self._block_batch_resources()
+            # Pick up the invitation list from the dashboard's own API calls
+            self.page.on("response", self._capture_invitation_feed)
             await self.page.goto(dashboard_url)
             
             # Wait for page to load
-            await asyncio.sleep(2)
+            await self._wait_for_page_ready()
             
             # Handle cookie consent if present
             cookie_accepted = await auto_accept_cookies(self.page)
@@ -2712,27 +3376,51 @@ CRITICAL EFFICIENCY RULES - READ BEFORE ACTING:
 
 Use Tab key to navigate between fields efficiently.
 """
-            login_success = await self._perform_batch_login(login_username, login_password)
+            if saved_state and not self._is_login_url(self.page.url):
+                logger.info(f"[{self.correlation_id}] Restored saved session - skipping login")
+                login_success = True
+            else:
+                login_success = await self._perform_batch_login(login_username, login_password)
+                if login_success:
+                    await self._save_auth_state()
             if not login_success:
                 logger.error(f"[{self.correlation_id}] Batch login failed")
                 await self.close_browser()
                 return 0, self.action_log
             
             # Phase 2: Mark session as authenticated
-            from datetime import datetime
             self.session_state["authenticated"] = True
             self.session_state["login_timestamp"] = datetime.now()
 
             logger.info(f"[{self.correlation_id}] Login successful, starting invitation processing")
 
             # Wait for dashboard to fully load after login
-            await asyncio.sleep(3)
+            await self._wait_for_page_ready()
             
             # Get initial count of invitations
             invitation_count = await self._get_invitation_count()
             logger.info(f"[{self.correlation_id}] Found {invitation_count} invitations on dashboard")
+
+            # With known detail URLs (dashboard API), invitations can run on parallel contexts
+            concurrency = int(os.getenv("BATCH_CONCURRENCY", "1"))
+            if concurrency > 1 and self.browser and self._invitation_feed:
+                feed_urls = []
+                while len(feed_urls) < max_invitations:
+                    detail_url = self._next_feed_invitation_url()
+                    if not detail_url:
+                        break
+                    feed_urls.append(detail_url)
+
+                if feed_urls:
+                    worker_results, worker_actions = await self._process_invitations_concurrently(
+                        feed_urls, profile_context, iterations_per_invitation, concurrency
+                    )
+                    results.extend(worker_results)
+                    all_actions.extend(worker_actions)
+                    # One result per attempted URL (failures included), so none is retried below
+                    processed += len(worker_results)
             
-            # Process invitations
+            # Process invitations (remaining ones, sequentially from the dashboard)
             while processed < max_invitations and processed < invitation_count:
                 logger.info(f"[{self.correlation_id}] Processing invitation {processed + 1}/{invitation_count}")
 
@@ -2749,7 +3437,7 @@ Use Tab key to navigate between fields efficiently.
                     break
                 
                 # Wait for invitation details to load
-                await asyncio.sleep(2)
+                await self._wait_for_page_ready()
                 
                 # Get invitation details and evaluate fit
                 invitation_details = await self._extract_invitation_details()
@@ -2759,7 +3447,8 @@ Use Tab key to navigate between fields efficiently.
                     # Process the application form
                     form_success, form_actions = await self._process_invitation_form(
                         profile_context, 
-                        iterations_per_invitation
+                        iterations_per_invitation,
+                        conversation
                     )
                     all_actions.extend(form_actions)
                     results.append({
@@ -2781,15 +3470,15 @@ Use Tab key to navigate between fields efficiently.
                 # Phase 2: Clean up session state after processing each opportunity
                 await self.cleanup_session_state()
 
-                # Return to dashboard for next invitation
+                # Return to dashboard for next invitation (waits for the page to load)
                 await self._return_to_dashboard(dashboard_url)
-                await asyncio.sleep(2)
             
             logger.success(f"[{self.correlation_id}] Batch processing complete: {processed} invitations processed")
             
         except Exception as e:
             logger.error(f"[{self.correlation_id}] Error in batch dashboard processing: {e}")
         finally:
+            self._keep_browser_open = False
             await self._capture_page_state()
             await self.close_browser()
         
@@ -2802,6 +3491,132 @@ Use Tab key to navigate between fields efficiently.
         
         return processed, all_actions
 
+    async def _wait_for_page_ready(self, state: str = "networkidle", timeout: int = 5000) -> bool:
+        """
+        Wait for the page to reach a load state instead of sleeping a fixed time.
+
+        Returns False (without raising) when the timeout expires, e.g. on pages
+        that keep long-polling connections open and never go network-idle.
+        """
+        try:
+            await self.page.wait_for_load_state(state, timeout=timeout)
+            return True
+        except Exception as e:
+            logger.debug(f"[{self.correlation_id}] Page did not reach '{state}' within {timeout}ms: {e}")
+            return False
+
+    async def _block_batch_resources(self):
+        """Abort requests for resource types the batch flow never uses (media, beacons)."""
+        async def handle_route(route):
+            if route.request.resource_type in BATCH_BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await self.context.route("**/*", handle_route)
+
+    async def _process_invitations_concurrently(
+        self,
+        urls: List[str],
+        profile_context: dict,
+        iterations_per_invitation: int,
+        concurrency: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Process invitation detail URLs on parallel browser contexts.
+
+        Each worker gets its own context seeded with this session's storage
+        state (no extra logins), its own page and its own Claude conversation,
+        and pulls URLs from a shared queue.
+
+        Returns:
+            (results, actions) across all workers
+        """
+        storage_state = await self.context.storage_state()
+        queue: asyncio.Queue = asyncio.Queue()
+        for url in urls:
+            queue.put_nowait(url)
+
+        results: List[Dict[str, Any]] = []
+        actions: List[Dict[str, Any]] = []
+
+        async def worker(index: int):
+            automation = BrowserAutomation(
+                correlation_id=f"{self.correlation_id}-w{index}",
+                platform=self.platform,
+                project_url=self.project_url,
+                platform_config=self.platform_config
+            )
+            automation.context = await self.browser.new_context(storage_state=storage_state)
+            automation._keep_browser_open = True
+            conversation: List[Dict[str, Any]] = []
+            try:
+                await automation.context.add_init_script(FOCUS_HELPERS_JS)
+                await automation._block_batch_resources()
+                automation.page = await automation.context.new_page()
+
+                while not queue.empty():
+                    url = queue.get_nowait()
+                    title = url
+                    # Every dequeued URL gets a result, so the caller counts it as attempted
+                    # and never re-opens it from the dashboard (a duplicate application)
+                    try:
+                        await automation.page.goto(url)
+                        await automation._wait_for_page_ready()
+
+                        details = await automation._extract_invitation_details()
+                        title = details.get("title") or url
+                        if automation._evaluate_invitation_fit(details, profile_context):
+                            form_success, _ = await automation._process_invitation_form(
+                                profile_context, iterations_per_invitation, conversation
+                            )
+                            results.append({"invitation": title, "action": "accepted", "success": form_success})
+                        else:
+                            decline_success = await automation._decline_invitation()
+                            results.append({"invitation": title, "action": "declined", "success": decline_success})
+                    except Exception as e:
+                        logger.error(f"[{automation.correlation_id}] Invitation {url} failed: {e}")
+                        results.append({"invitation": title, "action": "failed", "success": False, "error": str(e)})
+                    finally:
+                        # Keep actions taken before a failure, not just those of completed forms
+                        actions.extend(automation.flush_new_actions())
+            finally:
+                await automation.context.close()
+
+        worker_count = min(concurrency, len(urls))
+        logger.info(f"[{self.correlation_id}] Processing {len(urls)} invitations on {worker_count} parallel contexts")
+        outcomes = await asyncio.gather(*(worker(i) for i in range(worker_count)), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error(f"[{self.correlation_id}] Invitation worker failed: {outcome}")
+
+        return results, actions
+
+    def _auth_state_path(self) -> Path:
+        """Location of this platform's saved storage state (session cookies - keep out of git)."""
+        return Path("logs") / f"auth_state_{self.platform}.json"
+
+    def _is_login_url(self, url: str) -> bool:
+        """Whether a URL looks like a login page (e.g. after a session redirect)."""
+        url_lower = url.lower()
+        return any(marker in url_lower for marker in LOGIN_PAGE_URL_MARKERS)
+
+    async def _save_auth_state(self):
+        """Save cookies/localStorage after a successful login for reuse by later runs."""
+        path = self._auth_state_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            state = await self.context.storage_state()
+            # Owner-only from creation (fchmod covers a file left by an older run),
+            # so the cookies are never readable by others, even briefly
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            logger.debug(f"[{self.correlation_id}] Saved session state to {path}")
+        except Exception as e:
+            logger.debug(f"[{self.correlation_id}] Could not save session state: {e}")
+
     async def _perform_batch_login(self, username: str, password: str) -> bool:
         """Perform login for batch processing using platform-specific handlers from config."""
         try:
@@ -2836,11 +3651,38 @@ Use Tab key to navigate between fields efficiently.
             await self._capture_page_state()
             return False
 
+    async def _find_login_element(self, role: str, selectors: List[str], timeout: int = 5000):
+        """
+        Find a visible login element, preferring selectors earlier in the list.
+
+        The selectors are OR-ed into one locator for a single wait while the page
+        loads. An OR-ed locator matches in document order, though, so the pick is
+        then made by checking each selector in list order: a header search box or
+        sign-up button earlier in the DOM must not beat the login form's own field.
+        """
+        candidates = [self.page.locator(f"{selector} >> visible=true") for selector in selectors]
+        if not candidates:
+            return None
+
+        union = candidates[0]
+        for candidate in candidates[1:]:
+            union = union.or_(candidate)
+        try:
+            await union.first.wait_for(state="visible", timeout=timeout)
+        except Exception:
+            logger.debug(f"[{self.correlation_id}] No visible {role} field found")
+            return None
+
+        for candidate in candidates:
+            if await candidate.count():
+                return candidate.first
+        return None
+
     async def _generic_batch_login(self, username: str, password: str) -> bool:
         """Generic login method for all platforms (fallback when no platform-specific handler)."""
         try:
             # Wait for page to be ready
-            await asyncio.sleep(2)
+            await self._wait_for_page_ready("domcontentloaded")
 
             # Try to find and fill email/username field (case-insensitive for name/id)
             email_selectors = [
@@ -2856,15 +3698,7 @@ Use Tab key to navigate between fields efficiently.
                 'table input[type="text"]:first-of-type',
             ]
             
-            email_field = None
-            for selector in email_selectors:
-                try:
-                    email_field = await self.page.query_selector(selector)
-                    if email_field and await email_field.is_visible():
-                        break
-                    email_field = None
-                except:
-                    continue
+            email_field = await self._find_login_element("email", email_selectors)
             
             if email_field:
                 await email_field.click()
@@ -2886,15 +3720,7 @@ Use Tab key to navigate between fields efficiently.
                 'input[id*="password" i]',
             ]
             
-            password_field = None
-            for selector in password_selectors:
-                try:
-                    password_field = await self.page.query_selector(selector)
-                    if password_field and await password_field.is_visible():
-                        break
-                    password_field = None
-                except:
-                    continue
+            password_field = await self._find_login_element("password", password_selectors)
             
             if password_field:
                 await password_field.click()
@@ -2918,15 +3744,7 @@ Use Tab key to navigate between fields efficiently.
                 'button:has-text("Sign")',
             ]
             
-            login_button = None
-            for selector in login_selectors:
-                try:
-                    login_button = await self.page.query_selector(selector)
-                    if login_button and await login_button.is_visible():
-                        break
-                    login_button = None
-                except:
-                    continue
+            login_button = await self._find_login_element("submit", login_selectors)
             
             if login_button:
                 await login_button.click()
@@ -2937,10 +3755,10 @@ Use Tab key to navigate between fields efficiently.
                 logger.info(f"[{self.correlation_id}] Pressed Enter for login (no button found)")
 
             # Wait for login to complete and check for success/failure
-            await asyncio.sleep(3)
+            await self._wait_for_page_ready(timeout=10000)
 
             # Check for authentication failure indicators
-            page_content = await self.page.content()
+            page_text = await self._page_text()
             page_url = self.page.url
 
             # Authentication failure indicators
@@ -2959,11 +3777,10 @@ Use Tab key to navigate between fields efficiently.
             ]
 
             # Check if we're still on login page (failure indicator)
-            login_page_indicators = ["/login", "/signin", "/auth", "login.php", "signin.php"]
-            still_on_login_page = any(indicator in page_url.lower() for indicator in login_page_indicators)
+            still_on_login_page = self._is_login_url(page_url)
 
             # Check page content for failure messages
-            content_lower = page_content.lower()
+            content_lower = page_text.lower()
             failure_detected = any(pattern in content_lower for pattern in auth_failure_patterns)
 
             if failure_detected or still_on_login_page:
@@ -3015,67 +3832,80 @@ Use Tab key to navigate between fields efficiently.
             logger.error(f"[{self.correlation_id}] Error getting invitation count: {e}")
             return 10
 
+    async def _capture_invitation_feed(self, response):
+        """
+        Page 'response' listener: stash invitation lists from dashboard JSON.
+
+        Accepts a top-level list or one nested under a common container key.
+        The latest matching response wins (the dashboard is reloaded per invitation).
+        """
+        if "invitation" not in response.url.lower():
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+
+        try:
+            payload = await response.json()
+        except Exception as e:
+            logger.debug(f"[{self.correlation_id}] Unreadable invitation JSON from {response.url}: {e}")
+            return
+
+        items = payload
+        if isinstance(payload, dict):
+            items = next(
+                (payload[key] for key in INVITATION_FEED_LIST_KEYS if isinstance(payload.get(key), list)),
+                None
+            )
+        if isinstance(items, list) and all(isinstance(item, dict) for item in items):
+            self._invitation_feed = items
+            logger.debug(f"[{self.correlation_id}] Captured {len(items)} invitations from {response.url}")
+
+    def _next_feed_invitation_url(self) -> Optional[str]:
+        """Absolute detail URL of the first captured invitation not yet opened, if any."""
+        for item in self._invitation_feed:
+            link = next(
+                (item[field] for field in INVITATION_FEED_URL_FIELDS if isinstance(item.get(field), str)),
+                None
+            )
+            if link and link not in self._visited_feed_urls:
+                self._visited_feed_urls.add(link)
+                return urljoin(self.page.url, link)
+        return None
+
     async def _get_generic_invitation_count(self) -> int:
         """Generic invitation counting for all platforms."""
         try:
-            # Look for invitation count indicators (e.g., "Invitations (13)")
-            page_text = await self.page.content()
-
-            import re
-            # Pattern for "Invitations (N)" or similar
-            count_patterns = [
-                r'Invitations?\s*\((\d+)\)',
-                r'(\d+)\s*Invitations?',
-                r'Projects?\s*\((\d+)\)',
-                r'(\d+)\s*pending',
-                r'Requests?\s*\((\d+)\)',
-                r'(\d+)\s*Requests?',
-                r'Open\s*\((\d+)\)',
-            ]
-
-            for pattern in count_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    count = int(match.group(1))
-                    logger.info(f"[{self.correlation_id}] Found invitation count: {count} (pattern: {pattern})")
-                    return count
+            # Prefer the list captured from the dashboard's JSON API over DOM scraping
+            if self._invitation_feed:
+                logger.info(f"[{self.correlation_id}] Found invitation count: {len(self._invitation_feed)} (dashboard API)")
+                return len(self._invitation_feed)
+
+            # Look for invitation count indicators (e.g., "Invitations (13)"), then
+            # actionable buttons (vetting, survey, etc.) - matched inside the page
+            result = await self.page.evaluate(INVITATION_COUNT_JS, {
+                "patterns": list(INVITATION_COUNT_PATTERNS),
+                "keywords": list(ACTIONABLE_BUTTON_KEYWORDS),
+            })
 
-            # Fallback: count actionable buttons (vetting, survey, etc.)
-            try:
-                buttons = await self.page.query_selector_all('button, a.btn, [role="button"]')
-                actionable_count = 0
-                for btn in buttons:
-                    try:
-                        text = await btn.inner_text()
-                        # Generic patterns for actionable items
-                        if any(kw in text.lower() for kw in ['complete', 'vetting', 'start', 'respond', 'apply']):
-                            actionable_count += 1
-                    except:
-                        continue
-                if actionable_count > 0:
-                    logger.info(f"[{self.correlation_id}] Found {actionable_count} actionable buttons")
-                    return actionable_count
-            except:
-                pass
+            if result["pattern"] is not None:
+                count = result["count"]
+                logger.info(f"[{self.correlation_id}] Found invitation count: {count} (pattern: {INVITATION_COUNT_PATTERNS[result['pattern']]})")
+                return count
 
-            # Fallback: count invitation card elements
-            card_selectors = [
-                '.invitation-card',
-                '.project-card',
-                '[class*="invitation"]',
-                '[class*="project-item"]',
-                'tr[class*="request"]',
-                'div[class*="request-card"]',
-            ]
+            if result["actionable"] > 0:
+                logger.info(f"[{self.correlation_id}] Found {result['actionable']} actionable buttons")
+                return result["actionable"]
 
-            for selector in card_selectors:
-                try:
-                    cards = await self.page.query_selector_all(selector)
-                    if cards and len(cards) > 0:
-                        logger.info(f"[{self.correlation_id}] Found {len(cards)} elements matching '{selector}'")
-                        return len(cards)
-                except:
-                    continue
+            # Fallback: count invitation card elements - all selectors in one round trip,
+            # first selector (in priority order) with matches wins
+            try:
+                card_counts = await self.page.evaluate(COUNT_SELECTORS_JS, list(INVITATION_CARD_SELECTORS))
+                for selector, card_count in zip(INVITATION_CARD_SELECTORS, card_counts):
+                    if card_count > 0:
+                        logger.info(f"[{self.correlation_id}] Found {card_count} elements matching '{selector}'")
+                        return card_count
+            except Exception as e:
+                logger.debug(f"[{self.correlation_id}] Card count query failed: {e}")
 
             # If we get here, we couldn't find a count. Log debug info.
             logger.warning(f"[{self.correlation_id}] Could not determine invitation count. Dumping page title/headers.")
@@ -3104,8 +3934,6 @@ Use Tab key to navigate between fields efficiently.
         Returns:
             Dict with session validation results
         """
-        from datetime import datetime, timedelta
-
         result = {
             "valid": False,
             "authenticated": False,
@@ -3212,7 +4040,6 @@ Use Tab key to navigate between fields efficiently.
             login_success = await self._perform_batch_login(username, password)
 
             if login_success:
-                from datetime import datetime
                 self.session_state["authenticated"] = True
                 self.session_state["login_timestamp"] = datetime.now()
                 logger.success(f"[{self.correlation_id}] ✓ Session recovery successful")
@@ -3264,7 +4091,7 @@ Use Tab key to navigate between fields efficiently.
 
             # Clear temporary page state
             self.last_page_state = {}
-            self._click_history = []
+            self._click_history.clear()
 
             # Force garbage collection of page resources
             if self.page:
@@ -3287,8 +4114,6 @@ Use Tab key to navigate between fields efficiently.
     async def reset_session_state(self) -> None:
         """Reset session state for new batch processing."""
         try:
-            from datetime import datetime
-
             self.session_state = {
                 "authenticated": False,
                 "login_timestamp": None,
@@ -3543,8 +4368,6 @@ Use Tab key to navigate between fields efficiently.
         }
 
         try:
-            from datetime import datetime
-
             # Save current URL
             saved_state["url"] = self.page.url
             saved_state["timestamp"] = datetime.now().isoformat()
@@ -3728,6 +4551,13 @@ Use Tab key to navigate between fields efficiently.
     async def _click_generic_invitation(self) -> bool:
         """Generic invitation clicking for all platforms (fallback when no platform-specific handler)."""
         try:
+            # Open the invitation straight from the dashboard API data when available
+            detail_url = self._next_feed_invitation_url()
+            if detail_url:
+                logger.info(f"[{self.correlation_id}] Opening invitation from dashboard API: {detail_url}")
+                await self.page.goto(detail_url)
+                return True
+
             # Combined selectors that work across platforms
             invitation_selectors = [
                 # Link-based selectors
@@ -3750,15 +4580,15 @@ Use Tab key to navigate between fields efficiently.
 
             for selector in invitation_selectors:
                 try:
-                    elements = await self.page.query_selector_all(selector)
-                    for el in elements:
-                        if await el.is_visible():
-                            # Log what we found
-                            text = (await el.inner_text() or "").strip()
-                            href = await el.get_attribute('href') or ""
-                            logger.info(f"[{self.correlation_id}] Found invitation element: '{selector}' text='{text[:50]}' href='{href}'")
-                            await el.click()
-                            return True
+                    # Visibility filtered in the page: one round trip per selector, not per element
+                    el = self.page.locator(f"{selector} >> visible=true").first
+                    if await el.count():
+                        # Log what we found
+                        text = (await el.inner_text() or "").strip()
+                        href = await el.get_attribute('href') or ""
+                        logger.info(f"[{self.correlation_id}] Found invitation element: '{selector}' text='{text[:50]}' href='{href}'")
+                        await el.click()
+                        return True
                 except Exception as e:
                     logger.debug(f"[{self.correlation_id}] Selector '{selector}' failed: {e}")
                     continue
@@ -3790,22 +4620,11 @@ Use Tab key to navigate between fields efficiently.
     async def _extract_invitation_details(self) -> Dict[str, Any]:
         """Extract details from the current invitation page."""
         try:
-            title = await self.page.title()
-            url = self.page.url
-            
-            # Try to get main content text
-            content = ""
-            try:
-                main_content = await self.page.query_selector('main, .content, .project-details, article')
-                if main_content:
-                    content = await main_content.inner_text()
-            except:
-                content = await self.page.inner_text('body')
-            
+            details = await self.page.evaluate(INVITATION_DETAILS_JS, INVITATION_CONTENT_LIMIT)
             return {
-                "title": title,
-                "url": url,
-                "content": content[:2000],  # Limit content length
+                "title": details["title"],
+                "url": self.page.url,
+                "content": details["content"],
             }
         except Exception as e:
             logger.error(f"[{self.correlation_id}] Error extracting invitation details: {e}")
@@ -3819,7 +4638,6 @@ Use Tab key to navigate between fields efficiently.
         """
         content = invitation.get("content", "").lower()
         title = invitation.get("title", "").lower()
-        url = invitation.get("url", "").lower()
 
         # Check if platform_config specifies auto-accept for dashboard invitations
         if self.platform_config.get("auto_accept_dashboard_invitations") or \
@@ -3827,34 +4645,7 @@ Use Tab key to navigate between fields efficiently.
             logger.info(f"[{self.correlation_id}] Platform configured to auto-accept - accepting")
             return True
 
-        # Keywords that indicate good fit
-        good_fit_keywords = [
-            "ai", "artificial intelligence", "machine learning", "ml",
-            "llm", "large language model", "generative", "gpt", "claude",
-            "cloud", "gcp", "aws", "azure", "kubernetes", "docker",
-            "enterprise", "software", "architecture", "microservices",
-            "application modernization", "digital transformation",
-            "python", "java", "api", "saas", "platform",
-            "data center", "infrastructure", "devops",
-            "google", "amazon", "microsoft", "anthropic", "openai",
-            "tpu", "asic", "chip", "semiconductor", "security", "broadcom"
-        ]
-
-        # Keywords that indicate poor fit
-        poor_fit_keywords = [
-            "medical device", "pharmaceutical manufacturing", "clinical trial",
-            "supply chain logistics", "retail operations",
-            "financial trading", "derivatives", "hedge fund",
-            "real estate appraisal", "property management",
-            "oil and gas drilling", "mining operations",
-            "food processing", "agriculture",
-        ]
-
-        # Count matches
-        good_matches = sum(1 for kw in good_fit_keywords if kw in content or kw in title)
-        poor_matches = sum(1 for kw in poor_fit_keywords if kw in content or kw in title)
-
-        # Accept if more good matches than poor matches, or if it's a survey/paid opportunity
+        # Accept if it's a survey/paid opportunity
         if "survey" in content or "paid" in content:
             return True
 
@@ -3863,16 +4654,41 @@ Use Tab key to navigate between fields efficiently.
             logger.info(f"[{self.correlation_id}] Minimal content detected - accepting by default")
             return True
 
+        # Accept if more good matches than poor matches (one pass per keyword over
+        # content and title; the newline keeps phrases from matching across them)
+        haystack = f"{content}\n{title}"
+        good_matches = sum(1 for kw in FIT_GOOD_KEYWORDS if kw in haystack)
+        poor_matches = sum(1 for kw in FIT_POOR_KEYWORDS if kw in haystack)
+
         return good_matches > poor_matches or good_matches >= 2
 
     async def _process_invitation_form(
         self, 
         profile_context: dict,
-        max_iterations: int
+        max_iterations: int,
+        conversation: Optional[List[Dict[str, Any]]] = None
     ) -> Tuple[bool, List[Dict[str, Any]]]:
-        """Process the invitation form using Claude computer use."""
-        # Generate form filling task
-        form_task = f"""Complete this consultation application form:
+        """Process the invitation form, using Claude computer use unless a platform form handler succeeds."""
+        log_start = len(self.action_log)
+
+        # Stable platform forms are filled by plain Playwright code; Claude only handles the rest
+        form_handler = self.platform_config.get("form_handler")
+        if form_handler and callable(form_handler):
+            logger.info(f"[{self.correlation_id}] Using platform-specific form handler")
+            try:
+                result = await form_handler(self.page, profile_context)
+                # Handle both dict and bool return types
+                if isinstance(result, dict):
+                    result = result.get("success", False)
+                if result:
+                    return True, self.action_log[log_start:]
+                logger.warning(f"[{self.correlation_id}] Form handler did not complete the form, falling back to Claude")
+            except Exception as e:
+                logger.warning(f"[{self.correlation_id}] Form handler failed, falling back to Claude: {e}")
+
+        # Profile and instructions are identical for every invitation in the batch,
+        # so they go into the cached system prefix; only the short task varies
+        form_context = f"""Consultation application forms:
 
 Profile Context:
 - Name: {profile_context.get('name', 'Rohit Kelapure')}
@@ -3886,6 +4702,7 @@ Click checkboxes for relevant expertise areas.
 For text areas, provide clear, concise responses.
 Submit when all fields are complete.
 """
+        form_task = "Complete this consultation application form."
         
         # Use existing claude_computer_use method for form filling
         # But we're already on the page, so we just need to fill the form
@@ -3893,10 +4710,13 @@ Submit when all fields are complete.
             task=form_task,
             url=self.page.url,
             max_iterations=max_iterations,
-            verification_prompt="Verify form was submitted successfully."
+            verification_prompt="Verify form was submitted successfully.",
+            system_context=form_context,
+            conversation=conversation
         )
         
-        return success, actions
+        # The action log spans the whole batch session; return this form's entries
+        return success, actions[log_start:]
 
     async def _decline_invitation(self) -> bool:
         """Decline the current invitation."""
@@ -3915,7 +4735,7 @@ Submit when all fields are complete.
                     if decline_btn:
                         await decline_btn.click()
                         logger.info(f"[{self.correlation_id}] Clicked decline button")
-                        await asyncio.sleep(2)
+                        await self._wait_for_page_ready()
                         return True
                 except:
                     continue
@@ -3931,7 +4751,7 @@ Submit when all fields are complete.
         """Navigate back to the dashboard."""
         try:
             await self.page.goto(dashboard_url)
-            await asyncio.sleep(2)
+            await self._wait_for_page_ready()
             logger.info(f"[{self.correlation_id}] Returned to dashboard")
             return True
         except Exception as e:
@@ -3939,6 +4759,67 @@ Submit when all fields are complete.
             return False
 
 
+async def _race_engines(
+    claude_automation: "BrowserAutomation",
+    gemini_automation: "BrowserAutomation",
+    task_prompt: str,
+    project_url: str,
+    verification_prompt: str
+) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    Run Claude and one Gemini attempt concurrently, each on its own browser context.
+
+    Returns (method, actions) for the first engine to succeed - the other run is
+    cancelled - or (None, []) when both fail. Raises FatalSubmissionError if both
+    fail and one of them failed fatally.
+
+    The runs share an event set as soon as either reaches a finished page, before
+    its verification round; the other checks it before every action, so it does
+    not submit (or decline) a second time. An action already in flight when the
+    first run finishes can still go through.
+    """
+    race_finished = asyncio.Event()
+    claude_automation._race_finished = race_finished
+    gemini_automation._race_finished = race_finished
+    runs = {
+        asyncio.create_task(claude_automation.claude_computer_use(
+            task=task_prompt,
+            url=project_url,
+            max_iterations=35,
+            verification_prompt=verification_prompt
+        )): "claude",
+        asyncio.create_task(gemini_automation.gemini_computer_use(
+            task=task_prompt,
+            url=project_url,
+            max_iterations=35,
+            verification_prompt=verification_prompt
+        )): "gemini",
+    }
+    pending = set(runs)
+    fatal_error: Optional[FatalSubmissionError] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for run in done:
+                try:
+                    success, actions = run.result()
+                except FatalSubmissionError as e:
+                    # Keep waiting: the other engine may still succeed
+                    fatal_error = e
+                    continue
+                if success:
+                    logger.info("{} computer-use finished first", runs[run].capitalize())
+                    return runs[run], actions
+        if fatal_error:
+            raise fatal_error
+        return None, []
+    finally:
+        # Cancelled runs still capture state and close their context on the way out
+        for run in pending:
+            run.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
 async def submit_platform_application(
     project_url: str,
     task_prompt: str,
@@ -3969,6 +4850,10 @@ async def submit_platform_application(
             - workflow_stages: Dict[str, List[str]] - platform-specific workflow stages
             - dialog_handler: Callable[[Page], Awaitable[Dict]] - async function to dismiss platform dialogs
             - cookie_selectors: List[str] - platform-specific cookie button selectors
+            - uses_browser_profile: bool - run in the persistent profiles/default Chrome profile
+            - parallel_engines: bool - race Claude against the first Gemini attempt
+              (the slower engine stops once the faster reaches a finished page, but an
+              action it has already started can still submit a second time)
 
     Returns:
         {
@@ -3979,133 +4864,67 @@ async def submit_platform_application(
             "project_id": Optional[str]
         }
     """
-    automation = BrowserAutomation(
-        correlation_id=correlation_id,
-        platform=platform_name,
-        project_url=project_url,
-        platform_config=platform_config
-    )
-    
-    # Extract project ID for result
-    project_id = extract_project_id_from_url(project_url)
-
-    # Create sanitized version of task for logging (redacts credentials)
-    sanitized_task = mask_password_in_logs(task_prompt)
-    
-    # Determine user_data_dir from platform config
+    # Platforms that rely on a logged-in Chrome profile (e.g. Google OAuth) run in it
     user_data_dir = None
     if platform_config and platform_config.get("uses_browser_profile"):
-        user_data_dir = os.path.join(os.getcwd(), "profiles", "default")
-        logger.info(f"Platform {platform_name} requests persistent profile: {user_data_dir}")
-    
-    # 1) Try Claude first (primary engine)
-    logger.info(f"Submitting {platform_name} application: trying Claude computer-use (primary)...")
-    logger.debug(f"Task (sanitized): {sanitized_task[:500]}...")
-    
-    # We need to modify how start_browser is called inside the computer_use methods
-    # But those methods call start_browser internally. 
-    # We should update the automation object to store the preferred user_data_dir
-    automation.user_data_dir = user_data_dir
-    
-    # Monkey-patch or update the start_browser method call? 
-    # Better: Update the class to store user_data_dir in __init__ or update the methods to use instance variable
-    
-    # Let's update the methods to use the instance variable if set
-    # OR simpler: just update start_browser to default to self.user_data_dir if set
-    
-    # For this specific file structure, we need to update the calls within claude_computer_use and gemini_computer_use
-    # But since I can't easily change the method signatures in this tool call without replacing the whole file,
-    # I will rely on a small hack: set the default in the class instance
-    
-    # Update: I will modify the start_browser method in the class to use self.user_data_dir
-    # But first I need to update the class definition.
-    # Since I just updated start_browser signature, I can pass it if I update the calls.
-    
-    # Wait, the previous replace updated the signature of start_browser.
-    # Now I need to update where it is CALLED inside claude_computer_use and gemini_computer_use.
-    
-    # Since I cannot update multiple locations easily with one replace block if they are far apart,
-    # I will update submit_platform_application to pass the dir to the methods, 
-    # AND update the methods to accept it.
-    
-    # Actually, the best way is to set it on the instance and have start_browser use it.
-    # Let's update __init__ and start_browser again? No, that's too many steps.
-    
-    # Let's just update the calls inside the methods.
-    pass
+        user_data_dir = BROWSER_PROFILE_DIR
 
-async def submit_platform_application(
-    project_url: str,
-    task_prompt: str,
-    platform_name: str = "unknown",
-    max_retries: int = 3,
-    correlation_id: str = "N/A",
-    verification_prompt: str = "Verify that the application was successfully submitted.",
-    platform_config: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
-    """
-    Submit or decline a consultation application using Claude (primary) with Gemini fallback.
-    """
     automation = BrowserAutomation(
         correlation_id=correlation_id,
         platform=platform_name,
         project_url=project_url,
-        platform_config=platform_config
+        platform_config=platform_config,
+        user_data_dir=user_data_dir
     )
-    
-    # Determine user_data_dir
-    user_data_dir = None
-    if platform_config and platform_config.get("uses_browser_profile"):
-        user_data_dir = os.path.join(os.getcwd(), "profiles", "default")
-    
-    # Store it on the automation instance for methods to access
-    automation.user_data_dir = user_data_dir
-    
+
     # Extract project ID for result
     project_id = extract_project_id_from_url(project_url)
 
-    # Create sanitized version of task for logging (redacts credentials)
-    sanitized_task = mask_password_in_logs(task_prompt)
-    
-    # 1) Try Claude first (primary engine)
-    logger.info(f"Submitting {platform_name} application: trying Claude computer-use (primary)...")
-    logger.debug(f"Task (sanitized): {sanitized_task[:500]}...")
-    success, actions = await automation.claude_computer_use(
-        task=task_prompt,
-        url=project_url,
-        max_iterations=35,
-        verification_prompt=verification_prompt
-    )
-
-    if success:
-        return {
-            "success": True,
-            "method": "claude",
-            "actions": _sanitize_action_log(actions),
-            "error": None,
-            "project_id": project_id,
-        }
-
-    logger.warning("Claude computer-use failed, attempting Gemini fallback...")
-
-    # 2) If Claude fails, try Gemini as secondary (if configured)
-    if not automation.gemini_client:
-        logger.error("Gemini client not configured; cannot perform fallback.")
-        return {
-            "success": False,
-            "method": "claude",
-            "actions": _sanitize_action_log(automation.action_log),
-            "error": "Claude failed and Gemini not configured for fallback",
-            "project_id": project_id,
-        }
+    # Redact credentials only if a DEBUG sink will actually format the message
+    logger.opt(lazy=True).debug("Task (sanitized): {}...", lambda: mask_password_in_logs(task_prompt)[:500])
+
+    gemini_automation = automation
+    first_gemini_attempt = 0
+
+    # parallel_engines: race Claude against the first Gemini attempt on separate
+    # browser contexts (a persistent profile cannot be opened twice, so not with one)
+    if platform_config and platform_config.get("parallel_engines") and automation.gemini_client and not user_data_dir:
+        logger.info("Submitting {} application: racing Claude and Gemini computer-use...", platform_name)
+        gemini_automation = BrowserAutomation(
+            correlation_id=f"{correlation_id}-gemini",
+            platform=platform_name,
+            project_url=project_url,
+            platform_config=platform_config
+        )
+        try:
+            method, actions = await _race_engines(
+                automation, gemini_automation, task_prompt, project_url, verification_prompt
+            )
+        except FatalSubmissionError as e:
+            logger.error("Claude failed and Gemini cannot be retried: {}", e)
+            return {
+                "success": False,
+                "method": None,
+                "actions": _sanitize_action_log(gemini_automation.action_log),
+                "error": str(e),
+                "project_id": project_id,
+            }
+        if method:
+            return {
+                "success": True,
+                "method": method,
+                "actions": _sanitize_action_log(actions),
+                "error": None,
+                "project_id": project_id,
+            }
 
-    for attempt in range(max_retries):
-        logger.info(f"Gemini fallback attempt {attempt + 1}/{max_retries}")
+        logger.warning("Claude and Gemini computer-use both failed, retrying Gemini...")
+        first_gemini_attempt = 1
 
-        # Restart browser for Gemini (Claude closed it)
-        # Note: gemini_computer_use calls start_browser internally, so we rely on instance var
-        
-        success, actions = await automation.gemini_computer_use(
+    else:
+        # 1) Try Claude first (primary engine)
+        logger.info("Submitting {} application: trying Claude computer-use (primary)...", platform_name)
+        success, actions = await automation.claude_computer_use(
             task=task_prompt,
             url=project_url,
             max_iterations=35,
@@ -4115,20 +4934,75 @@ async def submit_platform_application(
         if success:
             return {
                 "success": True,
-                "method": "gemini",
+                "method": "claude",
                 "actions": _sanitize_action_log(actions),
                 "error": None,
                 "project_id": project_id,
             }
 
-        logger.warning(f"Gemini fallback attempt {attempt + 1} failed")
-        await asyncio.sleep(2)
+        logger.warning("Claude computer-use failed, attempting Gemini fallback...")
+
+        # 2) If Claude fails, try Gemini as secondary (if configured)
+        if not automation.gemini_client:
+            logger.error("Gemini client not configured; cannot perform fallback.")
+            return {
+                "success": False,
+                "method": "claude",
+                "actions": _sanitize_action_log(automation.action_log),
+                "error": "Claude failed and Gemini not configured for fallback",
+                "project_id": project_id,
+            }
+
+    # Gemini attempts back off exponentially (with jitter) between failed runs; a
+    # FatalSubmissionError (rejected key or request) ends them without retrying
+    if first_gemini_attempt < max_retries:
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(max_retries - first_gemini_attempt),
+            wait=wait_exponential_jitter(
+                initial=GEMINI_RETRY_BASE_DELAY, max=GEMINI_RETRY_MAX_DELAY, jitter=GEMINI_RETRY_JITTER
+            ),
+            retry=retry_if_result(lambda result: not result[0]),
+            before=lambda state: logger.info(
+                "Gemini fallback attempt {}/{}", first_gemini_attempt + state.attempt_number, max_retries
+            ),
+            after=lambda state: logger.warning(
+                "Gemini fallback attempt {} failed", first_gemini_attempt + state.attempt_number
+            ),
+            retry_error_callback=lambda state: state.outcome.result(),
+        )
+        try:
+            # Fresh context per attempt on the pooled browser (Claude closed its context)
+            success, actions = await retrying(
+                gemini_automation.gemini_computer_use,
+                task=task_prompt,
+                url=project_url,
+                max_iterations=35,
+                verification_prompt=verification_prompt
+            )
+        except FatalSubmissionError as e:
+            logger.error("Gemini fallback stopped without retrying: {}", e)
+            return {
+                "success": False,
+                "method": "gemini",
+                "actions": _sanitize_action_log(gemini_automation.action_log),
+                "error": str(e),
+                "project_id": project_id,
+            }
+
+        if success:
+            return {
+                "success": True,
+                "method": "gemini",
+                "actions": _sanitize_action_log(actions),
+                "error": None,
+                "project_id": project_id,
+            }
 
     # Both engines failed
     return {
         "success": False,
         "method": None,
-        "actions": _sanitize_action_log(automation.action_log),
+        "actions": _sanitize_action_log(gemini_automation.action_log),
         "error": "Both Claude and Gemini computer-use failed",
         "project_id": project_id,
     }
@@ -24,13 +24,10 @@ def sanitize_credentials(data: Union[str, Dict[str, Any], List]) -> Union[str, D
         return data
 
 
-def _sanitize_string(text: str) -> str:
-    """Sanitize sensitive data from strings"""
-    if not text:
-        return text
-
-    # Mask common password patterns
-    patterns = [
+# (pattern, replacement) pairs applied in order by _sanitize_string, compiled once at import
+_CREDENTIAL_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
         # Password in JSON/dict format
         (r'"password"\s*:\s*"([^"]+)"', r'"password": "***REDACTED***"'),
         (r"'password'\s*:\s*'([^']+)'", r"'password': '***REDACTED***'"),
@@ -50,32 +47,40 @@ def _sanitize_string(text: str) -> str:
         # Email + password combinations
         (r'(username|email)\s*[:=]\s*[\'"]*([^\s\'"]+)[\'"]*\s*,?\s*(password)\s*[:=]\s*[\'"]*([^\s\'"]+)[\'"]*',
          r'\1: "\2", \3: "***REDACTED***"'),
-    ]
+    )
+)
+
+# Dict keys (lowercased, without "_" and "-") whose values are always redacted
+_SENSITIVE_KEYS = frozenset({
+    'password', 'passwd', 'pwd',
+    'apikey',
+    'secret', 'secretkey',
+    'token', 'authtoken',
+    'accesstoken', 'refreshtoken',
+    'private', 'privatekey',
+})
+
+
+def _sanitize_string(text: str) -> str:
+    """Sanitize sensitive data from strings"""
+    if not text:
+        return text
 
     sanitized = text
-    for pattern, replacement in patterns:
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+    for pattern, replacement in _CREDENTIAL_PATTERNS:
+        sanitized = pattern.sub(replacement, sanitized)
 
     return sanitized
 
 
 def _sanitize_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     """Sanitize sensitive keys in dictionaries"""
-    sensitive_keys = {
-        'password', 'passwd', 'pwd',
-        'api_key', 'apikey', 'api-key', 'apikey',
-        'secret', 'secret_key', 'secret-key', 'secretkey',
-        'token', 'auth_token', 'auth-token', 'authtoken',
-        'access_token', 'refresh_token', 'accesstoken', 'refreshtoken',
-        'private', 'privatekey', 'private_key', 'private-key',
-    }
-
     sanitized = {}
     for key, value in data.items():
         key_lower = key.lower().replace('_', '').replace('-', '')
 
         # Check if key is sensitive
-        if any(sensitive in key_lower for sensitive in sensitive_keys):
+        if any(sensitive in key_lower for sensitive in _SENSITIVE_KEYS):
             sanitized[key] = "***REDACTED***"
         # Recursively sanitize nested structures
         elif isinstance(value, dict):
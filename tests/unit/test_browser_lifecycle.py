@@ -3,12 +3,13 @@
 import pytest
 from pathlib import Path
 import sys
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.browser.computer_use import BrowserAutomation
+from src.browser.computer_use import BrowserAutomation, BrowserPool
 
 
 class TestBrowserLifecycle:
@@ -65,17 +66,17 @@ class TestBrowserLifecycle:
 
     @pytest.mark.asyncio
     async def test_browser_multiple_starts(self):
-        """Test multiple browser instances can be started"""
+        """Test multiple automations share the pooled browser with separate contexts"""
         automation1 = BrowserAutomation()
         automation2 = BrowserAutomation()
 
         try:
-            # Start two separate browsers
             await automation1.start_browser(headless=True)
             await automation2.start_browser(headless=True)
 
-            # Both should be independent
-            assert automation1.browser is not automation2.browser
+            # One Chromium process, independent contexts and pages
+            assert automation1.browser is automation2.browser
+            assert automation1.context is not automation2.context
             assert automation1.page is not automation2.page
 
         finally:
@@ -149,3 +150,64 @@ class TestBrowserLifecycle:
         finally:
             # Browser should still be closeable
             await automation.close_browser()
+
+
+def _fake_playwright() -> MagicMock:
+    """async_playwright() stand-in whose chromium.launch returns a new connected browser per call"""
+    playwright = MagicMock()
+    playwright.stop = AsyncMock()
+
+    async def launch(headless):
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+        browser.close = AsyncMock()
+        return browser
+
+    playwright.chromium.launch = AsyncMock(side_effect=launch)
+    starter = MagicMock()
+    starter.start = AsyncMock(return_value=playwright)
+    return starter
+
+
+class TestBrowserPool:
+    """Test the shared browser pool used by ephemeral automation runs"""
+
+    @pytest.mark.asyncio
+    async def test_browser_launched_once_per_headless_mode(self):
+        """Repeated acquires reuse the running browser for the same mode"""
+        pool = BrowserPool()
+        starter = _fake_playwright()
+        with patch("src.browser.computer_use.async_playwright", return_value=starter):
+            first = await pool.acquire_browser(headless=True)
+            second = await pool.acquire_browser(headless=True)
+            headed = await pool.acquire_browser(headless=False)
+
+        assert first is second
+        assert headed is not first
+        starter.start.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_browser_is_relaunched(self):
+        """A crashed browser is replaced on the next acquire"""
+        pool = BrowserPool()
+        with patch("src.browser.computer_use.async_playwright", return_value=_fake_playwright()):
+            first = await pool.acquire_browser(headless=True)
+            first.is_connected.return_value = False
+            second = await pool.acquire_browser(headless=True)
+
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_close_browser_keeps_pooled_browser(self):
+        """Closing a run closes its context but not the shared browser"""
+        automation = BrowserAutomation()
+        browser = automation.browser = MagicMock()
+        browser.close = AsyncMock()
+        context = automation.context = MagicMock()
+        context.close = AsyncMock()
+
+        await automation.close_browser()
+
+        context.close.assert_awaited_once()
+        browser.close.assert_not_awaited()
+        assert automation.browser is None
@@ -0,0 +1,298 @@
+"""Unit tests for the Claude computer-use agent loop"""
+
+import asyncio
+import pytest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.browser import computer_use
+from src.browser.computer_use import BrowserAutomation
+
+URL = "https://example.com/project/1"
+
+
+def _tool_use(action: str, block_id: str = "t1") -> SimpleNamespace:
+    return SimpleNamespace(type="tool_use", id=block_id, name="computer", input={"action": action})
+
+
+def _response(*blocks) -> SimpleNamespace:
+    return SimpleNamespace(content=list(blocks))
+
+
+class _FakeStream:
+    """Minimal stand-in for the SDK's message stream context manager"""
+
+    def __init__(self, response: SimpleNamespace):
+        self.response = response
+        self.events_read = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __aiter__(self):
+        return self._events()
+
+    async def _events(self):
+        for block in self.response.content:
+            if block.type == "text":
+                for word in block.text.split(" "):
+                    self.events_read += 1
+                    yield SimpleNamespace(
+                        type="content_block_delta",
+                        delta=SimpleNamespace(type="text_delta", text=word + " ")
+                    )
+
+    async def get_final_message(self):
+        return self.response
+
+
+def _automation_with_responses(*responses) -> BrowserAutomation:
+    """BrowserAutomation with a live-looking page and scripted Claude responses"""
+    automation = BrowserAutomation()
+    automation.page = MagicMock()
+    automation.page.url = URL
+    automation.page.viewport_size = {"width": 1280, "height": 800}
+    automation.page.evaluate = AsyncMock(return_value={"fingerprint": "doc:1", "text": ""})
+
+    automation.anthropic = MagicMock()
+    automation.anthropic.beta.messages.stream = MagicMock(
+        side_effect=[_FakeStream(response) for response in responses]
+    )
+
+    automation.take_screenshot = AsyncMock(return_value=b"screenshot")
+    automation.execute_claude_action = AsyncMock(return_value=True)
+    automation._dismiss_platform_dialogs = AsyncMock(return_value=None)
+    automation._check_blocked_state = AsyncMock(return_value=None)
+    automation._check_task_completion = AsyncMock(return_value=(False, False, []))
+    automation._capture_page_state = AsyncMock()
+    automation.close_browser = AsyncMock()
+    return automation
+
+
+@pytest.fixture(autouse=True)
+def _no_page_side_effects():
+    with patch("src.browser.computer_use.auto_accept_cookies", AsyncMock(return_value=False)), \
+         patch("src.browser.computer_use.asyncio.sleep", AsyncMock()):
+        yield
+
+
+class TestClaudeLoop:
+    """Test per-iteration behaviour of claude_computer_use"""
+
+    @pytest.mark.asyncio
+    async def test_completion_check_skipped_after_read_only_actions(self):
+        """Screenshot-only turns do not re-read the page for completion"""
+        automation = _automation_with_responses(
+            _response(_tool_use("screenshot")),
+            _response(SimpleNamespace(type="text", text="Done")),
+        )
+
+        await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=3)
+
+        # Only the final no-tool-use check runs
+        assert automation._check_task_completion.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_completion_check_runs_after_page_changing_actions(self):
+        """Clicks and typing are followed by a completion check"""
+        automation = _automation_with_responses(
+            _response(_tool_use("left_click")),
+            _response(SimpleNamespace(type="text", text="Done")),
+        )
+
+        await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=3)
+
+        assert automation._check_task_completion.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_results_carry_jpeg_screenshots(self):
+        """Each tool result includes a JPEG screenshot for the next turn"""
+        automation = _automation_with_responses(
+            _response(_tool_use("left_click")),
+            _response(SimpleNamespace(type="text", text="Done")),
+        )
+
+        await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=3)
+
+        messages = automation.anthropic.beta.messages.stream.call_args.kwargs["messages"]
+        tool_result = messages[2]["content"][0]
+        assert tool_result["type"] == "tool_result"
+        assert tool_result["content"][-1]["source"]["media_type"] == "image/jpeg"
+
+    @pytest.mark.asyncio
+    async def test_stream_cancelled_once_page_confirms_completion(self):
+        """A completion message confirmed by the page ends the run mid-stream"""
+        text = "Thank you for applying - you're all set, the form was submitted and recorded"
+        stream = _FakeStream(_response(SimpleNamespace(type="text", text=text)))
+        automation = _automation_with_responses()
+        automation.anthropic.beta.messages.stream = MagicMock(return_value=stream)
+        automation._check_task_completion = AsyncMock(return_value=(True, True, []))
+
+        success, _ = await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=3)
+
+        assert success is True
+        assert automation._check_task_completion.await_count == 1
+        assert stream.events_read < len(text.split(" "))
+
+    @pytest.mark.asyncio
+    async def test_shared_conversation_survives_early_stream_return(self):
+        """The next task after a mid-stream return stays within the cache breakpoint limit"""
+        text = "Thank you for applying - you're all set"
+        automation = _automation_with_responses()
+        breakpoints_sent = []
+
+        def stream(**api_params):
+            breakpoints_sent.append(sum(
+                "cache_control" in block
+                for message in api_params["messages"]
+                for block in message["content"] if isinstance(block, dict)
+            ))
+            return _FakeStream(_response(SimpleNamespace(type="text", text=text)))
+
+        automation.anthropic.beta.messages.stream = MagicMock(side_effect=stream)
+        automation._check_task_completion = AsyncMock(return_value=(True, True, []))
+        conversation = []
+
+        await automation.claude_computer_use(task="First form", url=URL, max_iterations=3, conversation=conversation)
+        assert all("cache_control" not in block for block in conversation[-1]["content"])
+
+        await automation.claude_computer_use(task="Second form", url=URL, max_iterations=3, conversation=conversation)
+
+        assert breakpoints_sent == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_stops_before_acting_once_racing_engine_finished(self):
+        """A run racing another engine takes no further action after the other finishes"""
+        automation = _automation_with_responses(_response(_tool_use("left_click")))
+        automation._race_finished = asyncio.Event()
+        automation._race_finished.set()
+
+        success, _ = await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=3)
+
+        assert success is False
+        automation.execute_claude_action.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_confirmed_completion_signals_racing_engine(self):
+        """Reaching a finished page sets the event shared with the racing engine"""
+        automation = _automation_with_responses(_response(_tool_use("left_click")))
+        automation._race_finished = asyncio.Event()
+        automation._evaluate_page = AsyncMock(return_value={
+            "failure": None, "blocked": None, "success": "application received", "stage": None, "text": ""
+        })
+        del automation._check_task_completion
+
+        success, _ = await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=3)
+
+        assert success is True
+        assert automation._race_finished.is_set()
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_completion_text_keeps_streaming(self):
+        """Completion wording the page does not confirm does not stop the turn"""
+        automation = _automation_with_responses(
+            _response(SimpleNamespace(type="text", text="Once submitted I will"), _tool_use("left_click")),
+            _response(SimpleNamespace(type="text", text="Done")),
+        )
+
+        await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=3)
+
+        automation.execute_claude_action.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_final_state_captured_once_per_run(self):
+        """A run that already captured and closed is not torn down again in finally"""
+        automation = _automation_with_responses(*[_response(_tool_use("screenshot")) for _ in range(2)])
+
+        success, _ = await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=2)
+
+        assert success is False
+        automation._capture_page_state.assert_awaited_once()
+        automation.close_browser.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_errors_still_capture_and_close(self):
+        """An API error mid-run reports failure and still tears the browser down"""
+        automation = _automation_with_responses()
+        automation.anthropic.beta.messages.stream = MagicMock(side_effect=RuntimeError("overloaded"))
+
+        success, _ = await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=2)
+
+        assert success is False
+        automation._capture_page_state.assert_awaited_once()
+        automation.close_browser.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_api_requests_hold_the_shared_llm_semaphore(self):
+        """Each Claude request runs inside the process-wide LLM concurrency limit"""
+        semaphore_held = []
+
+        class _RecordingStream(_FakeStream):
+            async def __aenter__(self):
+                semaphore_held.append(computer_use.LLM_SEMAPHORE.locked())
+                return self
+
+        stream = _RecordingStream(_response(SimpleNamespace(type="text", text="Done")))
+        automation = _automation_with_responses()
+        automation.anthropic.beta.messages.stream = MagicMock(return_value=stream)
+
+        with patch.object(computer_use, "LLM_SEMAPHORE", asyncio.Semaphore(1)):
+            await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=1)
+
+        assert semaphore_held == [True]
+
+    @pytest.mark.asyncio
+    async def test_error_page_detected_from_rendered_text(self):
+        """The initial navigation check reads page text, not the serialized DOM"""
+        automation = _automation_with_responses()
+        automation.page.evaluate = AsyncMock(
+            return_value={"fingerprint": "doc:1", "text": "Something didn't go right. Try again."}
+        )
+        automation.page.content = AsyncMock()
+
+        success, actions = await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=2)
+
+        assert success is False
+        assert "error page" in actions[0]["error"]
+        automation.page.content.assert_not_awaited()
+        automation.anthropic.beta.messages.stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_actions_settle_on_page_frames_instead_of_sleeping(self):
+        """The pause after an action waits on the page, not a fixed sleep"""
+        automation = _automation_with_responses(
+            _response(_tool_use("left_click")),
+            _response(SimpleNamespace(type="text", text="Done")),
+        )
+        sleep = AsyncMock()
+
+        with patch("src.browser.computer_use.asyncio.sleep", sleep):
+            await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=3)
+
+        sleep.assert_not_awaited()
+        scripts = [c.args[0] for c in automation.page.evaluate.await_args_list]
+        assert computer_use.SETTLE_JS in scripts
+
+    @pytest.mark.asyncio
+    async def test_blocked_check_runs_periodically_on_unchanged_url(self):
+        """Iteration-start blocked probes run every BLOCKED_CHECK_INTERVAL iterations or on URL change"""
+        automation = _automation_with_responses(*[_response(_tool_use("screenshot")) for _ in range(5)])
+
+        await automation.claude_computer_use(task="Fill the form", url=URL, max_iterations=5)
+
+        # Iterations 0 and 3 on the same URL
+        assert automation._check_blocked_state.await_count == 2
+
+        automation._last_blocked_check_url = URL
+        automation.page.url = URL + "/step-2"
+        assert automation._blocked_check_due(1)
+        assert not automation._blocked_check_due(2)
@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 import sys
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -128,6 +128,15 @@ class TestClaudeActionParsing:
         else:
             assert automation.anthropic is None
 
+    def test_claude_client_shared_across_automations(self, monkeypatch):
+        """Automations reuse one Claude client (and connection pool) per API key"""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+        first, second = BrowserAutomation(), BrowserAutomation()
+
+        assert first.anthropic is not None
+        assert first.anthropic is second.anthropic
+
     def test_mock_claude_response_structure(self):
         """Test mock Claude API response structure"""
         # Create mock response from Claude API
@@ -189,3 +198,70 @@ class TestClaudeActionParsing:
         assert claude_x != gemini_x_normalized
         assert claude_x == 640  # Actual pixels
         assert gemini_x_normalized == 500  # Normalized 0-1000
+
+
+class TestClaudeActionDispatch:
+    """Test execute_claude_action routing to per-action handlers"""
+
+    def test_every_documented_action_has_handler(self):
+        """All Claude computer-use actions are registered in the dispatch table"""
+        expected = {
+            "screenshot", "left_click", "type", "key", "mouse_move", "scroll",
+            "right_click", "middle_click", "double_click", "triple_click",
+            "left_click_drag", "wait", "zoom", "hold_key", "release_key",
+            "left_mouse_down", "left_mouse_up",
+        }
+        assert expected <= set(BrowserAutomation._CLAUDE_ACTIONS)
+
+    @pytest.mark.asyncio
+    async def test_unknown_action_returns_false(self):
+        """Unknown actions are rejected without touching the page"""
+        automation = BrowserAutomation()
+        assert await automation.execute_claude_action("teleport", {}) is False
+
+    @pytest.mark.asyncio
+    async def test_handler_exception_returns_false(self):
+        """Errors inside a handler are logged and reported as failure"""
+        automation = BrowserAutomation()
+        automation.page = Mock()
+        assert await automation.execute_claude_action("mouse_move", {}) is False
+
+
+class TestSmartSelect:
+    """Test dropdown selection at a screen position"""
+
+    @pytest.mark.asyncio
+    async def test_select_found_and_matched_in_one_evaluate(self):
+        """Detection and option matching share one round-trip; text is passed as an argument"""
+        automation = BrowserAutomation()
+        automation.page = Mock()
+        automation.page.evaluate = AsyncMock(return_value={"selected": "United Kingdom"})
+
+        assert await automation._smart_select_option(10, 20, "it's uk") is True
+
+        automation.page.evaluate.assert_awaited_once()
+        assert automation.page.evaluate.await_args.args[1] == {"x": 10, "y": 20, "text": "it's uk"}
+
+    @pytest.mark.asyncio
+    async def test_no_select_or_no_match_returns_false(self):
+        """Missing <select> and unmatched options both report failure"""
+        automation = BrowserAutomation()
+        automation.page = Mock()
+
+        automation.page.evaluate = AsyncMock(return_value=None)
+        assert await automation._smart_select_option(10, 20, "uk") is False
+
+        automation.page.evaluate = AsyncMock(return_value={"selected": None})
+        assert await automation._smart_select_option(10, 20, "uk") is False
+
+    @pytest.mark.asyncio
+    async def test_free_form_text_skips_select_probe(self):
+        """Long or multi-line text never touches the page looking for a <select>"""
+        automation = BrowserAutomation()
+        automation.page = Mock()
+        automation.page.evaluate = AsyncMock()
+
+        assert await automation._smart_select_option(10, 20, "x" * 200) is False
+        assert await automation._smart_select_option(10, 20, "Dear team,\nI would like") is False
+
+        automation.page.evaluate.assert_not_awaited()
@@ -0,0 +1,126 @@
+"""Unit tests for repeated-click tracking in BrowserAutomation"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.browser.computer_use import BrowserAutomation
+
+
+def _automation_with_mock_page() -> BrowserAutomation:
+    automation = BrowserAutomation()
+    automation.page = MagicMock()
+    automation.page.mouse.click = AsyncMock()
+    automation._js_click_fallback = AsyncMock(return_value=True)
+    return automation
+
+
+class TestClickHistory:
+    """Test click history bookkeeping and JS fallback triggering"""
+
+    def test_click_history_is_bounded(self):
+        """Click history keeps only the 10 most recent clicks"""
+        automation = BrowserAutomation()
+
+        for i in range(25):
+            automation._click_history.append((i, i))
+
+        assert len(automation._click_history) == 10
+        assert list(automation._click_history)[0] == (15, 15)
+        assert list(automation._click_history)[-1] == (24, 24)
+
+    @pytest.mark.asyncio
+    async def test_repeated_clicks_trigger_js_fallback(self):
+        """Third click at the same spot uses the JS click fallback"""
+        automation = _automation_with_mock_page()
+
+        for _ in range(2):
+            assert await automation.execute_claude_action("left_click", {"coordinate": [100, 200]})
+        automation._js_click_fallback.assert_not_called()
+
+        assert await automation.execute_claude_action("left_click", {"coordinate": [105, 195]})
+        automation._js_click_fallback.assert_awaited_once_with(105, 195)
+
+    @pytest.mark.asyncio
+    async def test_distant_clicks_do_not_trigger_js_fallback(self):
+        """Clicks outside the tolerance window are not treated as repeats"""
+        automation = _automation_with_mock_page()
+
+        for x in (100, 200, 300, 400):
+            await automation.execute_claude_action("left_click", {"coordinate": [x, 200]})
+
+        automation._js_click_fallback.assert_not_called()
+        assert automation.page.mouse.click.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_only_recent_clicks_count_as_repeats(self):
+        """Clicks older than the last five do not count toward the threshold"""
+        automation = _automation_with_mock_page()
+
+        automation._click_history.extend([(50, 50), (50, 50)])
+        automation._click_history.extend((x, 500) for x in (100, 200, 300, 400, 600))
+
+        await automation.execute_claude_action("left_click", {"coordinate": [50, 50]})
+        automation._js_click_fallback.assert_not_called()
+
+    def test_count_recent_clicks_near_respects_tolerance(self):
+        """Clicks exactly at the tolerance boundary are not counted"""
+        automation = BrowserAutomation()
+        automation._click_history.extend([(100, 100), (119, 81), (120, 100)])
+
+        assert automation._count_recent_clicks_near(100, 100) == 2
+
+    @pytest.mark.asyncio
+    async def test_click_uses_cached_cdp_session(self):
+        """Clicks go through the cached CDP session, moving to the target first"""
+        automation = _automation_with_mock_page()
+        automation._cdp = MagicMock()
+        automation._cdp.send = AsyncMock()
+
+        assert await automation.execute_claude_action("left_click", {"coordinate": [100, 200]})
+
+        automation.page.mouse.click.assert_not_called()
+        event_types = [call.args[1]["type"] for call in automation._cdp.send.await_args_list]
+        assert event_types == ["mouseMoved", "mousePressed", "mouseReleased"]
+        assert automation._cdp.send.await_args_list[0].args[1] == {"type": "mouseMoved", "x": 100, "y": 200}
+
+    @pytest.mark.asyncio
+    async def test_js_click_fallback_passes_coordinates_as_arguments(self):
+        """The click script source is the same for every position"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.evaluate = AsyncMock(return_value={"success": True, "tagName": "BUTTON", "text": "Submit"})
+
+        assert await automation._js_click_fallback(10, 20)
+        assert await automation._js_click_fallback(300, 400)
+
+        first, second = automation.page.evaluate.await_args_list
+        assert first.args[0] is second.args[0]
+        assert [first.args[1], second.args[1]] == [{"x": 10, "y": 20}, {"x": 300, "y": 400}]
+
+    @pytest.mark.asyncio
+    async def test_triple_click_and_drag_use_cdp_session(self):
+        """Multi-clicks and drags are sent as raw CDP input events in order"""
+        automation = _automation_with_mock_page()
+        automation._cdp = MagicMock()
+        automation._cdp.send = AsyncMock()
+
+        assert await automation.execute_claude_action("triple_click", {"coordinate": [10, 20]})
+        assert await automation.execute_claude_action(
+            "left_click_drag", {"coordinate": [10, 20], "to_coordinate": [30, 40]}
+        )
+
+        events = [(call.args[1]["type"], call.args[1].get("clickCount")) for call in automation._cdp.send.await_args_list]
+        assert events == [
+            ("mouseMoved", None),
+            ("mousePressed", 1), ("mouseReleased", 1),
+            ("mousePressed", 2), ("mouseReleased", 2),
+            ("mousePressed", 3), ("mouseReleased", 3),
+            ("mouseMoved", None), ("mousePressed", 1), ("mouseMoved", None), ("mouseReleased", 1),
+        ]
+        automation.page.mouse.click.assert_not_called()
@@ -0,0 +1,228 @@
+"""Unit tests for completion pattern detection in BrowserAutomation"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.browser import computer_use
+from src.browser.computer_use import (
+    BrowserAutomation,
+    check_blocked_indicators,
+    check_success_indicators,
+    detect_workflow_stage,
+)
+
+
+PLATFORM_CONFIG = {
+    "success_indicators": ["Application Submitted"],
+    "blocked_indicators": ["Project Closed"],
+    "failure_indicators": ["Error Occurred"],
+}
+
+
+class TestCompletionDetection:
+    """Test success/blocked pattern scanning used by the agent loops"""
+
+    def test_platform_success_pattern_matches_case_insensitively(self):
+        """Platform success indicators match regardless of case"""
+        automation = BrowserAutomation()
+
+        success, blocked = automation._scan_completion_patterns(
+            "Your APPLICATION SUBMITTED to the client.", PLATFORM_CONFIG
+        )
+
+        assert success == "application submitted"
+        assert blocked is None
+
+    def test_generic_patterns_used_without_platform_config(self):
+        """Generic fallbacks apply when no platform config is given"""
+        automation = BrowserAutomation()
+
+        success, _ = automation._scan_completion_patterns("Thank you for applying!")
+        _, blocked = automation._scan_completion_patterns("This invitation has expired.")
+
+        assert success == "thank you for applying"
+        assert blocked == "invitation has expired"
+
+    def test_failure_indicators_count_as_blocked(self):
+        """Platform failure indicators are part of the blocked scan"""
+        automation = BrowserAutomation()
+
+        success, blocked = automation._scan_completion_patterns(
+            "An error occurred while saving.", PLATFORM_CONFIG
+        )
+
+        assert success is None
+        assert blocked == "error occurred"
+
+    def test_success_takes_precedence_over_blocked(self):
+        """Blocked patterns are not reported when a success pattern matches"""
+        automation = BrowserAutomation()
+
+        success, blocked = automation._scan_completion_patterns(
+            "You're all set. Project closed.", PLATFORM_CONFIG
+        )
+
+        assert success == "you're all set"
+        assert blocked is None
+
+    def test_patterns_lowercased_once_per_config(self):
+        """Lowercased patterns are reused for the same platform config"""
+        automation = BrowserAutomation()
+
+        first = automation._completion_patterns(PLATFORM_CONFIG)
+        second = automation._completion_patterns(PLATFORM_CONFIG)
+        other = automation._completion_patterns(None)
+
+        assert first is not None and first[0] is second[0]
+        assert "application submitted" not in other[0]
+
+    def test_page_without_patterns_returns_nothing(self):
+        """Mid-form pages match neither success nor blocked patterns"""
+        automation = BrowserAutomation()
+
+        page_text = "Please fill in your hourly rate. " * 2000
+
+        assert automation._scan_completion_patterns(page_text, PLATFORM_CONFIG) == (None, None)
+
+
+class TestIndicatorHelpers:
+    """Test the module-level indicator and workflow stage helpers"""
+
+    def test_generic_indicator_matches_case_insensitively(self):
+        """Generic indicators match mixed-case page text and return the listed phrase"""
+        assert check_success_indicators("Your Application Submitted!") == "application submitted"
+        assert check_blocked_indicators("This PROJECT CLOSED yesterday") == "project closed"
+
+    def test_platform_indicators_checked_before_generic(self):
+        """Platform indicators win and are returned as given"""
+        page_text = "Thank you for applying. Consultation Booked."
+
+        assert check_success_indicators(page_text, ["Consultation Booked"]) == "Consultation Booked"
+
+    def test_workflow_stage_uses_stage_order(self):
+        """The first stage (in definition order) with a matching keyword is returned"""
+        assert detect_workflow_stage("Please SELECT TIME and confirm") == "scheduling"
+        assert detect_workflow_stage("nothing relevant here") is None
+
+    def test_generic_patterns_are_frozen_and_unique(self):
+        """Module pattern tables cannot be mutated and hold no duplicate phrases"""
+        for indicators in (
+            computer_use.SUCCESS_INDICATORS,
+            computer_use.FAILURE_INDICATORS,
+            computer_use.BLOCKED_INDICATORS,
+            *computer_use.WORKFLOW_STAGES.values(),
+        ):
+            assert isinstance(indicators, tuple)
+            assert len(set(indicators)) == len(indicators)
+
+        with pytest.raises(TypeError):
+            computer_use.WORKFLOW_STAGES["extra"] = ("x",)
+
+
+class TestPageIndicatorCache:
+    """Test per-page-text caching of indicator detection"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_text_scanned_once(self):
+        """All state checks on the same page text share one scan"""
+        automation = BrowserAutomation(platform_config=PLATFORM_CONFIG)
+        automation.page = MagicMock()
+        automation.page.evaluate = AsyncMock(
+            return_value={"fingerprint": "doc:1", "text": "Application Submitted. Thank you!"}
+        )
+
+        with patch.object(computer_use, "_first_workflow_stage", wraps=computer_use._first_workflow_stage) as scan:
+            assert await automation._check_success_state() == "Application Submitted"
+            assert await automation._check_blocked_state() is None
+            assert await automation._check_failure_state() is None
+            assert await automation._detect_workflow_stage() == "application_form"
+
+        assert scan.call_count == 1
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """The oldest page texts are evicted beyond the cache size"""
+        monkeypatch.setattr(computer_use, "DETECTION_CACHE_SIZE", 2)
+        automation = BrowserAutomation()
+
+        for text in ("first page", "second page", "third page"):
+            automation._page_indicators(text)
+
+        assert len(automation._detection_cache) == 2
+        assert hash("first page") not in automation._detection_cache
+
+
+class TestPageTextFingerprint:
+    """Test DOM-fingerprint gating of body text reads"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_dom_reuses_last_text(self):
+        """Body text only crosses CDP again once the fingerprint changes"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.evaluate = AsyncMock(side_effect=[
+            {"fingerprint": "doc:1", "text": "Step 1 of 2"},
+            {"fingerprint": "doc:1", "text": None},
+            {"fingerprint": "doc:3", "text": "Application submitted"},
+        ])
+
+        assert await automation._page_text() == "Step 1 of 2"
+        assert await automation._page_text() == "Step 1 of 2"
+        assert await automation._page_text() == "Application submitted"
+
+        fingerprints = [c.args[1] for c in automation.page.evaluate.await_args_list]
+        assert fingerprints == [None, "doc:1", "doc:1"]
+
+
+class TestIndicatorTables:
+    """Test per-config caching of the lowercased indicator tables"""
+
+    def test_tables_built_once_per_platform_config(self):
+        """Platform indicators are lowercased once and checked before generic ones"""
+        automation = BrowserAutomation(platform_config=PLATFORM_CONFIG)
+
+        first = automation._indicator_tables()
+        second = automation._indicator_tables()
+
+        assert first is second
+        assert first["success"][0] == ("Application Submitted", "application submitted")
+
+    def test_new_platform_config_rebuilds_tables(self):
+        """Swapping platform_config is picked up on the next scan"""
+        automation = BrowserAutomation(platform_config=PLATFORM_CONFIG)
+        automation._indicator_tables()
+
+        automation.platform_config = {"success_indicators": ["Booked"]}
+
+        assert automation._page_indicators("Call booked")["success"] == "Booked"
+
+
+class TestTaskCompletionCheck:
+    """Test the consolidated completion check"""
+
+    @pytest.mark.asyncio
+    async def test_page_text_read_once_for_all_checks(self):
+        """Failure, blocked, success, stage and pattern checks share one page read"""
+        automation = BrowserAutomation(platform_config=PLATFORM_CONFIG)
+        automation.page = MagicMock()
+        automation.page.evaluate = AsyncMock(return_value={"fingerprint": "doc:1", "text": "Step 2: your details"})
+        automation.page.text_content = AsyncMock()
+
+        assert await automation._check_task_completion(PLATFORM_CONFIG) == (False, False, [])
+
+        automation.page.evaluate.assert_awaited_once()
+        automation.page.text_content.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unreadable_page_is_not_complete(self):
+        """A page that cannot be read reports no completion instead of raising"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.evaluate = AsyncMock(side_effect=RuntimeError("Target closed"))
+
+        assert await automation._check_task_completion() == (False, False, [])
@@ -15,6 +15,7 @@ from src.browser.sanitize import (
     _sanitize_dict,
     _sanitize_list,
 )
+from src.browser.computer_use import _sanitize_action_log
 
 
 class TestCredentialSanitization:
@@ -244,3 +245,39 @@ class TestCredentialSanitization:
         assert sanitized["password"] == "***REDACTED***"
         assert sanitized["remember_me"] is True
         assert sanitized["session_id"] == "abc-123-def-456"
+
+
+class TestActionLogSanitization:
+    """Test redaction of typed text in computer-use action logs"""
+
+    def test_password_like_typed_text_redacted(self):
+        """Password-looking text in type actions is redacted"""
+        log = [{"action": "type", "text": "Hunter2!x"}, {"action": "type_text_at", "text": "s3cretPass"}]
+
+        assert [e["text"] for e in _sanitize_action_log(log)] == ["***REDACTED***"] * 2
+
+    def test_emails_urls_and_prose_kept(self):
+        """Emails, URLs and ordinary sentences are left readable"""
+        texts = ["john.doe@company.com", "https://example.com/p/1", "I have 10 years of experience"]
+        log = [{"action": "type", "text": text} for text in texts]
+
+        assert [e["text"] for e in _sanitize_action_log(log)] == texts
+
+    def test_original_log_not_modified(self):
+        """Sanitizing returns new entries and leaves the live log intact"""
+        log = [{"action": "type", "text": "Hunter2!x"}, {"action": "left_click", "coordinate": [1, 2]}]
+
+        sanitized = _sanitize_action_log(log)
+
+        assert log[0]["text"] == "Hunter2!x"
+        assert sanitized is not log
+
+    def test_only_redacted_entries_copied(self):
+        """Entries without anything to redact are passed through, not copied"""
+        click = {"action": "left_click", "coordinate": [1, 2]}
+        email = {"action": "type", "text": "john.doe@company.com"}
+
+        sanitized = _sanitize_action_log([click, email, {"action": "type", "text": "Hunter2!x"}])
+
+        assert sanitized[0] is click
+        assert sanitized[1] is email
@@ -0,0 +1,570 @@
+"""Unit tests for dashboard batch helpers in BrowserAutomation"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.browser.computer_use import INVITATION_CONTENT_LIMIT, BrowserAutomation
+
+
+def _automation_with_count_result(*results) -> BrowserAutomation:
+    automation = BrowserAutomation()
+    automation.page = MagicMock()
+    automation.page.evaluate = AsyncMock(side_effect=list(results))
+    return automation
+
+
+class TestInvitationCount:
+    """Test generic invitation counting on dashboard pages"""
+
+    @pytest.mark.asyncio
+    async def test_count_from_header_text(self):
+        """A count matched in the page is returned as-is"""
+        automation = _automation_with_count_result({"pattern": 0, "count": 13, "actionable": 0})
+
+        assert await automation._get_generic_invitation_count() == 13
+
+    @pytest.mark.asyncio
+    async def test_patterns_and_keywords_matched_in_page(self):
+        """Count patterns and button keywords are sent to one in-page evaluate"""
+        automation = _automation_with_count_result({"pattern": 3, "count": 4, "actionable": 0})
+
+        await automation._get_generic_invitation_count()
+
+        args = automation.page.evaluate.await_args.args[1]
+        assert args["patterns"][0] == r'Invitations?\s*\((\d+)\)'
+        assert "vetting" in args["keywords"]
+        assert automation.page.evaluate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_actionable_buttons_counted_without_text_match(self):
+        """Actionable buttons are the fallback when no textual count matches"""
+        automation = _automation_with_count_result({"pattern": None, "count": None, "actionable": 2})
+
+        assert await automation._get_generic_invitation_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_card_fallback_counts_all_selectors_in_one_call(self):
+        """Without a textual count or buttons, card selectors are counted in one evaluate"""
+        automation = _automation_with_count_result(
+            {"pattern": None, "count": None, "actionable": 0},
+            [0, 3, 5, 0, 0, 0],
+        )
+
+        assert await automation._get_generic_invitation_count() == 3
+        assert automation.page.evaluate.await_count == 2
+
+
+class TestBatchResourceBlocking:
+    """Test request filtering installed for the batch flow"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("resource_type,aborted", [
+        ("media", True),
+        ("ping", True),
+        ("image", False),
+        ("font", False),
+        ("document", False),
+    ])
+    async def test_route_aborts_only_blocked_types(self, resource_type, aborted):
+        """Heavy media and beacons are aborted, everything else continues"""
+        automation = BrowserAutomation()
+        automation.context = MagicMock()
+        automation.context.route = AsyncMock()
+
+        await automation._block_batch_resources()
+        handler = automation.context.route.await_args.args[1]
+
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.abort = AsyncMock()
+        route.continue_ = AsyncMock()
+        await handler(route)
+
+        assert route.abort.await_count == (1 if aborted else 0)
+        assert route.continue_.await_count == (0 if aborted else 1)
+
+
+class TestPageReadiness:
+    """Test load-state waits that replace fixed sleeps"""
+
+    @pytest.mark.asyncio
+    async def test_wait_for_page_ready_uses_load_state(self):
+        """Readiness is tied to Playwright's load state"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.wait_for_load_state = AsyncMock()
+
+        assert await automation._wait_for_page_ready() is True
+        automation.page.wait_for_load_state.assert_awaited_once_with("networkidle", timeout=5000)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_page_ready_timeout_is_not_fatal(self):
+        """A page that never settles does not abort the batch"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.wait_for_load_state = AsyncMock(side_effect=TimeoutError("timeout"))
+
+        assert await automation._wait_for_page_ready() is False
+
+    @pytest.mark.asyncio
+    async def test_return_to_dashboard_waits_for_load(self):
+        """Returning to the dashboard waits on load state, not a sleep"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.goto = AsyncMock()
+        automation.page.wait_for_load_state = AsyncMock()
+
+        assert await automation._return_to_dashboard("https://example.com/dashboard") is True
+        automation.page.wait_for_load_state.assert_awaited_once()
+
+
+class TestInvitationFit:
+    """Test keyword-based fit evaluation for dashboard invitations"""
+
+    LONG_FILLER = " The client would like to speak with an experienced practitioner."
+
+    def test_good_fit_keywords_accept(self):
+        """Invitations with several good-fit keywords are accepted"""
+        automation = BrowserAutomation()
+        invitation = {
+            "title": "Expert call",
+            "content": "Cloud infrastructure and Kubernetes platform strategy." + self.LONG_FILLER,
+        }
+
+        assert automation._evaluate_invitation_fit(invitation, {}) is True
+
+    def test_poor_fit_keywords_decline(self):
+        """Invitations dominated by poor-fit keywords are declined"""
+        automation = BrowserAutomation()
+        invitation = {
+            "title": "Industry consultation",
+            "content": "Hedge fund derivatives desk and real estate appraisal." + self.LONG_FILLER,
+        }
+
+        assert automation._evaluate_invitation_fit(invitation, {}) is False
+
+    def test_paid_survey_accepted_regardless_of_keywords(self):
+        """Surveys are accepted before any keyword counting"""
+        automation = BrowserAutomation()
+        invitation = {
+            "title": "Industry consultation",
+            "content": "Short survey on hedge fund derivatives." + self.LONG_FILLER,
+        }
+
+        assert automation._evaluate_invitation_fit(invitation, {}) is True
+
+    def test_title_keywords_count_towards_fit(self):
+        """Keywords in the title count the same as keywords in the content"""
+        automation = BrowserAutomation()
+        invitation = {
+            "title": "Kubernetes migration on AWS",
+            "content": "Discussion of hedge fund operations." + self.LONG_FILLER,
+        }
+
+        assert automation._evaluate_invitation_fit(invitation, {}) is True
+
+
+class TestClickGenericInvitation:
+    """Test generic invitation navigation"""
+
+    @pytest.mark.asyncio
+    async def test_clicks_first_selector_with_visible_match(self):
+        """Selectors are tried in priority order with visibility filtered in-page"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+
+        empty = MagicMock()
+        empty.count = AsyncMock(return_value=0)
+        match = MagicMock()
+        match.count = AsyncMock(return_value=1)
+        match.inner_text = AsyncMock(return_value="Project X")
+        match.get_attribute = AsyncMock(return_value="/project/1")
+        match.click = AsyncMock()
+
+        def locator(selector):
+            result = MagicMock()
+            result.first = match if selector.startswith('a[href*="project"]') else empty
+            return result
+
+        automation.page.locator = MagicMock(side_effect=locator)
+
+        assert await automation._click_generic_invitation() is True
+        match.click.assert_awaited_once()
+        first_selector = automation.page.locator.call_args_list[0].args[0]
+        assert first_selector == 'a[href*="response"] >> visible=true'
+
+
+class TestLoginLocator:
+    """Test resolving login fields through one OR-ed locator"""
+
+    @staticmethod
+    def _page(counts: dict = None, wait_error: Exception = None) -> MagicMock:
+        """Page whose per-selector locators report the given visible match counts"""
+        page = MagicMock()
+        union = MagicMock()
+        union.or_ = MagicMock(return_value=union)
+        union.first.wait_for = AsyncMock(side_effect=wait_error)
+        page.union = union
+        page.candidates = {}
+
+        def locator(selector):
+            candidate = MagicMock()
+            candidate.or_ = MagicMock(return_value=union)
+            candidate.count = AsyncMock(return_value=(counts or {}).get(selector.split(" >> ")[0], 0))
+            page.candidates[selector.split(" >> ")[0]] = candidate
+            return candidate
+
+        page.locator = MagicMock(side_effect=locator)
+        return page
+
+    @pytest.mark.asyncio
+    async def test_selectors_resolve_as_one_locator(self):
+        """All selectors are OR-ed and waited on once"""
+        selectors = ['input[name="Email"]', 'input[name="email"]', 'input[type="email"]']
+        automation = BrowserAutomation()
+        automation.page = self._page({'input[type="email"]': 1})
+
+        element = await automation._find_login_element("email", selectors)
+
+        assert element is automation.page.candidates['input[type="email"]'].first
+        assert [c.args[0] for c in automation.page.locator.call_args_list] == [
+            f"{selector} >> visible=true" for selector in selectors
+        ]
+        automation.page.union.first.wait_for.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_list_order_beats_document_order(self):
+        """A decoy submit button before the login form does not outrank the login button"""
+        selectors = ['input[value="Log In"]', 'button[type="submit"]', 'button:has-text("Sign")']
+        automation = BrowserAutomation()
+        # The header search form's submit button comes first in the DOM
+        automation.page = self._page({'button[type="submit"]': 2, 'input[value="Log In"]': 1})
+
+        element = await automation._find_login_element("submit", selectors)
+
+        assert element is automation.page.candidates['input[value="Log In"]'].first
+
+    @pytest.mark.asyncio
+    async def test_missing_element_returns_none(self):
+        """No visible match within the timeout returns None"""
+        automation = BrowserAutomation()
+        automation.page = self._page(wait_error=TimeoutError("not visible"))
+
+        assert await automation._find_login_element("password", ['input[type="password"]']) is None
+
+
+class TestInvitationFormPrompt:
+    """Test the prompt split used for per-invitation form filling"""
+
+    @pytest.mark.asyncio
+    async def test_profile_preamble_is_stable_system_context(self):
+        """Profile context is passed as cacheable system context, identical per invitation"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.claude_computer_use = AsyncMock(return_value=(True, []))
+        profile = {"name": "Test Expert", "company": "Acme", "role": "Architect"}
+
+        for url in ("https://example.com/p/1", "https://example.com/p/2"):
+            automation.page.url = url
+            await automation._process_invitation_form(profile, max_iterations=5)
+
+        first, second = automation.claude_computer_use.await_args_list
+        assert first.kwargs["system_context"] == second.kwargs["system_context"]
+        assert "Test Expert" in first.kwargs["system_context"]
+        assert "Test Expert" not in first.kwargs["task"]
+        assert first.kwargs["url"] != second.kwargs["url"]
+
+    @pytest.mark.asyncio
+    async def test_platform_form_handler_skips_claude(self):
+        """A successful platform form handler completes the form without Claude"""
+        handler = AsyncMock(return_value=True)
+        automation = BrowserAutomation(platform_config={"form_handler": handler})
+        automation.page = MagicMock()
+        automation.claude_computer_use = AsyncMock(return_value=(True, []))
+        profile = {"name": "Test Expert"}
+
+        success, _ = await automation._process_invitation_form(profile, max_iterations=5)
+
+        assert success is True
+        handler.assert_awaited_once_with(automation.page, profile)
+        automation.claude_computer_use.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_form_handler_falls_back_to_claude(self):
+        """Claude fills the form when the platform handler fails"""
+        handler = AsyncMock(side_effect=RuntimeError("selector missing"))
+        automation = BrowserAutomation(platform_config={"form_handler": handler})
+        automation.page = MagicMock()
+        automation.page.url = "https://example.com/p/1"
+        automation.claude_computer_use = AsyncMock(return_value=(True, []))
+
+        success, _ = await automation._process_invitation_form({}, max_iterations=5)
+
+        assert success is True
+        automation.claude_computer_use.assert_awaited_once()
+
+
+class TestSharedConversation:
+    """Test the Claude conversation shared across a batch"""
+
+    def test_new_task_appends_user_turn_after_assistant(self):
+        """A finished assistant turn is followed by the next task"""
+        automation = BrowserAutomation()
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": "first"}]},
+            {"role": "assistant", "content": [MagicMock(type="text")]},
+        ]
+
+        automation._append_user_turn(messages, [{"type": "text", "text": "second"}])
+
+        assert len(messages) == 3
+        assert messages[-1] == {"role": "user", "content": [{"type": "text", "text": "second"}]}
+
+    def test_new_task_merges_into_trailing_user_turn(self):
+        """Tool results and the next task share one user turn"""
+        automation = BrowserAutomation()
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": "first"}]},
+            {"role": "assistant", "content": [MagicMock(type="tool_use")]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1"}]},
+        ]
+
+        automation._append_user_turn(messages, [{"type": "text", "text": "second"}])
+
+        assert len(messages) == 3
+        assert [block["type"] for block in messages[-1]["content"]] == ["tool_result", "text"]
+
+    def test_merged_task_turn_keeps_breakpoint_limit(self):
+        """A breakpoint left mid-turn by an earlier run is cleared when the next task merges in"""
+        automation = BrowserAutomation()
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": "first"}]},
+            {"role": "assistant", "content": [MagicMock(type="tool_use")]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1"}]},
+            {"role": "assistant", "content": [MagicMock(type="tool_use")]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t2"}]},
+        ]
+        automation._inject_prompt_caching(messages)
+
+        automation._append_user_turn(messages, [{"type": "text", "text": "second"}])
+        automation._inject_prompt_caching(messages)
+
+        marked = [
+            block for message in messages if message["role"] == "user"
+            for block in message["content"] if "cache_control" in block
+        ]
+        assert len(marked) == 3
+        assert messages[-1]["content"][0].get("cache_control") is None
+        assert messages[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_dangling_tool_use_resets_conversation(self):
+        """A run interrupted mid-action does not poison the next task"""
+        automation = BrowserAutomation()
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": "first"}]},
+            {"role": "assistant", "content": [MagicMock(type="tool_use")]},
+        ]
+
+        automation._append_user_turn(messages, [{"type": "text", "text": "second"}])
+
+        assert messages == [{"role": "user", "content": [{"type": "text", "text": "second"}]}]
+
+    @pytest.mark.asyncio
+    async def test_close_browser_is_deferred_while_batch_holds_it(self):
+        """Agent runs inside a batch do not close the shared browser"""
+        automation = BrowserAutomation()
+        automation.context = MagicMock()
+        automation.context.close = AsyncMock()
+        automation.page = MagicMock()
+        automation._keep_browser_open = True
+
+        await automation.close_browser()
+
+        automation.context.close.assert_not_called()
+        assert automation.page is not None
+
+
+class TestInvitationFeed:
+    """Test using the dashboard's JSON API instead of DOM scraping"""
+
+    @staticmethod
+    def _json_response(url: str, payload) -> MagicMock:
+        response = MagicMock()
+        response.url = url
+        response.headers = {"content-type": "application/json; charset=utf-8"}
+        response.json = AsyncMock(return_value=payload)
+        return response
+
+    @pytest.mark.asyncio
+    async def test_feed_captured_from_nested_list(self):
+        """Invitation lists nested under a container key are captured"""
+        automation = BrowserAutomation()
+        response = self._json_response(
+            "https://example.com/api/invitations?page=1",
+            {"items": [{"id": 1, "url": "/p/1"}, {"id": 2, "url": "/p/2"}], "total": 2},
+        )
+
+        await automation._capture_invitation_feed(response)
+
+        assert [item["id"] for item in automation._invitation_feed] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_unrelated_responses_ignored(self):
+        """Only invitation JSON endpoints are considered"""
+        automation = BrowserAutomation()
+        response = self._json_response("https://example.com/api/profile", [{"id": 1}])
+
+        await automation._capture_invitation_feed(response)
+
+        assert automation._invitation_feed == []
+        response.json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_feed_drives_count_and_navigation(self):
+        """The captured feed is counted and opened without DOM scraping"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.url = "https://example.com/dashboard"
+        automation.page.goto = AsyncMock()
+        automation.page.evaluate = AsyncMock()
+        automation._invitation_feed = [{"url": "/p/1"}, {"url": "/p/2"}]
+
+        assert await automation._get_generic_invitation_count() == 2
+        automation.page.evaluate.assert_not_called()
+
+        assert await automation._click_generic_invitation() is True
+        assert await automation._click_generic_invitation() is True
+        opened = [call.args[0] for call in automation.page.goto.await_args_list]
+        assert opened == ["https://example.com/p/1", "https://example.com/p/2"]
+
+
+class TestConcurrentInvitations:
+    """Test parallel processing of invitations with known detail URLs"""
+
+    @staticmethod
+    def _batch_automation(contexts):
+        """Automation whose browser hands out mock worker contexts, recorded in contexts"""
+        automation = BrowserAutomation()
+        automation.context = MagicMock()
+        automation.context.storage_state = AsyncMock(return_value={"cookies": []})
+
+        async def new_context(storage_state=None):
+            assert storage_state == {"cookies": []}
+            context = MagicMock()
+            context.add_init_script = AsyncMock()
+            context.route = AsyncMock()
+            context.close = AsyncMock()
+            page = MagicMock()
+            page.goto = AsyncMock()
+            page.wait_for_load_state = AsyncMock()
+            context.new_page = AsyncMock(return_value=page)
+            contexts.append(context)
+            return context
+
+        automation.browser = MagicMock()
+        automation.browser.new_context = AsyncMock(side_effect=new_context)
+        return automation
+
+    @staticmethod
+    async def _details(self):
+        return {"title": self.page.goto.await_args.args[0], "content": "survey"}
+
+    @pytest.mark.asyncio
+    async def test_urls_split_across_worker_contexts(self, monkeypatch):
+        """Every URL is processed once, each worker on its own context"""
+        contexts = []
+        automation = self._batch_automation(contexts)
+
+        async def process_form(self, profile_context, max_iterations, conversation=None):
+            self._log_action({"action": "type"})
+            return True, self.action_log[-1:]
+
+        monkeypatch.setattr(BrowserAutomation, "_extract_invitation_details", self._details)
+        monkeypatch.setattr(BrowserAutomation, "_process_invitation_form", process_form)
+
+        urls = [f"https://example.com/p/{i}" for i in range(5)]
+        results, actions = await automation._process_invitations_concurrently(urls, {}, 5, concurrency=2)
+
+        assert len(contexts) == 2
+        assert sorted(r["invitation"] for r in results) == urls
+        assert all(r["action"] == "accepted" for r in results)
+        assert len(actions) == 5
+        for context in contexts:
+            context.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_worker_failure_mid_form_is_recorded(self, monkeypatch):
+        """A form that raises still yields a failed result and its partial actions; the worker moves on"""
+        contexts = []
+        automation = self._batch_automation(contexts)
+
+        async def process_form(self, profile_context, max_iterations, conversation=None):
+            self._log_action({"action": "type"})
+            if self.page.goto.await_args.args[0].endswith("/1"):
+                raise RuntimeError("page crashed")
+            return True, self.action_log[-1:]
+
+        monkeypatch.setattr(BrowserAutomation, "_extract_invitation_details", self._details)
+        monkeypatch.setattr(BrowserAutomation, "_process_invitation_form", process_form)
+
+        urls = [f"https://example.com/p/{i}" for i in range(3)]
+        results, actions = await automation._process_invitations_concurrently(urls, {}, 5, concurrency=1)
+
+        assert len(results) == 3
+        failed = [r for r in results if not r["success"]]
+        assert failed == [{
+            "invitation": urls[1], "action": "failed", "success": False, "error": "page crashed"
+        }]
+        assert len(actions) == 3
+        contexts[0].close.assert_awaited_once()
+
+
+class TestSavedSession:
+    """Test persisting the batch login session between runs"""
+
+    def test_login_url_detection(self):
+        """Login redirects are recognised from the URL"""
+        automation = BrowserAutomation()
+
+        assert automation._is_login_url("https://example.com/Login?next=/dashboard")
+        assert not automation._is_login_url("https://example.com/dashboard")
+
+    @pytest.mark.asyncio
+    async def test_auth_state_saved_per_platform_with_private_permissions(self, tmp_path, monkeypatch):
+        """Saved state lands in logs/ under the platform name, readable only by the owner"""
+        monkeypatch.chdir(tmp_path)
+        automation = BrowserAutomation(platform="glg")
+        automation.context = MagicMock()
+        automation.context.storage_state = AsyncMock(return_value={"cookies": []})
+        saved = tmp_path / "logs" / "auth_state_glg.json"
+        # A file left world-readable by an older run is tightened before it is rewritten
+        saved.parent.mkdir()
+        saved.write_text("{}")
+        saved.chmod(0o644)
+
+        await automation._save_auth_state()
+
+        assert json.loads(saved.read_text()) == {"cookies": []}
+        assert saved.stat().st_mode & 0o777 == 0o600
+
+
+class TestInvitationDetails:
+    """Test invitation detail extraction"""
+
+    @pytest.mark.asyncio
+    async def test_details_read_in_one_bounded_evaluate(self):
+        """Title and truncated content come back from a single round-trip"""
+        automation = _automation_with_count_result({"title": "Project Alpha", "content": "Scope"})
+        automation.page.url = "https://example.com/invitations/7"
+
+        details = await automation._extract_invitation_details()
+
+        assert details == {"title": "Project Alpha", "url": "https://example.com/invitations/7", "content": "Scope"}
+        assert automation.page.evaluate.await_args.args[1] == INVITATION_CONTENT_LIMIT
@@ -3,12 +3,14 @@
 import pytest
 from pathlib import Path
 import sys
-from unittest.mock import Mock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.browser import computer_use
 from src.browser.computer_use import BrowserAutomation
 
 
@@ -68,7 +70,49 @@ class TestGeminiResponseParsing:
         assert isinstance(automation.action_log, list)
         assert len(automation.action_log) == 0
 
+    def test_flush_new_actions_returns_only_unflushed_entries(self):
+        """Test incremental action log flushing"""
+        automation = BrowserAutomation()
+
+        automation._log_action({"action": "click_at", "x": 1, "y": 2})
+        automation._log_action({"action": "hover_at", "x": 3, "y": 4})
+        first = automation.flush_new_actions()
+        assert [entry["action"] for entry in first] == ["click_at", "hover_at"]
+
+        assert automation.flush_new_actions() == []
+
+        automation._log_action({"action": "go_back"})
+        assert [entry["action"] for entry in automation.flush_new_actions()] == ["go_back"]
+        assert len(automation.action_log) == 3
+
+    @pytest.mark.asyncio
+    async def test_action_names_are_interned(self):
+        """Test model-supplied action names are interned before logging"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.protect_form_operation = AsyncMock(
+            return_value={"allow_action": False, "warning": "test"}
+        )
+
+        action_name = "".join(["wait_", "5_seconds"])
+        await automation.execute_computer_use_action(action_name, {})
 
+        assert automation.action_log[-1]["action"] is sys.intern("wait_5_seconds")
+
+    @pytest.mark.asyncio
+    async def test_actions_dispatched_through_handler_table(self):
+        """Test known actions reach their handler with the viewport size and unknown ones fail"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.viewport_size = {"width": 1280, "height": 800}
+        automation.protect_form_operation = AsyncMock(return_value={"allow_action": True})
+        handler = AsyncMock(return_value=True)
+
+        with patch.dict(BrowserAutomation._GEMINI_ACTIONS, {"hover_at": handler}):
+            assert await automation.execute_computer_use_action("hover_at", {"x": 1, "y": 2})
+            assert not await automation.execute_computer_use_action("teleport", {})
+
+        handler.assert_awaited_once_with(automation, {"x": 1, "y": 2}, 1280, 800)
 
     def test_mock_gemini_response_with_function_call(self):
         """Test parsing a mock Gemini response with function call"""
@@ -133,3 +177,120 @@ class TestGeminiResponseParsing:
 
         # Should detect as having no useful parts
         assert not mock_response.candidates[0].content.parts
+
+
+def _function_call(name: str) -> SimpleNamespace:
+    return SimpleNamespace(function_call=SimpleNamespace(name=name, args={"x": 1, "y": 2}), text=None)
+
+
+def _gemini_response(*parts) -> SimpleNamespace:
+    return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(role="model", parts=list(parts)))])
+
+
+def _gemini_automation(*responses) -> BrowserAutomation:
+    """BrowserAutomation with a stubbed page and scripted Gemini responses"""
+    automation = BrowserAutomation()
+    automation.gemini_client = MagicMock()
+    automation.gemini_client.aio.models.generate_content = AsyncMock(side_effect=list(responses))
+    automation.start_browser = AsyncMock()
+    automation.page = MagicMock()
+    automation.page.goto = AsyncMock()
+    automation._page_text = AsyncMock(return_value="")
+    automation._dismiss_platform_dialogs = AsyncMock(return_value=None)
+    automation._check_blocked_state = AsyncMock(return_value=None)
+    automation.take_screenshot = AsyncMock(return_value=b"jpeg")
+    automation.execute_computer_use_action = AsyncMock(return_value=True)
+    automation._evaluate_page = AsyncMock(return_value={
+        "failure": None, "blocked": None, "success": "application submitted", "stage": None, "text": ""
+    })
+    automation._finish_run = AsyncMock()
+    return automation
+
+
+class TestGeminiLoop:
+    """Test per-turn behaviour of gemini_computer_use"""
+
+    @pytest.mark.asyncio
+    async def test_one_screenshot_per_turn_of_actions(self):
+        """All calls in a turn run before a single screenshot shared by their responses"""
+        automation = _gemini_automation(
+            _gemini_response(_function_call("click_at"), _function_call("type_text_at")),
+            _gemini_response(SimpleNamespace(function_call=None, text="Done")),
+        )
+
+        with patch("src.browser.computer_use.auto_accept_cookies", AsyncMock(return_value=False)), \
+             patch("src.browser.computer_use.asyncio.sleep", AsyncMock()):
+            success, _ = await automation.gemini_computer_use(task="Fill the form", url="https://example.com")
+
+        assert success is True
+        assert automation.execute_computer_use_action.await_count == 2
+        # Initial screenshot plus one for the whole turn
+        assert automation.take_screenshot.await_count == 2
+
+        contents = automation.gemini_client.aio.models.generate_content.call_args.kwargs["contents"]
+        function_responses = [part.function_response for part in contents[2].parts if part.function_response]
+        assert [fr.name for fr in function_responses] == ["click_at", "type_text_at"]
+        assert all(fr.parts[0].inline_data.data == b"jpeg" for fr in function_responses)
+
+        # Every request reuses the module-level model config
+        for call in automation.gemini_client.aio.models.generate_content.call_args_list:
+            assert call.kwargs["config"] is computer_use.GEMINI_COMPUTER_USE_CONFIG
+
+    @pytest.mark.asyncio
+    async def test_blocked_indicator_after_turn_stops_run(self):
+        """A project closed by the turn's actions ends the run before the next request"""
+        automation = _gemini_automation(
+            _gemini_response(_function_call("click_at")),
+            _gemini_response(_function_call("click_at")),
+        )
+        automation._page_text = AsyncMock(return_value="Sorry, the deadline passed for this project")
+
+        with patch("src.browser.computer_use.auto_accept_cookies", AsyncMock(return_value=False)), \
+             patch("src.browser.computer_use.asyncio.sleep", AsyncMock()):
+            success, result = await automation.gemini_computer_use(task="Fill the form", url="https://example.com")
+
+        assert success is False
+        assert result == ["Project blocked: deadline passed"]
+        assert automation.gemini_client.aio.models.generate_content.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_responses_retried_with_backoff(self):
+        """An empty response waits with growing delays before the next attempt"""
+        automation = _gemini_automation(
+            _gemini_response(),
+            _gemini_response(),
+            _gemini_response(SimpleNamespace(function_call=None, text="Done")),
+        )
+        sleep = AsyncMock()
+
+        with patch("src.browser.computer_use.auto_accept_cookies", AsyncMock(return_value=False)), \
+             patch("src.browser.computer_use.asyncio.sleep", sleep), \
+             patch("random.uniform", return_value=0.0):
+            success, _ = await automation.gemini_computer_use(task="Fill the form", url="https://example.com")
+
+        assert success is True
+        assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0]
+
+    def test_old_turn_screenshots_stripped_from_history(self):
+        """Only the most recent function-response turns keep their screenshots"""
+        from google.genai import types
+
+        def turn(name):
+            screenshot = types.FunctionResponsePart(
+                inline_data=types.FunctionResponseBlob(mime_type="image/jpeg", data=b"jpeg")
+            )
+            return types.Content(role="user", parts=[
+                types.Part(function_response=types.FunctionResponse(name=name, response={}, parts=[screenshot])),
+                types.Part(text="verify"),
+            ])
+
+        contents = [types.Content(role="user", parts=[types.Part(text="task")])]
+        for i in range(5):
+            contents.append(types.Content(role="model", parts=[types.Part(text=f"step {i}")]))
+            contents.append(turn(f"click_{i}"))
+
+        BrowserAutomation()._strip_old_gemini_screenshots(contents, turns_to_keep=3)
+
+        responses = [c.parts[0].function_response for c in contents if c.parts[0].function_response]
+        assert [fr.parts is None for fr in responses] == [True, True, False, False, False]
+        assert [fr.name for fr in responses] == [f"click_{i}" for i in range(5)]
@@ -0,0 +1,45 @@
+"""Unit tests for project ID extraction from platform URLs"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.browser.computer_use import extract_project_id_from_url
+
+
+class TestExtractProjectId:
+    """Test query-parameter and path based project ID extraction"""
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://example.com/apply?cpid=123456", "123456"),
+        ("https://example.com/apply?id=9&cpid=42", "42"),
+        ("https://example.com/apply?projectId=a%2Fb", "a/b"),
+        ("https://example.com/apply?utm_source=mail&cpid=&pid=12", "12"),
+        ("https://example.com/apply?myid=3&pid=4", "4"),
+        ("https://example.com/projects/777/form", "777"),
+        ("https://example.com/p/55", "55"),
+        ("https://example.com/opportunity/8?ref=mail", "8"),
+        ("https://example.com/dashboard", None),
+        ("", None),
+        (None, None),
+    ])
+    def test_project_id_patterns(self, url, expected):
+        """Known query parameters win over path patterns, in priority order"""
+        assert extract_project_id_from_url(url) == expected
+
+    def test_repeated_urls_are_memoized(self):
+        """Retries of the same project URL reuse the cached result"""
+        url = "https://example.com/accept/31337"
+        extract_project_id_from_url(url)
+        hits_before = extract_project_id_from_url.cache_info().hits
+
+        assert extract_project_id_from_url(url) == "31337"
+        assert extract_project_id_from_url.cache_info().hits == hits_before + 1
+
+    def test_path_patterns_keep_priority_order(self):
+        """Earlier path patterns win even when a later one matches further left"""
+        assert extract_project_id_from_url("https://example.com/p/1/projects/2") == "2"
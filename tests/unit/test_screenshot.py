@@ -1,9 +1,11 @@
 """Unit tests for screenshot capture and encoding"""
 
+import asyncio
 import base64
 import pytest
 from pathlib import Path
 import sys
+from unittest.mock import AsyncMock, MagicMock
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -105,3 +107,81 @@ class TestScreenshotCapture:
         # Verify
         assert isinstance(b64_screenshot, str)
         assert base64.b64decode(b64_screenshot) == mock_screenshot
+
+    @pytest.mark.asyncio
+    async def test_jpeg_viewport_screenshot_options(self):
+        """Test JPEG screenshots are requested for the viewport only"""
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.screenshot = AsyncMock(return_value=b"\xff\xd8jpeg")
+
+        screenshot = await automation.take_screenshot("jpeg", 70)
+
+        assert screenshot == b"\xff\xd8jpeg"
+        automation.page.screenshot.assert_awaited_once_with(full_page=False, type="jpeg", quality=70)
+
+    @pytest.mark.asyncio
+    async def test_debug_capture_skips_unchanged_screenshot(self, tmp_path, monkeypatch):
+        """Test DEBUG page-state captures write an unchanged screenshot only once"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DEBUG", "true")
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.url = "https://example.com/form"
+        automation.page.screenshot = AsyncMock(return_value=b"\x89PNGsame")
+        automation.page.evaluate = AsyncMock(return_value={})
+        writes = []
+        monkeypatch.setattr(Path, "write_bytes", lambda path, data: writes.append(path))
+
+        first = await automation._capture_page_state()
+        second = await automation._capture_page_state()
+
+        assert first["debug_screenshot"] == second["debug_screenshot"]
+        assert len(writes) == 1
+
+    @pytest.mark.asyncio
+    async def test_page_state_captured_in_one_evaluate(self, monkeypatch):
+        """Test localStorage and success message state come from a single round-trip"""
+        monkeypatch.delenv("DEBUG", raising=False)
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.url = "https://example.com/form"
+        automation.page.evaluate = AsyncMock(return_value={
+            "localStorage": {"login-status": "ok"},
+            "successMessageVisible": True,
+            "successMessageText": "Thanks!",
+        })
+
+        state = await automation._capture_page_state()
+
+        automation.page.evaluate.assert_awaited_once()
+        assert state["localStorage"] == {"login-status": "ok"}
+        assert state["successMessageVisible"] is True
+        assert state["successMessageText"] == "Thanks!"
+        assert automation.last_page_state is state
+
+    @pytest.mark.asyncio
+    async def test_debug_screenshot_overlaps_page_state_read(self, tmp_path, monkeypatch):
+        """Test DEBUG captures read page state while the screenshot is in flight"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DEBUG", "true")
+        evaluate_started = asyncio.Event()
+
+        async def screenshot():
+            await asyncio.wait_for(evaluate_started.wait(), timeout=1)
+            return b"\x89PNG"
+
+        async def evaluate(script):
+            evaluate_started.set()
+            return {"localStorage": {"k": "v"}}
+
+        automation = BrowserAutomation()
+        automation.page = MagicMock()
+        automation.page.url = "https://example.com/form"
+        automation.page.screenshot = AsyncMock(side_effect=screenshot)
+        automation.page.evaluate = AsyncMock(side_effect=evaluate)
+
+        state = await automation._capture_page_state()
+
+        assert state["debug_screenshot"].endswith(".png")
+        assert state["localStorage"] == {"k": "v"}
@@ -0,0 +1,212 @@
+"""Unit tests for the submit_platform_application engine fallback"""
+
+import asyncio
+import time
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.browser import computer_use
+from src.browser.computer_use import FatalSubmissionError, submit_platform_application
+
+URL = "https://example.com/project/1"
+
+
+def _failing_automation(*args, **kwargs) -> MagicMock:
+    """BrowserAutomation stand-in where both engines always fail"""
+    automation = MagicMock()
+    automation.action_log = []
+    automation.gemini_client = object()
+    automation.claude_computer_use = AsyncMock(return_value=(False, []))
+    automation.gemini_computer_use = AsyncMock(return_value=(False, []))
+    return automation
+
+
+class TestGeminiFallbackRetries:
+    """Test backoff between Gemini fallback attempts"""
+
+    @pytest.mark.asyncio
+    async def test_backoff_grows_exponentially_without_trailing_sleep(self):
+        """Waits double between attempts and none follows the last attempt"""
+        sleep = AsyncMock()
+        with patch.object(computer_use, "BrowserAutomation", side_effect=_failing_automation), \
+             patch.object(computer_use.asyncio, "sleep", sleep), \
+             patch("random.uniform", return_value=0.0):
+            result = await submit_platform_application(URL, "task", max_retries=4)
+
+        assert result["success"] is False
+        assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_back_off_in_parallel(self, monkeypatch):
+        """Backoff yields to the event loop, so parallel retries overlap"""
+        monkeypatch.setattr(computer_use, "GEMINI_RETRY_BASE_DELAY", 0.05)
+        monkeypatch.setattr(computer_use, "GEMINI_RETRY_JITTER", 0.01)
+        submissions = 20
+
+        with patch.object(computer_use, "BrowserAutomation", side_effect=_failing_automation):
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                submit_platform_application(URL, "task", max_retries=3) for _ in range(submissions)
+            ))
+            elapsed = time.perf_counter() - started
+
+        # One submission waits ~0.15s; run serially, twenty would take ~3s
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_fatal_error_stops_retries(self):
+        """A FatalSubmissionError ends the Gemini fallback after one attempt, without waiting"""
+        automations = []
+
+        def make_automation(*args, **kwargs):
+            automation = _failing_automation()
+            automation.gemini_computer_use = AsyncMock(side_effect=FatalSubmissionError("401 UNAUTHENTICATED"))
+            automations.append(automation)
+            return automation
+
+        sleep = AsyncMock()
+        with patch.object(computer_use, "BrowserAutomation", side_effect=make_automation), \
+             patch.object(computer_use.asyncio, "sleep", sleep):
+            result = await submit_platform_application(URL, "task", max_retries=3)
+
+        assert result["success"] is False
+        assert "401" in result["error"]
+        automations[0].gemini_computer_use.assert_awaited_once()
+        sleep.assert_not_awaited()
+
+
+class TestParallelEngines:
+    """Test racing Claude and Gemini with the parallel_engines flag"""
+
+    @pytest.mark.asyncio
+    async def test_first_success_wins_and_slower_engine_is_cancelled(self):
+        """A quick Gemini success returns without waiting for Claude"""
+        claude_cancelled = asyncio.Event()
+
+        async def slow_claude(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                claude_cancelled.set()
+                raise
+
+        automations = []
+
+        def make_automation(*args, **kwargs):
+            automation = _failing_automation()
+            automation.claude_computer_use = AsyncMock(side_effect=slow_claude)
+            automation.gemini_computer_use = AsyncMock(return_value=(True, [{"action": "click_at"}]))
+            automations.append(automation)
+            return automation
+
+        with patch.object(computer_use, "BrowserAutomation", side_effect=make_automation):
+            result = await asyncio.wait_for(
+                submit_platform_application(URL, "task", platform_config={"parallel_engines": True}),
+                timeout=2,
+            )
+
+        assert result["success"] is True
+        assert result["method"] == "gemini"
+        assert claude_cancelled.is_set()
+        # Claude and Gemini ran on separate automations (separate browser contexts)
+        assert len(automations) == 2
+        automations[0].gemini_computer_use.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fatal_gemini_error_does_not_cancel_claude(self):
+        """Claude can still win the race after Gemini fails fatally, and Gemini is not retried"""
+        automations = []
+
+        async def slower_claude(**kwargs):
+            await asyncio.sleep(0.05)
+            return True, [{"action": "left_click"}]
+
+        def make_automation(*args, **kwargs):
+            automation = _failing_automation()
+            automation.claude_computer_use = AsyncMock(side_effect=slower_claude)
+            automation.gemini_computer_use = AsyncMock(side_effect=FatalSubmissionError("403 PERMISSION_DENIED"))
+            automations.append(automation)
+            return automation
+
+        with patch.object(computer_use, "BrowserAutomation", side_effect=make_automation):
+            result = await submit_platform_application(URL, "task", platform_config={"parallel_engines": True})
+
+        assert result["method"] == "claude"
+        automations[1].gemini_computer_use.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sequential_fallback_without_flag(self):
+        """Without the flag Gemini only runs after Claude fails"""
+        automations = []
+
+        def make_automation(*args, **kwargs):
+            automation = _failing_automation()
+            automation.gemini_computer_use = AsyncMock(return_value=(True, []))
+            automations.append(automation)
+            return automation
+
+        with patch.object(computer_use, "BrowserAutomation", side_effect=make_automation):
+            result = await submit_platform_application(URL, "task")
+
+        assert result["method"] == "gemini"
+        assert len(automations) == 1
+        automations[0].claude_computer_use.assert_awaited_once()
+
+
+class TestBrowserProfile:
+    """Test how submissions choose the browser profile"""
+
+    @pytest.mark.asyncio
+    async def test_profile_platforms_pass_user_data_dir_to_constructor(self):
+        """uses_browser_profile selects the default profile at construction time"""
+        with patch.object(computer_use, "BrowserAutomation", side_effect=_failing_automation) as factory:
+            await submit_platform_application(
+                URL, "task", max_retries=1, platform_config={"uses_browser_profile": True}
+            )
+
+        user_data_dir = factory.call_args.kwargs["user_data_dir"]
+        assert Path(user_data_dir).parts[-2:] == ("profiles", "default")
+
+    def test_user_data_dir_defaults_to_fresh_context(self):
+        """Automations without a profile start fresh contexts"""
+        assert computer_use.BrowserAutomation().user_data_dir is None
+        assert computer_use.BrowserAutomation(user_data_dir="/tmp/profile").user_data_dir == "/tmp/profile"
+
+
+class TestDebugLogging:
+    """Test that debug-only work is skipped when nothing logs it"""
+
+    @pytest.mark.asyncio
+    async def test_task_not_masked_when_debug_output_is_off(self):
+        """The prompt is only redacted for logging if a debug message is emitted"""
+        mask = MagicMock(return_value="masked")
+        computer_use.logger.disable("src.browser.computer_use")
+        try:
+            with patch.object(computer_use, "BrowserAutomation", side_effect=_failing_automation), \
+                 patch.object(computer_use, "mask_password_in_logs", mask):
+                await submit_platform_application(URL, "password=hunter2", max_retries=1)
+        finally:
+            computer_use.logger.enable("src.browser.computer_use")
+
+        mask.assert_not_called()
+
+
+class TestModuleDefinitions:
+    """Test the shape of the computer_use module"""
+
+    def test_single_submit_platform_application_definition(self):
+        """The module defines submit_platform_application exactly once"""
+        import ast
+
+        tree = ast.parse(Path(computer_use.__file__).read_text())
+        definitions = [
+            node for node in tree.body
+            if isinstance(node, ast.AsyncFunctionDef) and node.name == "submit_platform_application"
+        ]
+        assert len(definitions) == 1